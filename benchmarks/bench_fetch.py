@@ -0,0 +1,78 @@
+# benchmarks/bench_fetch.py
+from __future__ import annotations
+from pathlib import Path
+import sys
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+# path shim so we can run without pip install -e .
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from nfl_lines.io.fetch_api_sports import APISportsError, get_games_by_date
+from mock_api import Faults, MockAPIServer
+
+
+def season_dates(season: int) -> list[str]:
+    """Every day from early September to mid-February: what a full-season backfill requests."""
+    d0 = date(season, 9, 1)
+    return [(d0 + timedelta(days=i)).isoformat() for i in range((date(season + 1, 2, 15) - d0).days)]
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Fetch-path throughput against the local mock API.")
+    ap.add_argument("--season", type=int, default=2023)
+    ap.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16], help="Thread pool sizes to try")
+    ap.add_argument("--latency-ms", type=float, default=50.0)
+    ap.add_argument("--jitter-ms", type=float, default=10.0)
+    ap.add_argument("--p429", type=float, default=0.0)
+    ap.add_argument("--retry-after", type=float, default=0.2)
+    ap.add_argument("--rate-limit", type=float, default=0.0)
+    ap.add_argument("--p5xx", type=float, default=0.0)
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--json", action="store_true")
+    args = ap.parse_args()
+
+    dates = season_dates(args.season)
+    rows = []
+    for workers in args.workers:
+        faults = Faults(args.latency_ms, args.jitter_ms, args.p429, args.retry_after, args.rate_limit,
+                        args.p5xx, seed=args.seed)
+        with MockAPIServer(faults) as srv:
+            def fetch(d: str):
+                try:
+                    return len(get_games_by_date(d, league_id=1, season=args.season, api_key="bench", base_url=srv.base_url))
+                except APISportsError:
+                    return None
+
+            t0 = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(fetch, dates))
+            wall = time.perf_counter() - t0
+            stats = srv.stats
+        rows.append({
+            "workers": workers,
+            "dates": len(dates),
+            "games": sum(r for r in results if r is not None),
+            "failed_dates": sum(r is None for r in results),
+            "requests": sum(stats.values()),
+            "status": stats,
+            "wall_s": round(wall, 3),
+            "dates_per_s": round(len(dates) / wall, 1),
+        })
+
+    if args.json:
+        print(json.dumps(rows, indent=1))
+        return
+    for r in rows:
+        print(f"workers={r['workers']:<3} {r['dates']} dates in {r['wall_s']:.2f}s ({r['dates_per_s']}/s), "
+              f"{r['requests']} requests, {r['failed_dates']} failed, status={r['status']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# benchmarks/bench_long_memory.py
+from __future__ import annotations
+from pathlib import Path
+import sys
+import argparse
+import json
+import tempfile
+
+# path shim so we can run without pip install -e .
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pandas as pd
+
+from nfl_model.io.long_builder import build_team_perspective_long
+from generators import write_synthetic_cache
+
+
+def footprint(df: pd.DataFrame) -> dict[str, int]:
+    return {c: int(n) for c, n in df.memory_usage(deep=True, index=False).items()}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Memory footprint of the long table: default vs compact dtypes.")
+    ap.add_argument("--seasons", type=int, default=25, help="Synthetic seasons to generate")
+    ap.add_argument("--json", action="store_true", help="Print the result as JSON")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        write_synthetic_cache(Path(tmp), args.seasons)
+        default = footprint(build_team_perspective_long(tmp))
+        compact = footprint(build_team_perspective_long(tmp, compact=True))
+
+    result = {
+        "seasons": args.seasons,
+        "default_bytes": sum(default.values()),
+        "compact_bytes": sum(compact.values()),
+        "columns": {c: {"default": default[c], "compact": compact[c]} for c in default},
+    }
+    result["ratio"] = round(result["default_bytes"] / max(result["compact_bytes"], 1), 2)
+    if args.json:
+        print(json.dumps(result, indent=1))
+        return
+    print(f"{'column':<16}{'default':>14}{'compact':>14}")
+    for c, v in result["columns"].items():
+        print(f"{c:<16}{v['default']:>14,}{v['compact']:>14,}")
+    print(f"{'total':<16}{result['default_bytes']:>14,}{result['compact_bytes']:>14,}  ({result['ratio']}x smaller)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# benchmarks/generators.py
+from __future__ import annotations
+from pathlib import Path
+import sys
+
+# path shim so we can run without pip install -e .
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pandas as pd
+
+from nfl_model.pricing.odds import american_odds_from_probs, norm_cdf
+from nfl_model.teams import TEAMS
+
+# Deterministic synthetic inputs for the benchmarks: same seed, same data, on any machine.
+
+ABBRS = np.array(list(TEAMS), dtype=object)
+NAMES = np.array(list(TEAMS.values()), dtype=object)
+FIRST_KICKOFF = 1694132400  # 2023-09-08 00:20 UTC
+
+
+def ratings_frame(seed: int = 0) -> pd.DataFrame:
+    """One ratings row per franchise, columns as in examples/ratings.csv."""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "team": ABBRS,
+        "power": rng.normal(0.0, 4.0, len(ABBRS)).round(2),
+        "off": rng.normal(0.0, 3.0, len(ABBRS)).round(2),
+        "def": rng.normal(0.0, 3.0, len(ABBRS)).round(2),
+        "qb_points": rng.normal(0.0, 1.0, len(ABBRS)).round(2),
+    })
+
+
+def schedule_frame(n_games: int, seed: int = 0, first_season: int = 2000) -> pd.DataFrame:
+    """
+    `n_games` games as in examples/schedule.csv: 16 per week, 18 weeks per season,
+    each week a random pairing of all 32 teams.
+    """
+    rng = np.random.default_rng(seed)
+    weeks = -(-n_games // 16)
+    order = np.argsort(rng.random((weeks, 32)), axis=1)
+    teams = ABBRS[order].reshape(weeks, 16, 2)
+    wk = np.repeat(np.arange(weeks), 16)
+    season = first_season + wk // 18
+    week = wk % 18 + 1
+    date = pd.to_datetime(season.astype(str) + "-09-07") + pd.to_timedelta(7 * (week - 1), unit="D")
+    df = pd.DataFrame({
+        "week": week,
+        "date": date.strftime("%Y-%m-%d"),
+        "away": teams[:, :, 0].ravel(),
+        "home": teams[:, :, 1].ravel(),
+        "neutral": (rng.random(weeks * 16) < 0.02).astype(int),
+    })
+    return df.iloc[:n_games].reset_index(drop=True)
+
+
+def api_payload(n_games: int, seed: int = 0) -> list[dict]:
+    """API-Sports '/games' response items for `n_games` finished games (clean shapes)."""
+    rng = np.random.default_rng(seed)
+    home = rng.integers(0, 32, n_games)
+    away = (home + rng.integers(1, 32, n_games)) % 32
+    ts = FIRST_KICKOFF + rng.integers(0, 86400 * 120, n_games)
+    pts = rng.integers(0, 45, (n_games, 2))
+    return [
+        {
+            "game": {"id": i, "date": {"timestamp": int(ts[i])}, "status": {"short": "FT"}},
+            "teams": {"home": {"name": NAMES[home[i]]}, "away": {"name": NAMES[away[i]]}},
+            "scores": {"home": {"total": int(pts[i, 0])}, "away": {"total": int(pts[i, 1])}},
+        }
+        for i in range(n_games)
+    ]
+
+
+def write_synthetic_cache(root: Path, seasons: int, first_season: int = 2000, seed: int = 0) -> None:
+    """
+    Weekly '{season}_wk{week}.parquet' files: 16 games a week for 18 weeks per season, full
+    team names, every game of a week dated like schedule_frame's.
+    """
+    rng = np.random.default_rng(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    for s in range(first_season, first_season + seasons):
+        for w in range(1, 19):
+            teams = rng.permutation(NAMES)
+            df = pd.DataFrame({
+                "date": (pd.Timestamp(f"{s}-09-07") + pd.Timedelta(days=7 * (w - 1))).strftime("%Y-%m-%d"),
+                "season": s,
+                "week": w,
+                "home": teams[::2],
+                "away": teams[1::2],
+                "home_points": rng.integers(0, 45, 16),
+                "away_points": rng.integers(0, 45, 16),
+                "neutral": rng.random(16) < 0.02,
+            })
+            for c in ("season", "week", "home_points", "away_points"):
+                df[c] = df[c].astype("Int64")
+            df.to_parquet(root / f"{s}_wk{w}.parquet", index=False)
+
+
+def odds_ticks(schedule: pd.DataFrame, ticks_per_game: int, books: int = 8, seed: int = 0) -> pd.DataFrame:
+    """
+    Odds ticks for every game of a schedule_frame: `ticks_per_game` quotes spread over the
+    week before each game, round-robin across markets and `books` books, lines drifting
+    around a per-game opener.
+    """
+    rng = np.random.default_rng(seed)
+    g = np.repeat(np.arange(len(schedule)), ticks_per_game)
+    n = len(g)
+    kickoff = (pd.to_datetime(schedule["date"]) + pd.Timedelta(hours=17)).to_numpy("datetime64[ns]")
+    ts = kickoff[g] - (rng.random(n) * 7 * 86400e9).astype("timedelta64[ns]")
+    market = np.array(["spread", "total", "moneyline"])[np.arange(n) % 3]
+    opener = rng.normal(0, 6, len(schedule)).round() / 2
+    drift = (rng.normal(0, 1, n)).round() / 2
+    spread = opener[g] + drift
+    total = 44 + opener[g] + drift
+    p_home = norm_cdf(-spread / 13.45)
+    ml_home = american_odds_from_probs(p_home * 1.025)
+    ml_away = american_odds_from_probs((1 - p_home) * 1.025)
+    line = np.where(market == "spread", spread, np.where(market == "total", total, np.nan))
+    price_a = np.where(market == "moneyline", ml_home, -110 + 5 * rng.integers(-2, 3, n))
+    price_b = np.where(market == "moneyline", ml_away, -110 + 5 * rng.integers(-2, 3, n))
+    return pd.DataFrame({
+        "ts": pd.DatetimeIndex(ts).tz_localize("UTC"),
+        "book": np.array([f"book{i}" for i in range(books)], dtype=object)[rng.integers(0, books, n)],
+        "date": schedule["date"].to_numpy()[g],
+        "home": schedule["home"].to_numpy()[g],
+        "away": schedule["away"].to_numpy()[g],
+        "market": market,
+        "line": line,
+        "price_a": price_a,
+        "price_b": price_b,
+    })
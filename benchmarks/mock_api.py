@@ -0,0 +1,266 @@
+# benchmarks/mock_api.py
+from __future__ import annotations
+from pathlib import Path
+import sys
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+from urllib.parse import parse_qs, urlparse
+
+# path shim so we can run without pip install -e .
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+from generators import NAMES
+
+# Local stand-in for the API-Sports '/games' endpoint. Point the fetchers at it with
+#
+#   API_SPORTS_BASE_URL=http://127.0.0.1:8765 API_SPORTS_KEY=test python scripts/cache_tool.py ...
+#
+# Games come from recorded payloads (--replay, indexed by UTC kickoff date) or are
+# synthesized per date (same date -> same games). Faults are drawn from a seeded RNG,
+# so a run with the same request sequence sees the same latencies and errors.
+# GET /_stats returns request counts by status.
+
+
+@dataclass
+class Faults:
+    latency_ms: float = 0.0        # added to every response
+    jitter_ms: float = 0.0         # uniform +/- on top of latency
+    p429: float = 0.0              # random 429s
+    retry_after: float = 1.0       # Retry-After seconds sent with 429s
+    rate_limit: float = 0.0        # requests/second before 429s (token bucket, 0 = off)
+    p5xx: float = 0.0              # random 500/502
+    ptimeout: float = 0.0          # hang for `hang_s` then drop the connection
+    hang_s: float = 30.0
+    seed: int = 0
+
+
+@dataclass
+class MockState:
+    faults: Faults
+    replay: dict[str, list[dict]] = field(default_factory=dict)
+    stats: Counter = field(default_factory=Counter)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    rng: random.Random = field(init=False)
+    tokens: float = field(init=False)
+    last_refill: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self):
+        self.rng = random.Random(self.faults.seed)
+        self.tokens = self.faults.rate_limit
+
+    def draw(self) -> tuple[float, float]:
+        """(latency seconds, uniform draw for fault selection), from the shared seeded RNG."""
+        with self.lock:
+            jitter = self.rng.uniform(-self.faults.jitter_ms, self.faults.jitter_ms)
+            return max(0.0, self.faults.latency_ms + jitter) / 1000.0, self.rng.random()
+
+    def take_token(self) -> bool:
+        if self.faults.rate_limit <= 0:
+            return True
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.faults.rate_limit, self.tokens + (now - self.last_refill) * self.faults.rate_limit)
+            self.last_refill = now
+            if self.tokens >= 1.0:
+                self.tokens -= 1.0
+                return True
+            return False
+
+    def count(self, key: str) -> None:
+        with self.lock:
+            self.stats[key] += 1
+
+
+def load_replay(paths: list[Path]) -> dict[str, list[dict]]:
+    """{UTC date: [game, ...]} from recorded payload files ({'response': [...]} or a bare list)."""
+    by_date: dict[str, list[dict]] = {}
+    for p in paths:
+        for f in (sorted(p.glob("*.json")) if p.is_dir() else [p]):
+            data = json.loads(f.read_text())
+            games = data.get("response", []) if isinstance(data, dict) else data
+            for g in games:
+                ts = ((g.get("game") or {}).get("date") or {}).get("timestamp")
+                if ts is None:
+                    continue
+                d = datetime.fromtimestamp(int(ts), timezone.utc).date().isoformat()
+                by_date.setdefault(d, []).append(g)
+    return by_date
+
+
+def synthetic_games(date_str: str, season: Optional[int]) -> list[dict]:
+    """
+    Games for one UTC date, seeded by the date: Sunday slates of 10-13 games, one game
+    on Thursdays and Mondays (late-night UTC kickoffs), nothing otherwise or off-season.
+    """
+    d = date.fromisoformat(date_str)
+    if d.month in (3, 4, 5, 6, 7, 8):
+        return []
+    n = {6: 12, 3: 1, 0: 1}.get(d.weekday(), 0)   # Sun, Thu, Mon (UTC)
+    if not n:
+        return []
+    rng = random.Random(int(hashlib.sha256(date_str.encode()).hexdigest()[:12], 16))
+    n += rng.randint(-2, 1) if n > 1 else 0
+    teams = list(NAMES)
+    rng.shuffle(teams)
+    base = int(datetime(d.year, d.month, d.day, 17, 0, tzinfo=timezone.utc).timestamp())
+    games = []
+    for i in range(n):
+        gid = int(hashlib.sha256(f"{date_str}:{i}".encode()).hexdigest()[:8], 16)
+        games.append({
+            "game": {
+                "id": gid,
+                "stage": "Regular Season",
+                "date": {"timezone": "UTC", "date": date_str, "timestamp": base + (i % 3) * 3 * 3600},
+                "status": {"short": "FT", "long": "Finished"},
+            },
+            "league": {"id": 1, "name": "NFL", "season": str(season or (d.year if d.month >= 3 else d.year - 1))},
+            "teams": {"home": {"id": 2 * i, "name": teams[2 * i]}, "away": {"id": 2 * i + 1, "name": teams[2 * i + 1]}},
+            "scores": {"home": {"total": rng.randint(3, 42)}, "away": {"total": rng.randint(3, 42)}},
+        })
+    return games
+
+
+def make_handler(state: MockState):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, fmt, *args):  # keep load tests quiet
+            pass
+
+        def _send(self, status: int, body: dict, headers: Optional[dict] = None) -> None:
+            payload = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for k, v in (headers or {}).items():
+                self.send_header(k, v)
+            self.end_headers()
+            self.wfile.write(payload)
+            state.count(str(status))
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == "/_stats":
+                with state.lock:
+                    snapshot = dict(state.stats)
+                return self._send(200, snapshot)
+            if url.path != "/games":
+                return self._send(404, {"errors": {"endpoint": "This endpoint does not exist."}, "response": []})
+
+            f = state.faults
+            latency, u = state.draw()
+            if latency:
+                time.sleep(latency)
+            if not state.take_token():
+                return self._send(429, {"errors": {"rateLimit": "Too many requests."}, "response": []},
+                                  {"Retry-After": f"{f.retry_after:g}"})
+            if u < f.ptimeout:
+                state.count("timeout")
+                time.sleep(f.hang_s)
+                self.close_connection = True
+                return
+            u -= f.ptimeout
+            if u < f.p429:
+                return self._send(429, {"errors": {"rateLimit": "Too many requests."}, "response": []},
+                                  {"Retry-After": f"{f.retry_after:g}"})
+            u -= f.p429
+            if u < f.p5xx:
+                return self._send(500 + 2 * int(u / f.p5xx * 2), {"message": "upstream error"})
+
+            if not self.headers.get("x-apisports-key"):
+                return self._send(200, {"errors": {"token": "Missing application key."}, "results": 0, "response": []})
+            q = {k: v[0] for k, v in parse_qs(url.query).items()}
+            day = q.get("date")
+            if not day:
+                return self._send(200, {"errors": {"date": "The date field is required."}, "results": 0, "response": []})
+            season = int(q["season"]) if q.get("season") else None
+            games = state.replay.get(day, []) if state.replay else synthetic_games(day, season)
+            self._send(200, {"get": "games", "parameters": q, "errors": [], "results": len(games), "response": games})
+
+    return Handler
+
+
+class MockAPIServer:
+    """
+    In-process server on a background thread:
+
+        with MockAPIServer(Faults(p429=0.1)) as srv:
+            get_games_by_date("2023-09-10", league_id=1, base_url=srv.base_url, api_key="x")
+    """
+
+    def __init__(self, faults: Faults = Faults(), replay: Optional[dict] = None, host: str = "127.0.0.1", port: int = 0):
+        self.state = MockState(faults, replay or {})
+        self.httpd = ThreadingHTTPServer((host, port), make_handler(self.state))
+        self.httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def stats(self) -> dict:
+        with self.state.lock:
+            return dict(self.state.stats)
+
+    def start(self) -> "MockAPIServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "MockAPIServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Local stand-in for the API-Sports /games endpoint.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--replay", nargs="*", type=Path, help="Recorded payload files/dirs to serve instead of synthetic games")
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--p429", type=float, default=0.0, help="Probability of a random 429")
+    ap.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds on 429s")
+    ap.add_argument("--rate-limit", type=float, default=0.0, help="Requests/second before 429s (0 = unlimited)")
+    ap.add_argument("--p5xx", type=float, default=0.0, help="Probability of a 500/502")
+    ap.add_argument("--ptimeout", type=float, default=0.0, help="Probability of hanging past the client timeout")
+    ap.add_argument("--hang", type=float, default=30.0, help="Seconds a 'timeout' request hangs")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args()
+
+    faults = Faults(args.latency_ms, args.jitter_ms, args.p429, args.retry_after, args.rate_limit,
+                    args.p5xx, args.ptimeout, args.hang, args.seed)
+    replay = load_replay(args.replay) if args.replay else None
+    srv = MockAPIServer(faults, replay, args.host, args.port)
+    print(f"Serving /games on {srv.base_url} ({'replay' if replay else 'synthetic'}); export API_SPORTS_BASE_URL={srv.base_url}")
+    try:
+        srv.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        srv.httpd.server_close()
+        print(json.dumps(srv.stats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,344 @@
+# benchmarks/run.py
+from __future__ import annotations
+from pathlib import Path
+import sys
+import argparse
+import json
+import platform
+import statistics
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict
+
+# path shim so we can run without pip install -e .
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pandas as pd
+
+from nfl_model.config import Params, PipelineConfig
+from nfl_model.engine import Engine
+from nfl_model.cli.nfl_lines import _merge
+from nfl_model.io.loaders import load_ratings, load_schedule
+from nfl_model.io.long_builder import build_team_perspective_long
+from nfl_model.io.odds_store import normalize_ticks
+from nfl_model.io.ratings_store import RatingsStore
+from nfl_model.pricing.greeks import price_greeks
+from nfl_model.pricing.joint import JointModel
+from nfl_model.pricing.margins import build_margin_table
+from nfl_model.pricing.market import market_edges
+from nfl_model.pricing.odds import american_odds_from_prob, norm_cdf, win_prob_from_spread
+from nfl_model.schemas import LineOutput
+from nfl_model.teams import resolve_teams
+from nfl_model.travel import schedule_features
+from nfl_model.validation import validate_frame
+from nfl_lines.io.normalize import normalize_games, normalize_schedule
+from nfl_lines.utils.read_cache import ReadCache
+from generators import api_payload, odds_ticks, ratings_frame, schedule_frame, write_synthetic_cache
+
+# Offline benchmark suite. Each case builds its inputs once (untimed) and returns the
+# callable to time. Results are keyed by case name; --save writes them as the
+# baseline, --compare fails (exit 1) when a case's best time regresses past
+# --threshold relative to the baseline.
+
+BASELINES = Path(__file__).with_name("baselines.json")
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    setup: Callable[[argparse.Namespace, Path], Callable[[], object]]
+    repeat: int = 5
+
+
+CASES: Dict[str, Case] = {}
+
+
+def bench(name: str, repeat: int = 5):
+    def _wrap(fn):
+        CASES[name] = Case(name, fn, repeat)
+        return fn
+    return _wrap
+
+
+def _engine() -> Engine:
+    return Engine(Params(), PipelineConfig())
+
+
+def _merged(n_games: int) -> pd.DataFrame:
+    ratings = ratings_frame()
+    ratings["team_key"] = ratings["team"]
+    sched = schedule_frame(n_games)
+    sched["home_key"], sched["away_key"] = sched["home"], sched["away"]
+    return _merge(sched, ratings)
+
+
+@bench("engine_price_slate", repeat=20)
+def _(args, tmp):
+    eng, merged = _engine(), _merged(16)
+    return lambda: eng.price(merged)
+
+
+@bench("engine_price_bulk", repeat=3)
+def _(args, tmp):
+    eng, merged = _engine(), _merged(args.bulk_rows)
+    return lambda: eng.price(merged)
+
+
+@bench("engine_price_schedule_bulk", repeat=3)
+def _(args, tmp):
+    # engine_price_bulk with rest/travel/timezone factors on: adds schedule_features per call
+    pipe = PipelineConfig(spread_factors=PipelineConfig().spread_factors + ["rest_days", "travel", "timezone_shift"])
+    eng, merged = Engine(Params(), pipe), _merged(args.bulk_rows)
+    return lambda: eng.price(merged)
+
+
+@bench("schedule_features_bulk")
+def _(args, tmp):
+    sched = schedule_frame(args.bulk_rows * 10)
+    return lambda: schedule_features(sched)
+
+
+@bench("price_greeks_bulk")
+def _(args, tmp):
+    # closed-form greeks for priced lines: one vectorized pass, vs. one Engine.price per bumped input
+    rng = np.random.default_rng(0)
+    n = args.bulk_rows * 10
+    spread, total = rng.normal(0, 6, n).round(2), rng.normal(44, 6, n).round(1)
+    neutral = (rng.random(n) < 0.02).astype(int)
+    p = 0.5 * (1 + np.tanh(spread / 16.9))     # stands in for the priced home_win_prob
+    return lambda: price_greeks(spread, total, neutral, Params(), PipelineConfig(), home_win_prob=p)
+
+
+@bench("merge_bulk")
+def _(args, tmp):
+    ratings = ratings_frame()
+    ratings["team_key"] = ratings["team"]
+    sched = schedule_frame(args.bulk_rows)
+    sched["home_key"], sched["away_key"] = sched["home"], sched["away"]
+    return lambda: _merge(sched, ratings)
+
+
+@bench("load_ratings", repeat=20)
+def _(args, tmp):
+    p = tmp / "ratings.csv"
+    ratings_frame().to_csv(p, index=False)
+    return lambda: load_ratings(p)
+
+
+@bench("load_schedule_bulk")
+def _(args, tmp):
+    p = tmp / "schedule.csv"
+    schedule_frame(args.bulk_rows).to_csv(p, index=False)
+    return lambda: load_schedule(p)
+
+
+@bench("normalize_games")
+def _(args, tmp):
+    raw = api_payload(args.payload_games)
+    return lambda: normalize_games(2023, 1, raw)
+
+
+@bench("normalize_schedule")
+def _(args, tmp):
+    raw = api_payload(args.payload_games)
+    return lambda: normalize_schedule(2023, 1, raw)
+
+
+@bench("long_builder_20_seasons")
+def _(args, tmp):
+    root = tmp / "cache"
+    write_synthetic_cache(root, 20)
+    return lambda: build_team_perspective_long(root)
+
+
+@bench("read_cache_history", repeat=20)
+def _(args, tmp):
+    # 20 seasons of weekly files loaded again in the same process (warm-up is the first read)
+    root = tmp / "cache"
+    write_synthetic_cache(root, 20)
+    files = sorted(root.rglob("*_wk*.parquet"))
+    cache = ReadCache(512 << 20)
+    return lambda: cache.read_many(files)
+
+
+@bench("odds_scalar", repeat=10)
+def _(args, tmp):
+    spreads = np.random.default_rng(0).normal(0, 7, args.bulk_rows).tolist()
+    return lambda: [american_odds_from_prob(win_prob_from_spread(s)) for s in spreads]
+
+
+@bench("market_edges", repeat=3)
+def _(args, tmp):
+    sched = schedule_frame(544, first_season=2022)  # two seasons
+    sched["home_key"], sched["away_key"] = sched["home"], sched["away"]
+    ratings = ratings_frame()
+    ratings["team_key"] = ratings["team"]
+    lines = _engine().price(_merge(sched, ratings))
+    ticks = normalize_ticks(odds_ticks(sched, -(-args.bulk_rows * 10 // len(sched))))
+    return lambda: market_edges(lines, ticks)
+
+
+@bench("norm_cdf_bulk", repeat=10)
+def _(args, tmp):
+    # the normal CDF under market_edges, margin tables, joint pricing and greeks
+    z = np.random.default_rng(0).normal(0, 1, args.bulk_rows * 20)
+    return lambda: norm_cdf(z)
+
+
+@bench("key_number_lookup", repeat=10)
+def _(args, tmp):
+    rng = np.random.default_rng(0)
+    table = build_margin_table(np.rint(rng.normal(2, 13.5, 5000)).astype(int))
+    mu = rng.normal(0, 7, args.bulk_rows * 10)
+    line = np.round(rng.normal(0, 7, args.bulk_rows * 10) * 2) / 2
+    return lambda: table.cover_push_loss(mu, line)
+
+
+@bench("same_game_slate", repeat=20)
+def _(args, tmp):
+    # one 16-game week: four spread x total combos plus 21-rung team-total ladders per side
+    rng = np.random.default_rng(0)
+    model = JointModel(13.45, 10.0, 0.1)
+    mu, total = rng.normal(0, 6, 16), rng.normal(44, 4, 16)
+    line, ou = -np.round(mu * 2) / 2, np.round(total * 2) / 2
+    rungs = np.arange(10.5, 31.5)
+
+    def run():
+        model.combos(mu, total, line, ou)
+        model.team_total_ladder(mu, total, rungs, "home")
+        model.team_total_ladder(mu, total, rungs, "away")
+    return run
+
+
+@bench("resolve_teams_bulk")
+def _(args, tmp):
+    # abbreviations, full names and historical names mixed, as in cache + ratings joins
+    names = np.concatenate([ratings_frame()["team"].to_numpy(dtype=object),
+                            schedule_frame(64, first_season=2010)["home"].to_numpy(dtype=object),
+                            np.array(["Oakland Raiders", "St. Louis Rams", "OAK", "SD"], dtype=object)])
+    values = pd.Series(names[np.random.default_rng(0).integers(0, len(names), args.bulk_rows * 10)], dtype="str")
+    return lambda: resolve_teams(values)
+
+
+@bench("ratings_store_asof", repeat=10)
+def _(args, tmp):
+    # ten seasons of weekly versions (plus a mid-week update each week), compacted; time
+    # a fresh load, then 1000 as-of-time lookups and views, as a backtest would
+    ratings = ratings_frame()
+    store = RatingsStore(tmp / "ratings")
+    rng = np.random.default_rng(0)
+    for season in range(2015, 2025):
+        for week in range(1, 19):
+            for hours in (0, 72):
+                ts = pd.Timestamp(f"{season}-09-05", tz="UTC") + pd.Timedelta(days=7 * (week - 1), hours=hours)
+                store.append(ratings.assign(power=rng.normal(0, 4, len(ratings))), season, week, ts=ts)
+    store.compact()
+    t0, t1 = pd.Timestamp("2015-09-06").value, pd.Timestamp("2025-01-01").value
+    when = pd.to_datetime(rng.integers(t0, t1, 1000))
+
+    def run():
+        fresh = RatingsStore(tmp / "ratings")
+        return [fresh.view(fresh.version_at(ts)) for ts in when]
+    return run
+
+
+@bench("validate_lines_bulk")
+def _(args, tmp):
+    rng = np.random.default_rng(0)
+    lines = schedule_frame(args.bulk_rows * 10)
+    n = len(lines)
+    spread = rng.normal(0, 6, n).round(2)
+    p = np.array([win_prob_from_spread(s) for s in spread[:1000]])[np.arange(n) % 1000]
+    lines["model_spread_home"], lines["model_total"] = spread, 44.0
+    lines["home_team_total"], lines["away_team_total"] = 22.0 + spread / 2, 22.0 - spread / 2
+    lines["home_win_prob"], lines["away_win_prob"] = p, 1 - p
+    lines["ml_home"] = np.where(p >= 0.5, -150, 130)
+    lines["ml_away"] = np.where(p >= 0.5, 130, -150)
+    return lambda: validate_frame(lines, LineOutput)
+
+
+def time_case(case: Case, args: argparse.Namespace) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        fn = case.setup(args, Path(tmp))
+        fn()  # warm-up: imports, caches, first-touch allocation
+        times = []
+        for _ in range(max(1, case.repeat if not args.repeat else args.repeat)):
+            t0 = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - t0)
+    return {"best_s": min(times), "median_s": statistics.median(times), "runs": len(times)}
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    """Names of cases whose best time exceeds baseline * (1 + threshold)."""
+    failed = []
+    for name, r in results.items():
+        b = baseline.get("results", {}).get(name)
+        if b is None:
+            print(f"  {name:<26} (no baseline)")
+            continue
+        ratio = r["best_s"] / b["best_s"] if b["best_s"] else float("inf")
+        flag = "REGRESSED" if ratio > 1 + threshold else ("faster" if ratio < 1 - threshold else "ok")
+        print(f"  {name:<26} {b['best_s'] * 1e3:>10.2f}ms -> {r['best_s'] * 1e3:>10.2f}ms  x{ratio:5.2f}  {flag}")
+        if flag == "REGRESSED":
+            failed.append(name)
+    return failed
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Offline benchmarks on deterministic synthetic data.")
+    ap.add_argument("--only", nargs="*", help="Run only cases whose name contains one of these")
+    ap.add_argument("--list", action="store_true", help="List cases and exit")
+    ap.add_argument("--bulk-rows", type=int, default=100_000, help="Rows for the bulk cases (1e5 default; 1e6/1e7 for big runs)")
+    ap.add_argument("--payload-games", type=int, default=20_000, help="Games in the synthetic API payload")
+    ap.add_argument("--repeat", type=int, help="Override every case's repeat count")
+    ap.add_argument("--save", nargs="?", const=BASELINES, type=Path, help=f"Write results as the baseline (default {BASELINES.name})")
+    ap.add_argument("--compare", nargs="?", const=BASELINES, type=Path, help="Compare against a baseline; exit 1 on regression")
+    ap.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown vs baseline before failing (0.25 = 25%%)")
+    ap.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = ap.parse_args()
+
+    if args.list:
+        print("\n".join(CASES))
+        return
+    cases = [c for c in CASES.values() if not args.only or any(o in c.name for o in args.only)]
+
+    results = {}
+    for case in cases:
+        results[case.name] = time_case(case, args)
+        if not args.json:
+            r = results[case.name]
+            print(f"{case.name:<28} best {r['best_s'] * 1e3:>10.2f}ms  median {r['median_s'] * 1e3:>10.2f}ms  ({r['runs']} runs)")
+
+    payload = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "bulk_rows": args.bulk_rows,
+        "payload_games": args.payload_games,
+        "results": results,
+    }
+    if args.json:
+        print(json.dumps(payload, indent=1))
+    if args.save:
+        args.save.write_text(json.dumps(payload, indent=1) + "\n")
+        print(f"[wrote] {args.save}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        if (baseline.get("bulk_rows"), baseline.get("payload_games")) != (args.bulk_rows, args.payload_games):
+            print("!! baseline was recorded with different sizes; comparison is not like-for-like")
+        failed = compare(results, baseline, args.threshold)
+        if failed:
+            print(f"FAIL: {len(failed)} case(s) regressed more than {args.threshold:.0%}: {', '.join(failed)}")
+            sys.exit(1)
+        print("OK: no regressions")
+
+
+if __name__ == "__main__":
+    main()
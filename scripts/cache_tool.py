@@ -11,9 +11,15 @@ SRC = ROOT / "src"
 if str(SRC) not in sys.path:
     sys.path.insert(0, str(SRC))
 
-from nfl_lines.utils.config import CACHE_DIR, API_SPORTS_KEY, LEAGUE_ID
+from nfl_model import profiling
+from nfl_lines.utils import profiling as lines_profiling
+from nfl_lines.utils.config import CACHE_DIR, API_SPORTS_KEY, LEAGUE_ID, CACHE_LAYOUT, DATASET_DIR
+from nfl_lines.utils.dataset import compact, week_files
+from nfl_lines.utils.manifest import load_manifest, manifest_path, rebuild_manifest, stale_weeks, verify
 from nfl_lines.schedule.week_windows import WEEK1_THURSDAY, week_range, REGULAR_SEASON_WEEKS
 from nfl_lines.io.loader_v0 import get_week, _cache_path
+from nfl_lines.io.live_poll import LivePoller
+from nfl_lines.utils.read_cache import bypass, read_parquet
 
 CURRENT_SEASON_DEFAULT = max(WEEK1_THURSDAY)  # latest season you have an anchor for
 
@@ -35,9 +41,12 @@ def ensure_week(season: int, week: int, *, refresh: bool) -> int:
     """Return rows written/loaded; refresh=True forces re-pull."""
     p = _cache_path(season, week)
     if p.exists() and not refresh:
-        # no API call; read just to report size
-        import pandas as pd
-        n = len(pd.read_parquet(p))
+        # no API call; row count comes from the manifest when the week is indexed
+        entry = load_manifest().get((season, week))
+        if entry is not None:
+            n = entry.rows
+        else:
+            n = len(read_parquet(p))
         print(f"  ✓ {p.name} (exists, {n} rows)")
         return n
     df = get_week(season, week, force_refresh=refresh,
@@ -55,8 +64,9 @@ def cmd_update(args: argparse.Namespace) -> None:
         print(f"No completed weeks yet for {season} (or no anchor).")
         return
     print(f"== Update {season} up to week {last_done} ==")
+    stale = set(stale_weeks(load_manifest(), season, range(1, last_done + 1))) if args.stale else set()
     for wk in range(1, last_done + 1):
-        ensure_week(season, wk, refresh=args.refresh)
+        ensure_week(season, wk, refresh=args.refresh or wk in stale)
 
 def cmd_backfill(args: argparse.Namespace) -> None:
     seasons = args.seasons
@@ -74,40 +84,79 @@ def cmd_refresh(args: argparse.Namespace) -> None:
     ensure_week(args.season, args.week, refresh=True)
 
 def cmd_status(args: argparse.Namespace) -> None:
-    from collections import defaultdict
-    import pandas as pd
     print(f"Using cache dir: {CACHE_DIR}")
-    counts = defaultdict(int)
-    sizes = {}
-    for f in sorted(Path(CACHE_DIR).glob("*.parquet")):
-        try:
-            df = pd.read_parquet(f, columns=["season","week"])
-            if len(df):
-                s = int(df["season"].iloc[0])
-                w = int(df["week"].iloc[0])
-                counts[(s,w)] = len(df)
-                sizes[(s,w)] = f.stat().st_size
-        except Exception:
-            pass
-    if not counts:
-        print("No parquet files found.")
+    entries = load_manifest()
+    if not entries:
+        if week_files(CACHE_DIR):
+            print("No manifest yet. Run `cache_tool rebuild-manifest` to index the existing files.")
+        else:
+            print("No parquet files found.")
         return
     by_season = {}
-    for (s,w), n in counts.items():
-        by_season.setdefault(s, []).append((w, n))
+    for (s, w), e in entries.items():
+        by_season.setdefault(s, []).append(e)
     for s in sorted(by_season):
-        ws = sorted(by_season[s], key=lambda x: x[0])
-        have = [w for w,_ in ws]
-        print(f"Season {s}: weeks present = {have[:10]}{'...' if len(have)>10 else ''}  total_files={len(ws)}")
+        es = sorted(by_season[s], key=lambda e: e.week)
+        have = [e.week for e in es]
+        open_weeks = [e.week for e in es if not e.final]
+        rows = sum(e.rows for e in es)
+        print(f"Season {s}: weeks present = {have[:10]}{'...' if len(have)>10 else ''}  total_files={len(es)}"
+              f"  rows={rows}  not_final={open_weeks}")
+
+def cmd_stale(args: argparse.Namespace) -> None:
+    season = args.season or CURRENT_SEASON_DEFAULT
+    through = args.through or last_completed_week(season, date.today())
+    weeks = stale_weeks(load_manifest(), season, range(1, through + 1))
+    print(f"Season {season} through week {through}: needs refresh = {weeks}")
+
+def cmd_verify(args: argparse.Namespace) -> None:
+    print(f"Using cache dir: {CACHE_DIR}")
+    entries = load_manifest()
+    problems = verify(entries, checksums=not args.quick)
+    for (s, w), msg in problems:
+        print(f"  !! {s} wk{w}: {msg}")
+    print(f"Checked {len(entries)} manifest entries: {len(problems)} problem(s).")
+    if problems:
+        raise SystemExit(1)
+
+def cmd_rebuild_manifest(args: argparse.Namespace) -> None:
+    print(f"Using cache dir: {CACHE_DIR}")
+    entries = rebuild_manifest()
+    print(f"Indexed {len(entries)} weekly files into {manifest_path().name}")
+
+def cmd_compact(args: argparse.Namespace) -> None:
+    print(f"Using cache dir: {CACHE_DIR}")
+    written = compact(args.seasons or None)
+    if not written:
+        print("No weekly parquet files to compact.")
+        return
+    for s in sorted(written):
+        print(f"  → {DATASET_DIR.name}/season={s} ({written[s]} rows)")
+    if CACHE_LAYOUT != "dataset":
+        print("Set NFL_CACHE_LAYOUT=dataset to read from the compacted dataset.")
+
+def cmd_live(args: argparse.Namespace) -> None:
+    print(f"Using cache dir: {CACHE_DIR}")
+    season = args.season or CURRENT_SEASON_DEFAULT
+    poller = LivePoller(season, args.week, api_key=API_SPORTS_KEY, league_id=LEAGUE_ID)
+    if args.once:
+        events = poller.poll_once()
+        print(f"{len(events)} change(s); events appended to {poller.event_log}")
+        return
+    poller.run(args.interval)
 
 def build_parser() -> argparse.ArgumentParser:
     p = argparse.ArgumentParser(prog="cache_tool",
-        description="Manage NFL Parquet cache (update/backfill/refresh/status). Cache-first; API only when needed or --refresh.")
+        description="Manage NFL Parquet cache (update/backfill/refresh/status/compact/live). Cache-first; API only when needed or --refresh.")
+    profiling.add_cli_flags(p)
+    p.add_argument("--no-read-cache", action="store_true",
+                   help="Read parquet files from disk on every use (bypass the in-process frame cache)")
     sub = p.add_subparsers(dest="cmd", required=True)
 
     sp = sub.add_parser("update", help="Update current (or given) season up to last completed week.")
     sp.add_argument("--season", type=int, help=f"Season to update (default: {CURRENT_SEASON_DEFAULT})")
     sp.add_argument("--refresh", action="store_true", help="Force rebuild existing weeks.")
+    sp.add_argument("--stale", action="store_true", help="Re-pull weeks the manifest marks as not final.")
     sp.set_defaults(func=cmd_update)
 
     sp = sub.add_parser("backfill", help="Backfill one or more seasons (all 18 weeks).")
@@ -123,12 +172,46 @@ def build_parser() -> argparse.ArgumentParser:
     sp = sub.add_parser("status", help="Print what weeks you already have in cache.")
     sp.set_defaults(func=cmd_status)
 
+    sp = sub.add_parser("stale", help="List weeks that need a refresh (missing or not final), from the manifest.")
+    sp.add_argument("--season", type=int, help=f"Season to check (default: {CURRENT_SEASON_DEFAULT})")
+    sp.add_argument("--through", type=int, help="Last week to check (default: last completed week)")
+    sp.set_defaults(func=cmd_stale)
+
+    sp = sub.add_parser("verify", help="Check cache files against the manifest (size + checksum).")
+    sp.add_argument("--quick", action="store_true", help="Only check existence and size (no file reads).")
+    sp.set_defaults(func=cmd_verify)
+
+    sp = sub.add_parser("rebuild-manifest", help="Rebuild the manifest from the weekly files on disk.")
+    sp.set_defaults(func=cmd_rebuild_manifest)
+
+    sp = sub.add_parser("compact", help="Compact weekly files into the season-partitioned dataset.")
+    sp.add_argument("seasons", nargs="*", type=int, help="Seasons to compact (default: all cached)")
+    sp.set_defaults(func=cmd_compact)
+
+    sp = sub.add_parser("live", help="Poll in-progress games for one week; rewrite cache files only on change.")
+    sp.add_argument("week", type=int)
+    sp.add_argument("--season", type=int, help=f"Season (default: {CURRENT_SEASON_DEFAULT})")
+    sp.add_argument("--interval", type=float, default=60.0, help="Seconds between polls while games are live")
+    sp.add_argument("--once", action="store_true", help="Poll once and exit")
+    sp.set_defaults(func=cmd_live)
+
     return p
 
 def main():
     parser = build_parser()
     args = parser.parse_args()
-    args.func(args)
+    if args.profile:
+        profiling.enable()
+        lines_profiling.install(profiling)
+    try:
+        if args.no_read_cache:
+            with bypass():
+                args.func(args)
+        else:
+            args.func(args)
+    finally:
+        if args.profile:
+            profiling.dump(args.profile, args.profile_out)
 
 if __name__ == "__main__":
     main()
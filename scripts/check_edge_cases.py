@@ -0,0 +1,157 @@
+# scripts/check_edge_cases.py
+from __future__ import annotations
+from pathlib import Path
+import sys
+import argparse
+import math
+import stat
+import tempfile
+
+# path shim so we can run without pip install -e .
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pandas as pd
+
+# Offline checks for edge cases that broke before (no API calls, no cache needed).
+#
+#   python scripts/check_edge_cases.py            # all checks
+#   python scripts/check_edge_cases.py live_first_poll
+
+
+def _synthetic_cache(root: Path, seasons: int = 2) -> Path:
+    """Weekly parquet files from the benchmark generators (under `root`/cache)."""
+    bench = str(ROOT / "benchmarks")
+    if bench not in sys.path:
+        sys.path.insert(0, bench)
+    from generators import write_synthetic_cache
+
+    cache = root / "cache"
+    write_synthetic_cache(cache, seasons)
+    return cache
+
+
+def check_live_first_poll():
+    """The first poll of a week seeds statuses and scores; only real moves are published."""
+    from nfl_lines.io.live_poll import diff_rows, first_seen
+
+    snapshot = pd.DataFrame({"home": ["KC", "BUF", "DET"], "away": ["DET", "NYJ", "GB"],
+                             "home_points": [None, None, 14], "away_points": [None, None, 7]})
+    fresh = pd.DataFrame({"home": ["KC", "BUF", "DET"], "away": ["DET", "NYJ", "GB"],
+                          "home_points": [0, 7, 21], "away_points": [0, 3, 7], "status": ["Q1", "Q2", "Q3"]})
+    changes = diff_rows(snapshot, fresh)
+    assert len(changes) == 3, changes
+    assert first_seen(changes).tolist() == [True, True, False], changes
+
+    # once seeded, an unchanged poll is not a change and a status move is
+    seeded = fresh.copy()
+    assert diff_rows(seeded, fresh).empty
+    later = fresh.assign(status=["Q2", "Q2", "Q3"])
+    changes = diff_rows(seeded, later)
+    assert changes["home"].tolist() == ["KC"] and not first_seen(changes).any()
+
+
+def check_norm_cdf_parity():
+    """The vectorized normal CDF matches the math.erf path, tails and NaN included."""
+    import numpy as np
+    from nfl_model.pricing.odds import _norm_cdf_erf, erfc, norm_cdf, win_prob_from_spread
+
+    x = np.concatenate([np.linspace(-40, 40, 200001), [np.nan, np.inf, -np.inf, 0.0, -0.0]])
+    got, ref = norm_cdf(x), _norm_cdf_erf(x)
+    assert np.array_equal(np.isnan(got), np.isnan(ref))
+    assert np.nanmax(np.abs(got - ref)) < 1e-15
+    tail = x[(x > 0) & (x < 26)]
+    exact = np.array([math.erfc(v) for v in tail])
+    assert np.max(np.abs(erfc(tail) - exact) / exact) < 5e-15
+    spreads = np.linspace(-30, 30, 601)
+    scalar = np.array([win_prob_from_spread(s) for s in spreads])
+    assert np.max(np.abs(norm_cdf(spreads / 13.45) - scalar)) < 1e-15
+
+
+def check_neutral_without_site():
+    """A neutral game with no named site gets no travel or timezone edge; a named site does."""
+    import numpy as np
+    from nfl_model.config import Params, PipelineConfig
+    from nfl_model.engine import Engine, merge_ratings
+    from nfl_model.travel import schedule_features
+
+    games = pd.DataFrame({"week": [1, 1, 1], "date": ["2024-09-08"] * 3, "away": ["NYJ", "NYJ", "NYJ"],
+                          "home": ["SF", "SF", "SF"], "neutral": [1, 1, 0], "site": [None, "London", None]})
+    feats = schedule_features(games)
+    assert feats.loc[0, ["home_travel_mi", "away_travel_mi", "home_tz_shift", "away_tz_shift"]].isna().all()
+    assert feats.loc[1, "home_travel_mi"] > 5000 and feats.loc[1, "away_tz_shift"] == 5
+    assert feats.loc[2, "home_travel_mi"] == 0 and feats.loc[2, "away_tz_shift"] == -3
+
+    ratings = pd.DataFrame({"team": ["SF", "NYJ"], "power": [3.0, 1.0], "off": [0.0, 0.0], "def": [0.0, 0.0],
+                            "qb_points": [0.0, 0.0]})
+    ratings["team_key"] = ratings["team"]
+    games["home_key"], games["away_key"] = games["home"], games["away"]
+    merged = merge_ratings(games, ratings)
+    base = PipelineConfig()
+    with_sched = PipelineConfig(spread_factors=base.spread_factors + ["travel", "timezone_shift"])
+    plain = Engine(Params(), base).price(merged)["model_spread_home"].to_numpy()
+    sched = Engine(Params(), with_sched).price(merged)["model_spread_home"].to_numpy()
+    assert sched[0] == plain[0], (sched, plain)
+    assert not np.isclose(sched[2], plain[2])
+
+
+def check_derived_stores():
+    """Features and margin tables build cold on a fresh cache, persist (0644) and reload."""
+    from nfl_model.features import FeatureStore
+    from nfl_model.pricing.margins import margin_table_for_cache
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = _synthetic_cache(Path(tmp))
+        state = FeatureStore(cache).state()
+        assert len(state) and state["games"].min() == 1, state
+        saved = sorted((cache / "derived").glob("team_features_*.parquet"))
+        assert len(saved) == 1 and stat.S_IMODE(saved[0].stat().st_mode) == 0o644, saved
+        pd.testing.assert_frame_equal(FeatureStore(cache).state(), state)
+
+        table = margin_table_for_cache(cache)
+        saved = sorted((cache / "derived").glob("margin_table_*.npz"))
+        assert len(saved) == 1 and table.n_games > 0
+        again = margin_table_for_cache(cache)
+        assert (again.pmf == table.pmf).all()
+        # a table for other parameters leaves this one in place
+        margin_table_for_cache(cache, margin_sd=14.0)
+        assert len(sorted((cache / "derived").glob("margin_table_*.npz"))) == 2
+
+
+def check_feature_games_and_configs():
+    """games counts scored games only; feature stores with different configs keep each other's files."""
+    from nfl_model.features import FeatureConfig, FeatureStore, compute_team_features
+
+    long_df = pd.DataFrame({"team": ["KC"] * 3, "season": [2024] * 3, "week": [1, 2, 3],
+                            "is_home": [True, False, True], "points_for": [27, None, None],
+                            "points_against": [20, None, None]})
+    assert compute_team_features(long_df)["games"].tolist() == [1, 1, 1]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = _synthetic_cache(Path(tmp))
+        FeatureStore(cache).state()
+        FeatureStore(cache, FeatureConfig(window=8)).state()
+        saved = sorted((cache / "derived").glob("team_features_*.parquet"))
+        assert len(saved) == 2, saved
+
+
+CHECKS = {name[len("check_"):]: fn for name, fn in list(globals().items()) if name.startswith("check_")}
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Run offline edge-case checks.")
+    ap.add_argument("checks", nargs="*", metavar="CHECK",
+                    help=f"Checks to run (default: all of {', '.join(sorted(CHECKS))})")
+    args = ap.parse_args()
+    unknown = sorted(set(args.checks) - set(CHECKS))
+    if unknown:
+        ap.error(f"unknown check(s): {unknown}")
+    for name in args.checks or sorted(CHECKS):
+        CHECKS[name]()
+        print(f"OK: {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# scripts/check_normalize_parity.py
+from __future__ import annotations
+from pathlib import Path
+import sys
+import argparse
+import json
+import random
+import time
+
+# path shim so we can run without pip install -e .
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pandas as pd
+
+from nfl_lines.io.loader_v0 import _normalize_rowwise
+from nfl_lines.io.future_loader import _normalize_schedule_rowwise
+from nfl_lines.io.normalize import normalize_games, normalize_schedule
+
+SAMPLE = ROOT / "examples" / "raw_games.json"
+
+
+def load_payloads(paths: list[Path]) -> list[tuple[int, int, list]]:
+    """Recorded payloads: JSON files holding {'season','week','response'} or a bare list of games."""
+    out = []
+    for p in paths:
+        files = sorted(p.glob("*.json")) if p.is_dir() else [p]
+        for f in files:
+            data = json.loads(f.read_text())
+            if isinstance(data, dict):
+                out.append((int(data.get("season", 0)), int(data.get("week", 0)), data.get("response", [])))
+            else:
+                out.append((0, 0, data))
+    return out
+
+
+def synthetic_payload(n: int, seed: int = 7) -> list[dict]:
+    """Random games mixing the shapes both normalizers have to cope with."""
+    rng = random.Random(seed)
+    teams = ["Kansas City Chiefs", "Buffalo Bills", "Detroit Lions", "Dallas Cowboys", None]
+    score_values = [0, 3, 17, 24, "31", " 7 ", "7.5", None, 10.0, True]
+    games = []
+    for i in range(n):
+        ts = 1694132400 + rng.randrange(0, 86400 * 120)
+        g: dict = {
+            "game": {"date": {"timestamp": ts if rng.random() > 0.05 else None}},
+            "teams": {"home": {"name": rng.choice(teams)}, "away": {"name": rng.choice(teams)}},
+        }
+        if rng.random() < 0.8:
+            g["scores"] = {"home": {"total": rng.choice(score_values)}, "away": {"total": rng.choice(score_values)}}
+        elif rng.random() < 0.5:
+            g["score"] = {"home": rng.choice(score_values), "away": rng.choice(score_values)}
+        if rng.random() < 0.3:
+            g["date"] = rng.choice(["2023-09-10", "2023-09-10T17:00:00Z", "2023-09-11 20:15:00-04:00", "not a date", ""])
+        if rng.random() < 0.1:
+            g["neutral"] = rng.choice([True, False, "Yes", "0", 1, None])
+        if rng.random() < 0.1:
+            g["venue"] = {"neutral": rng.choice([True, "t", "no"])}
+        if rng.random() < 0.05:
+            g["home"], g["away"] = "Home Fallback", "Away Fallback"
+        games.append(g)
+    return games
+
+
+def check(season: int, week: int, raw: list) -> tuple[float, float, float, float]:
+    t0 = time.perf_counter(); ref = _normalize_rowwise(season, week, raw)
+    t1 = time.perf_counter(); new = normalize_games(season, week, raw)
+    t2 = time.perf_counter()
+    pd.testing.assert_frame_equal(new, ref)
+
+    t3 = time.perf_counter(); ref_s = _normalize_schedule_rowwise(season, week, raw)
+    t4 = time.perf_counter(); new_s = normalize_schedule(season, week, raw)
+    t5 = time.perf_counter()
+    pd.testing.assert_frame_equal(new_s, ref_s)
+    return t1 - t0, t2 - t1, t4 - t3, t5 - t4
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Check columnar normalizers against the row-wise reference.")
+    ap.add_argument("payloads", nargs="*", type=Path, help=f"Recorded payload files/dirs (default: {SAMPLE.name})")
+    ap.add_argument("--synthetic", type=int, default=5000, help="Also check N synthetic games (0 to skip)")
+    args = ap.parse_args()
+
+    batches = load_payloads(args.payloads or [SAMPLE])
+    batches.append((2023, 1, []))
+    if args.synthetic:
+        batches.append((2023, 1, synthetic_payload(args.synthetic)))
+
+    totals = [0.0, 0.0, 0.0, 0.0]
+    for season, week, raw in batches:
+        for i, t in enumerate(check(season, week, raw)):
+            totals[i] += t
+    games = sum(len(raw) for _, _, raw in batches)
+    print(f"OK: {len(batches)} payloads, {games} games match")
+    print(f"  _normalize          row-wise {totals[0]:.3f}s  columnar {totals[1]:.3f}s")
+    print(f"  _normalize_schedule row-wise {totals[2]:.3f}s  columnar {totals[3]:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# scripts/exposure.py
+from __future__ import annotations
+from pathlib import Path
+import sys
+import argparse
+
+# path shim so we can run without pip install -e .
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pandas as pd
+import yaml
+
+from nfl_model import profiling
+from nfl_model.config import Params, PipelineConfig
+from nfl_model.pricing.greeks import team_exposure
+
+# Per-team rating exposure of a book of open positions, from nfl-lines --greeks output.
+#
+#   nfl-lines --ratings ... --schedule ... --greeks --out out/lines.csv
+#   python scripts/exposure.py --lines out/lines.csv --positions book.csv --params examples/params.yaml
+#
+# positions CSV: week, date, away, home, side (home/away/over/under), stake[, line]
+# Each team's row is the change in expected winning stake per point of that rating.
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Aggregate closed-form greeks over open positions, per team rating.")
+    ap.add_argument("--lines", required=True, type=Path, help="nfl-lines output CSV written with --greeks")
+    ap.add_argument("--positions", required=True, type=Path)
+    ap.add_argument("--params", type=Path, help="Params YAML (total_sd for over/under positions)")
+    ap.add_argument("--out", type=Path)
+    profiling.add_cli_flags(ap)
+    args = ap.parse_args()
+    if args.profile:
+        profiling.enable()
+
+    try:
+        cfg = (yaml.safe_load(args.params.read_text()) or {}) if args.params else {}
+        params = Params(**{k: v for k, v in cfg.items() if k not in PipelineConfig.model_fields})
+        lines = pd.read_csv(args.lines, dtype={"date": str})
+        positions = pd.read_csv(args.positions, dtype={"date": str})
+        with profiling.timer("greeks.exposure"):
+            out = team_exposure(lines, positions, params.total_sd)
+        if args.out:
+            args.out.parent.mkdir(parents=True, exist_ok=True)
+            out.to_csv(args.out, index=False)
+            print(f"[exposure] {len(out)} teams -> {args.out}")
+        else:
+            print(out.to_string(index=False))
+    finally:
+        if args.profile:
+            profiling.dump(args.profile, args.profile_out)
+
+
+if __name__ == "__main__":
+    main()
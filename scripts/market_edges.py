@@ -0,0 +1,89 @@
+# scripts/market_edges.py
+from __future__ import annotations
+from pathlib import Path
+import sys
+import argparse
+
+# path shim so we can run without pip install -e .
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pandas as pd
+import yaml
+
+from nfl_model import profiling
+from nfl_model.config import Params, PipelineConfig
+from nfl_model.io.odds_store import game_keys, ingest_ticks, load_ticks
+from nfl_model.pricing.margins import MarginTable
+from nfl_model.pricing.market import market_edges
+from nfl_model.teams import team_codes
+
+# Odds tick store + model-vs-market edges.
+#
+#   python scripts/market_edges.py ingest ticks/*.csv --store data/odds
+#   python scripts/market_edges.py edges --lines out/lines.csv --store data/odds --as-of 2025-09-05T12:00Z \
+#       --params examples/params.yaml
+#
+# margin_sd / total_sd (and a key_numbers margin_table) come from the same params YAML as
+# nfl-lines and same_game.py, so edges price games the way the lines did.
+
+
+def cmd_ingest(args) -> None:
+    written = ingest_ticks(args.files, args.store)
+    for season, n in written.items():
+        print(f"[ingest] season={season}: {n} ticks")
+
+
+def cmd_edges(args) -> None:
+    lines = pd.read_csv(args.lines)
+    keys = game_keys(lines["date"], team_codes(lines["home"]), team_codes(lines["away"]))
+    ticks = load_ticks(args.store, books=args.books, keys=keys)
+    cfg = (yaml.safe_load(args.params.read_text()) or {}) if args.params else {}
+    params = Params(**{k: v for k, v in cfg.items() if k not in PipelineConfig.model_fields})
+    table = args.margin_table or (params.margin_table if params.margin_model == "key_numbers" else None)
+    margins = MarginTable.load(table) if table else None
+    edges = market_edges(lines, ticks, as_of=args.as_of, params=params, margins=margins)
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        edges.to_csv(args.out, index=False)
+        print(f"[edges] {len(edges)} rows -> {args.out}")
+    else:
+        print(edges.to_string(index=False))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Ingest sportsbook odds ticks and compare model lines to the market.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("ingest", help="Append tick files (CSV/parquet) to the store")
+    p.add_argument("files", nargs="+", type=Path)
+    p.add_argument("--store", required=True, type=Path)
+    profiling.add_cli_flags(p)
+    p.set_defaults(fn=cmd_ingest)
+
+    p = sub.add_parser("edges", help="Edges, no-vig probabilities and CLV for nfl-lines output")
+    p.add_argument("--lines", required=True, type=Path, help="nfl-lines output CSV")
+    p.add_argument("--store", required=True, type=Path)
+    p.add_argument("--books", nargs="*", help="Only these books")
+    p.add_argument("--as-of", help="Bet time (UTC timestamp or a column of --lines); default: the close")
+    p.add_argument("--params", type=Path, help="Params YAML (margin_sd, total_sd, margin_model/margin_table)")
+    p.add_argument("--margin-table", type=Path,
+                   help="Key-number margin table (.npz); adds push probabilities (default: margin_table in --params)")
+    p.add_argument("--out", type=Path)
+    profiling.add_cli_flags(p)
+    p.set_defaults(fn=cmd_edges)
+
+    args = ap.parse_args()
+    if args.profile:
+        profiling.enable()
+    try:
+        args.fn(args)
+    finally:
+        if args.profile:
+            profiling.dump(args.profile, args.profile_out)
+
+
+if __name__ == "__main__":
+    main()
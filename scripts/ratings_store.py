@@ -0,0 +1,111 @@
+# scripts/ratings_store.py
+from __future__ import annotations
+from pathlib import Path
+import sys
+import argparse
+
+# path shim so we can run without pip install -e .
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pandas as pd
+
+from nfl_model import profiling
+from nfl_model.io.loaders import load_ratings
+from nfl_model.io.ratings_store import RatingsStore
+
+# Versioned ratings history (nfl_model.io.ratings_store).
+#
+#   python scripts/ratings_store.py add examples/ratings.csv --store data/ratings --season 2025 --week 3
+#   python scripts/ratings_store.py list --store data/ratings
+#   python scripts/ratings_store.py show --store data/ratings --asof 2025-09-18T20:00Z
+#   python scripts/ratings_store.py diff 4 7 --store data/ratings
+#   python scripts/ratings_store.py compact --store data/ratings
+#
+# nfl-lines prices against the store with --ratings-store [--ratings-asof TS].
+
+
+def _print(df: pd.DataFrame) -> None:
+    with pd.option_context("display.max_columns", None, "display.width", 200):
+        print(df.to_string(index=False))
+
+
+def cmd_add(args, store: RatingsStore) -> None:
+    v = store.append(load_ratings(args.file), args.season, args.week, ts=args.ts, label=args.label)
+    print(f"[ratings] stored {store.label(v)}")
+
+
+def cmd_list(args, store: RatingsStore) -> None:
+    _print(store.versions)
+
+
+def cmd_show(args, store: RatingsStore) -> None:
+    if args.version is not None:
+        v = args.version
+    elif args.asof:
+        v = store.version_at(args.asof)
+    elif args.season is not None and args.week is not None:
+        v = store.version_for_week(args.season, args.week)
+    else:
+        v = store.latest()
+    print(f"[ratings] {store.label(v)}")
+    _print(store.view(v).drop(columns=["team_key"]))
+
+
+def cmd_diff(args, store: RatingsStore) -> None:
+    print(f"[ratings] {store.label(args.a)} -> {store.label(args.b)}")
+    _print(store.diff(args.a, args.b))
+
+
+def cmd_compact(args, store: RatingsStore) -> None:
+    print(f"[ratings] packed versions 1..{store.compact()} into one file")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Append to and query the versioned ratings store.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    p = sub.add_parser("add", help="Record a ratings CSV as a new version")
+    p.add_argument("file", type=Path)
+    p.add_argument("--season", type=int, required=True)
+    p.add_argument("--week", type=int, required=True)
+    p.add_argument("--ts", help="Version time (UTC; default now)")
+    p.add_argument("--label")
+    p.set_defaults(fn=cmd_add)
+
+    p = sub.add_parser("list", help="All versions")
+    p.set_defaults(fn=cmd_list)
+
+    p = sub.add_parser("show", help="One version's ratings (default: latest)")
+    p.add_argument("--version", type=int)
+    p.add_argument("--asof", help="Version current at this UTC time")
+    p.add_argument("--season", type=int)
+    p.add_argument("--week", type=int)
+    p.set_defaults(fn=cmd_show)
+
+    p = sub.add_parser("diff", help="Teams whose ratings changed between two versions")
+    p.add_argument("a", type=int)
+    p.add_argument("b", type=int)
+    p.set_defaults(fn=cmd_diff)
+
+    p = sub.add_parser("compact", help="Pack all versions into one file (faster loads; contents unchanged)")
+    p.set_defaults(fn=cmd_compact)
+
+    for p in sub.choices.values():
+        p.add_argument("--store", required=True, type=Path)
+        profiling.add_cli_flags(p)
+
+    args = ap.parse_args()
+    if args.profile:
+        profiling.enable()
+    try:
+        args.fn(args, RatingsStore(args.store))
+    finally:
+        if args.profile:
+            profiling.dump(args.profile, args.profile_out)
+
+
+if __name__ == "__main__":
+    main()
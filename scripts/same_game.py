@@ -0,0 +1,90 @@
+# scripts/same_game.py
+from __future__ import annotations
+from pathlib import Path
+import sys
+import argparse
+
+# path shim so we can run without pip install -e .
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import numpy as np
+import pandas as pd
+import yaml
+
+from nfl_model import profiling
+from nfl_model.config import Params, PipelineConfig
+from nfl_model.pricing.joint import joint_model_for_cache, same_game_prices
+
+# Same-game spread x total combinations and team-total ladders for nfl-lines output.
+#
+#   python scripts/same_game.py --lines out/lines.csv --params examples/params.yaml
+#   python scripts/same_game.py --lines out/lines.csv --spread-col close_spread --total-col close_total \
+#       --features-cache cache/api_sports_nfl --ladder 13.5:34.5 --ladder-out out/team_totals.csv
+#
+# Without --spread-col/--total-col the model's own lines rounded to the half point are used.
+
+
+def _half(x: pd.Series) -> np.ndarray:
+    return np.round(x.to_numpy(dtype=float) * 2) / 2
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Joint margin/total pricing: same-game combos and team-total ladders.")
+    ap.add_argument("--lines", required=True, type=Path, help="nfl-lines output CSV")
+    ap.add_argument("--params", type=Path, help="Params YAML (margin_sd, total_sd, margin_total_rho)")
+    ap.add_argument("--features-cache", type=Path, help="Parquet cache; rho is fitted from it when params leave it unset")
+    ap.add_argument("--spread-col", help="Home handicap column of --lines to price against")
+    ap.add_argument("--total-col", help="Total column of --lines to price against")
+    ap.add_argument("--ladder", help="Team-total ladder 'LO:HI' (step 1), e.g. 13.5:34.5")
+    ap.add_argument("--ladder-out", type=Path)
+    ap.add_argument("--out", type=Path)
+    profiling.add_cli_flags(ap)
+    args = ap.parse_args()
+    if args.profile:
+        profiling.enable()
+
+    try:
+        lines = pd.read_csv(args.lines)
+        cfg = (yaml.safe_load(args.params.read_text()) or {}) if args.params else {}
+        params = Params(**{k: v for k, v in cfg.items() if k not in PipelineConfig.model_fields})
+        model = joint_model_for_cache(params, args.features_cache)
+        print(f"[joint] margin_sd={model.margin_sd} total_sd={model.total_sd} rho={model.rho:.4f}")
+
+        spread = args.spread_col or -_half(lines["model_spread_home"])
+        total = args.total_col or _half(lines["model_total"])
+        with profiling.timer("joint.combos"):
+            combos = same_game_prices(lines, model, spread, total)
+        _write(combos, args.out)
+
+        if args.ladder:
+            lo, hi = (float(v) for v in args.ladder.split(":"))
+            rungs = np.arange(lo, hi + 1e-9, 1.0)
+            parts = []
+            with profiling.timer("joint.ladder"):
+                for side in ("home", "away"):
+                    p = model.team_total_ladder(lines["model_spread_home"], lines["model_total"], rungs, side)
+                    frame = pd.DataFrame(p, columns=[f"over_{r:g}" for r in rungs])
+                    frame.insert(0, "team", lines[side].to_numpy())
+                    frame.insert(0, "side", side)
+                    frame.insert(0, "date", lines["date"].to_numpy())
+                    parts.append(frame)
+            _write(pd.concat(parts, ignore_index=True), args.ladder_out)
+    finally:
+        if args.profile:
+            profiling.dump(args.profile, args.profile_out)
+
+
+def _write(df: pd.DataFrame, out) -> None:
+    if out:
+        out.parent.mkdir(parents=True, exist_ok=True)
+        df.to_csv(out, index=False)
+        print(f"[joint] {len(df)} rows -> {out}")
+    else:
+        print(df.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
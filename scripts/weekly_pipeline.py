@@ -0,0 +1,156 @@
+# scripts/weekly_pipeline.py
+from __future__ import annotations
+from pathlib import Path
+import sys
+import argparse
+from datetime import date, datetime, timezone
+
+# path shim so we can run without pip install -e .
+ROOT = Path(__file__).resolve().parents[1]
+SRC = ROOT / "src"
+if str(SRC) not in sys.path:
+    sys.path.insert(0, str(SRC))
+
+import pandas as pd
+import yaml
+
+from nfl_model import profiling
+from nfl_model.cli import nfl_lines
+from nfl_model.config import Params, PipelineConfig
+from nfl_model.features import FeatureStore
+from nfl_model.io.loaders import load_ratings
+from nfl_model.io.long_store import STORE_DIRNAME, TABLE_NAME, refresh_team_long_store
+from nfl_model.io.ratings_store import RatingsStore
+from nfl_model.pipeline import Pipeline, Stage
+from nfl_model.pricing.margins import margin_table_for_cache
+from nfl_lines.utils import profiling as lines_profiling
+from nfl_lines.utils.config import CACHE_DIR
+from nfl_lines.utils.manifest import load_manifest, stale_weeks
+from cache_tool import CURRENT_SEASON_DEFAULT, ensure_week, last_completed_week
+
+# The weekly job as stages (nfl_model.pipeline): only what changed reruns.
+#
+#   cache     cache_tool update: pull completed weeks the cache lacks or the manifest marks stale
+#   long      materialized team-perspective long table          (cache weekly files)
+#   features  team features                                     (long table)
+#   margins   key-number margin table, when params ask for one  (long table)
+#   ratings   with --ratings-store: record the ratings CSV as a new version
+#   lines     nfl-lines for the slate                           (everything above + schedule, params)
+#
+#   python scripts/weekly_pipeline.py run --ratings data/ratings.csv --schedule data/wk5.csv \
+#       --params examples/params.yaml --out out/lines_wk5.csv
+#   python scripts/weekly_pipeline.py status --ratings ... (same stage arguments)
+#
+# `run lines` brings just the lines (and what they depend on) up to date; --force STAGE
+# reruns a stage regardless of its fingerprint; --offline leaves the cache as it is.
+# State (fingerprints, last run, seconds) lives in <cache>/derived/weekly_pipeline.json.
+
+
+def _load_config(path):
+    cfg = (yaml.safe_load(path.read_text()) or {}) if path and path.exists() else {}
+    params = Params(**{k: v for k, v in cfg.items() if k not in PipelineConfig.model_fields})
+    return params, PipelineConfig(**{k: v for k, v in cfg.items() if k in PipelineConfig.model_fields})
+
+
+def build_stages(args) -> list[Stage]:
+    cache, derived = CACHE_DIR, CACHE_DIR / STORE_DIRNAME
+    weekly = str(cache / "*_wk*.parquet")
+    long_table = str(derived / TABLE_NAME)
+    params, _ = _load_config(args.params)
+    season = args.season or CURRENT_SEASON_DEFAULT
+    stages = []
+
+    if not args.offline:
+        def cache_key():
+            through = last_completed_week(season, date.today())
+            stale = stale_weeks(load_manifest(), season, range(1, through + 1))
+            # weeks still in play may change at any time: check them on every run
+            checked = datetime.now(timezone.utc).isoformat() if stale else None
+            return {"season": season, "through": through, "stale": stale, "checked": checked}
+
+        def update_cache():
+            key = cache_key()
+            for wk in range(1, key["through"] + 1):
+                ensure_week(season, wk, refresh=wk in key["stale"])
+
+        stages.append(Stage("cache", update_cache, outputs=(str(cache),), key=cache_key))
+
+    stages.append(Stage("long", lambda: refresh_team_long_store(cache), inputs=(weekly,), outputs=(long_table,)))
+    stages.append(Stage("features", lambda: FeatureStore(cache).state(), inputs=(long_table,),
+                        outputs=(str(derived / "team_features_*.parquet"),)))
+    lines_inputs = [weekly, str(derived / "team_features_*.parquet"), str(args.schedule)]
+    if params.margin_model == "key_numbers" and not params.margin_table:
+        margin_tables = str(derived / "margin_table_*.npz")
+        stages.append(Stage("margins", lambda: margin_table_for_cache(cache, params.margin_sd, params.spread_cap),
+                            inputs=(long_table,), outputs=(margin_tables,),
+                            key=lambda: [params.margin_sd, params.spread_cap]))
+        lines_inputs.append(margin_tables)
+
+    argv = ["--schedule", str(args.schedule), "--features-cache", str(cache), "--out", str(args.out)]
+    if args.params:
+        argv += ["--params", str(args.params)]
+        lines_inputs.append(str(args.params))
+    if args.ratings_store:
+        def record_ratings():
+            store = RatingsStore(args.ratings_store)
+            print(f"[ratings] stored {store.label(store.append(load_ratings(args.ratings), season, args.week))}")
+
+        stages.append(Stage("ratings", record_ratings, inputs=(str(args.ratings),),
+                            outputs=(str(args.ratings_store),), key=lambda: [season, args.week]))
+        argv += ["--ratings-store", str(args.ratings_store)]
+        lines_inputs.append(str(args.ratings_store))
+    else:
+        argv += ["--ratings", str(args.ratings)]
+        lines_inputs.append(str(args.ratings))
+    stages.append(Stage("lines", lambda: nfl_lines.main(argv), inputs=tuple(lines_inputs), outputs=(str(args.out),)))
+    return stages
+
+
+def _print(rows: list[dict]) -> None:
+    with pd.option_context("display.max_columns", None, "display.width", 200):
+        print(pd.DataFrame(rows).to_string(index=False))
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Bring weekly lines up to date, rerunning only stages whose inputs changed.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    run = sub.add_parser("run", help="Run stale stages (default: all; or the named stages and their dependencies)")
+    run.add_argument("stages", nargs="*")
+    run.add_argument("--force", nargs="+", default=[], metavar="STAGE", help="Rerun these stages regardless")
+    run.add_argument("--workers", type=int, default=4, help="Stages run at once (threads)")
+    status = sub.add_parser("status", help="Which stages would run, with their last run")
+    for p in (run, status):
+        p.add_argument("--ratings", required=True, type=Path, help="Ratings CSV for the week")
+        p.add_argument("--ratings-store", type=Path, help="Record --ratings here and price from the store")
+        p.add_argument("--schedule", required=True, type=Path)
+        p.add_argument("--params", type=Path)
+        p.add_argument("--out", required=True, type=Path)
+        p.add_argument("--season", type=int, help=f"Season to update and tag ratings with (default: {CURRENT_SEASON_DEFAULT})")
+        p.add_argument("--week", type=int, help="Week to tag --ratings-store versions with")
+        p.add_argument("--offline", action="store_true", help="Skip the cache update (no API calls)")
+        p.add_argument("--state", type=Path, help="Pipeline state file (default: <cache>/derived/weekly_pipeline.json)")
+        profiling.add_cli_flags(p)
+    args = ap.parse_args()
+    if args.ratings_store and not args.week:
+        ap.error("--ratings-store needs --week")
+    if args.profile:
+        profiling.enable()
+        lines_profiling.install(profiling)
+
+    try:
+        pipe = Pipeline(build_stages(args), args.state or CACHE_DIR / STORE_DIRNAME / "weekly_pipeline.json")
+        if args.cmd == "status":
+            _print(pipe.status())
+            return
+        results = pipe.run(args.stages, force=args.force, workers=args.workers)
+        _print([{"stage": r.name, "status": r.status, "seconds": round(r.seconds, 3), "error": r.error}
+                for r in results])
+        if any(r.status in ("failed", "blocked") for r in results):
+            raise SystemExit(1)
+    finally:
+        if args.profile:
+            profiling.dump(args.profile, args.profile_out)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,24 @@
 # fetch_api_sports.py
 from __future__ import annotations
 
+import math
 import os
 import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Dict, Optional, List
 
 import requests
 
+from nfl_lines.utils import profiling
+
 API_KEY_ENV = "API_SPORTS_KEY"
 BASE_URL_ENV = "API_SPORTS_BASE_URL"
 LEAGUE_ID_ENV = "API_SPORTS_LEAGUE_ID"
 
 DEFAULT_BASE_URL = "https://v1.american-football.api-sports.io"
 GAMES_ENDPOINT = "/games"
+MAX_RETRY_AFTER = 120.0  # seconds; cap on a server-requested wait
 
 
 class APISportsError(RuntimeError):
@@ -32,6 +38,29 @@ def _base_url(base_url: Optional[str]) -> str:
     return (base_url or os.getenv(BASE_URL_ENV) or DEFAULT_BASE_URL).rstrip("/")
 
 
+def _retry_after(resp: requests.Response) -> Optional[float]:
+    """
+    Seconds to wait from a Retry-After header (delta-seconds or HTTP-date), if any,
+    capped at MAX_RETRY_AFTER.
+    """
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        wait = float(value)
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:     # '-0000' dates parse naive; they are UTC
+            when = when.replace(tzinfo=timezone.utc)
+        wait = (when - datetime.now(timezone.utc)).total_seconds()
+    if math.isnan(wait):
+        return None
+    return min(max(0.0, wait), MAX_RETRY_AFTER)
+
+
 def _retry_get(
     url: str,
     params: Dict[str, Any],
@@ -43,14 +72,22 @@ def _retry_get(
 ) -> Dict[str, Any]:
     last_err = None
     for attempt in range(1, retries + 1):
+        if attempt > 1:
+            profiling.count("http.retries")
         try:
-            resp = requests.get(url, params=params, headers=headers, timeout=timeout)
+            with profiling.timer("http.get"):
+                resp = requests.get(url, params=params, headers=headers, timeout=timeout)
+            profiling.count("http.calls")
+            profiling.count("http.bytes", len(resp.content))
+            profiling.count(f"http.status.{resp.status_code}")
             if resp.status_code == 429 and attempt < retries:
-                time.sleep(backoff**attempt)
+                wait = _retry_after(resp)
+                time.sleep(backoff**attempt if wait is None else wait)
                 continue
             resp.raise_for_status()
             return resp.json()
         except requests.RequestException as e:
+            profiling.count("http.errors")
             last_err = e
             if attempt < retries:
                 time.sleep(backoff**attempt)
@@ -10,14 +10,24 @@ from typing import Any, Optional, List, Dict
 import pandas as pd
 import pytz  # pip install pytz
 
-from nfl_lines.utils.config import CACHE_DIR
+from nfl_lines.utils.atomic import file_lock, write_parquet_atomic
+from nfl_lines.utils.config import SCHEDULE_DIR
 from nfl_lines.schedule.week_windows import week_range
 from nfl_lines.io.fetch_api_sports import get_games_by_date
+from nfl_lines.io.normalize import normalize_schedule
 
-TEMP_FILE = CACHE_DIR / "_upcoming_schedule.parquet"
+
+def schedule_path(season: int, week: int) -> Path:
+    """Upcoming-schedule snapshot for one (season, week); one file per week so jobs don't clobber."""
+    return SCHEDULE_DIR / f"upcoming_{int(season)}_wk{int(week)}.parquet"
 
 
 def _normalize_schedule(season: int, week: int, raw: List[Dict[str, Any]]) -> pd.DataFrame:
+    return normalize_schedule(season, week, raw)
+
+
+# Row-by-row reference implementation; scripts/check_normalize_parity.py compares against it.
+def _normalize_schedule_rowwise(season: int, week: int, raw: List[Dict[str, Any]]) -> pd.DataFrame:
     est_tz = pytz.timezone("US/Eastern")
     rows: List[Dict[str, Any]] = []
 
@@ -98,8 +108,9 @@ def fetch_week_schedule(
         cur += timedelta(days=1)
 
     df = _normalize_schedule(season, week, raw)
-    TEMP_FILE.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(TEMP_FILE, index=False)
+    p = schedule_path(season, week)
+    with file_lock(p):
+        write_parquet_atomic(df, p)
     return df
 
 
@@ -110,7 +121,7 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     df = fetch_week_schedule(args.season, args.week)
-    print(f"Wrote {len(df)} games to {TEMP_FILE}")
+    print(f"Wrote {len(df)} games to {schedule_path(args.season, args.week)}")
     # friendly console preview
     cols = ["date", "home", "away", "kickoff_est"]
     existing = [c for c in cols if c in df.columns]
@@ -0,0 +1,257 @@
+# src/nfl_lines/io/live_poll.py
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from nfl_lines.utils.atomic import file_lock, write_parquet_atomic
+from nfl_lines.utils.config import CACHE_DIR
+from nfl_lines.io.fetch_api_sports import get_games_by_date
+from nfl_lines.io.future_loader import fetch_week_schedule, schedule_path
+from nfl_lines.io.loader_v0 import _cache_path, write_week_frame
+from nfl_lines.io.normalize import normalize_schedule
+from nfl_lines.utils.read_cache import read_parquet
+
+# Game-day polling: re-fetch only the dates that have a game in progress (from the
+# kickoff_utc we already store), diff against the cached rows, rewrite cache files
+# only when a score or status moved, and publish one ScoreEvent per changed game. A
+# value seen for the first time (the snapshot has no status, and no scores before
+# kickoff) is stored but not published: it is a baseline, not a move.
+
+KEY = ["home", "away"]
+TRACKED = ["home_points", "away_points", "status"]
+FINAL_STATUSES = {"FT", "AOT", "CANC", "PST", "AWD"}
+EVENTS_DIR = CACHE_DIR / "events"
+
+PRE_KICKOFF = timedelta(minutes=5)   # start polling a game this long before kickoff
+MAX_GAME_LENGTH = timedelta(hours=5)  # stop polling a game that never reports final
+
+
+@dataclass(frozen=True)
+class ScoreEvent:
+    season: int
+    week: int
+    home: str
+    away: str
+    kickoff_utc: Optional[str]
+    status: Optional[str]
+    home_points: Optional[int]
+    away_points: Optional[int]
+    prev_status: Optional[str]
+    prev_home_points: Optional[int]
+    prev_away_points: Optional[int]
+    observed_at: str
+
+
+def _value(v: Any) -> Any:
+    return None if v is None or (not isinstance(v, str) and pd.isna(v)) else (v if isinstance(v, str) else int(v))
+
+
+def live_dates(schedule: pd.DataFrame, now: datetime) -> List[str]:
+    """UTC dates (API 'date' param) of games inside their live window and not final."""
+    if schedule.empty or "kickoff_utc" not in schedule.columns:
+        return []
+    kick = pd.to_datetime(schedule["kickoff_utc"], utc=True, errors="coerce")
+    status = schedule["status"] if "status" in schedule.columns else pd.Series(None, index=schedule.index)
+    now_ts = pd.Timestamp(now)
+    live = (kick - PRE_KICKOFF <= now_ts) & (now_ts <= kick + MAX_GAME_LENGTH) & ~status.isin(FINAL_STATUSES)
+    return sorted(kick[live].dt.strftime("%Y-%m-%d").unique().tolist())
+
+
+def next_kickoff(schedule: pd.DataFrame, now: datetime) -> Optional[datetime]:
+    if schedule.empty or "kickoff_utc" not in schedule.columns:
+        return None
+    kick = pd.to_datetime(schedule["kickoff_utc"], utc=True, errors="coerce")
+    upcoming = kick[kick - PRE_KICKOFF > pd.Timestamp(now)]
+    return None if upcoming.empty else upcoming.min().to_pydatetime()
+
+
+def _same(a: pd.Series, b: pd.Series, numeric: bool) -> np.ndarray:
+    """NA-aware equality; scores compare as numbers (7 == 7.0), status as text."""
+    if numeric:
+        a = pd.to_numeric(a, errors="coerce")
+        b = pd.to_numeric(b, errors="coerce")
+        return ((a == b) | (a.isna() & b.isna())).to_numpy()
+    a, b = a.astype(object), b.astype(object)
+    return ((a.isna() & b.isna()) | (a.notna() & b.notna() & (a.astype(str) == b.astype(str)))).to_numpy()
+
+
+def diff_rows(cached: pd.DataFrame, fresh: pd.DataFrame) -> pd.DataFrame:
+    """
+    Fresh rows whose scores or status differ from the cached row for the same (home, away),
+    with the cached values alongside as prev_<col>. Games absent from `fresh` are ignored.
+    """
+    prev = cached[KEY].copy()
+    for c in TRACKED:
+        prev[f"prev_{c}"] = cached[c] if c in cached.columns else None
+    merged = fresh.merge(prev, on=KEY, how="left")
+    changed = np.zeros(len(merged), dtype=bool)
+    for c in TRACKED:
+        changed |= ~_same(merged[c], merged[f"prev_{c}"], numeric=(c != "status"))
+    return merged[changed].reset_index(drop=True)
+
+
+def first_seen(changes: pd.DataFrame) -> np.ndarray:
+    """Rows of diff_rows() output whose every changed column had no previous value."""
+    seen = np.ones(len(changes), dtype=bool)
+    for c in TRACKED:
+        moved = ~_same(changes[c], changes[f"prev_{c}"], numeric=(c != "status"))
+        seen &= ~(moved & changes[f"prev_{c}"].notna().to_numpy())
+    return seen
+
+
+class LivePoller:
+    """
+    Polls one (season, week) on game day. Each poll costs one API call per live date and
+    nothing when no game is in progress.
+    """
+
+    def __init__(
+        self,
+        season: int,
+        week: int,
+        *,
+        api_key: Optional[str] = None,
+        league_id: Optional[int] = None,
+        base_url: Optional[str] = None,
+        on_event: Optional[Callable[[ScoreEvent], None]] = None,
+        events_dir: Path = EVENTS_DIR,
+    ):
+        self.season = int(season)
+        self.week = int(week)
+        self.api_key = api_key
+        self.league_id = int(league_id or os.getenv("API_SPORTS_LEAGUE_ID", "1") or 1)
+        self.base_url = base_url
+        self.listeners: List[Callable[[ScoreEvent], None]] = [on_event] if on_event else []
+        self.event_log = Path(events_dir) / f"live_{self.season}_wk{self.week}.jsonl"
+        self.snapshot_path = schedule_path(self.season, self.week)
+        self.schedule = self._load_snapshot()
+
+    def _load_snapshot(self) -> pd.DataFrame:
+        if self.snapshot_path.exists():
+            df = pd.read_parquet(self.snapshot_path)
+            if not df.empty:
+                return df
+        return fetch_week_schedule(self.season, self.week, api_key=self.api_key,
+                                   league_id=self.league_id, base_url=self.base_url)
+
+    def _fetch(self, dates: List[str]) -> pd.DataFrame:
+        raw: List[Dict[str, Any]] = []
+        for d in dates:
+            raw.extend(get_games_by_date(d, league_id=self.league_id, season=self.season,
+                                         api_key=self.api_key, base_url=self.base_url))
+        return normalize_schedule(self.season, self.week, raw, with_status=True)
+
+    def publish(self, event: ScoreEvent) -> None:
+        self.event_log.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.event_log, "a") as fh:
+            fh.write(json.dumps(asdict(event)) + "\n")
+        for listener in self.listeners:
+            listener(event)
+
+    def poll_once(self, now: Optional[datetime] = None) -> List[ScoreEvent]:
+        now = now or datetime.now(timezone.utc)
+        dates = live_dates(self.schedule, now)
+        if not dates:
+            return []
+        fresh = self._fetch(dates)
+        if fresh.empty:
+            return []
+        fresh = fresh[fresh.set_index(KEY).index.isin(self.schedule.set_index(KEY).index)]
+        changes = diff_rows(self.schedule, fresh)
+        if changes.empty:
+            return []
+
+        self._apply(changes)
+        changes = changes[~first_seen(changes)]
+        observed = now.isoformat(timespec="seconds")
+        events = [
+            ScoreEvent(
+                season=self.season, week=self.week, home=r["home"], away=r["away"],
+                kickoff_utc=_value(r.get("kickoff_utc")), status=_value(r["status"]),
+                home_points=_value(r["home_points"]), away_points=_value(r["away_points"]),
+                prev_status=_value(r["prev_status"]), prev_home_points=_value(r["prev_home_points"]),
+                prev_away_points=_value(r["prev_away_points"]), observed_at=observed,
+            )
+            for r in changes.to_dict(orient="records")
+        ]
+        for e in events:
+            self.publish(e)
+        return events
+
+    def _apply(self, changes: pd.DataFrame) -> None:
+        """Patch changed games into the snapshot and, if its scores moved, the weekly parquet."""
+        keys = pd.MultiIndex.from_frame(changes[KEY])
+
+        snap = self.schedule.copy()
+        if "status" not in snap.columns:
+            snap["status"] = None
+        pos = snap.set_index(KEY).index.get_indexer(keys)
+        for c in TRACKED:
+            col = snap[c].astype(object).to_numpy(copy=True)
+            col[pos] = changes[c].astype(object).to_numpy()
+            snap[c] = col
+        for c in ("home_points", "away_points"):
+            snap[c] = pd.array(pd.to_numeric(snap[c], errors="coerce"), dtype="Int64")
+        self.schedule = snap
+        with file_lock(self.snapshot_path):
+            write_parquet_atomic(snap, self.snapshot_path)
+
+        p = _cache_path(self.season, self.week)
+        if not p.exists():
+            return
+        weekly = read_parquet(p)    # cached frame; the edits below copy on write
+        wpos = weekly.set_index(KEY).index.get_indexer(keys)
+        hit = wpos >= 0
+        moved = False
+        for c in ("home_points", "away_points"):
+            new = pd.array(pd.to_numeric(changes[c][hit], errors="coerce"), dtype="Int64")
+            old = weekly[c].astype("Int64").iloc[wpos[hit]].array
+            moved |= not _same(pd.Series(old), pd.Series(new), numeric=True).all()
+            weekly[c] = weekly[c].astype("Int64")
+            weekly.iloc[wpos[hit], weekly.columns.get_loc(c)] = new
+        if moved:
+            write_week_frame(weekly, self.season, self.week)
+
+    def run(self, interval: float = 60.0, *, until_final: bool = True, max_idle_sleep: float = 3600.0) -> None:
+        """Poll every `interval` seconds while games are live; sleep until the next kickoff otherwise."""
+        while True:
+            now = datetime.now(timezone.utc)
+            for e in self.poll_once(now):
+                print(f"[{e.observed_at}] {e.away} @ {e.home}: {e.away_points}-{e.home_points} ({e.status})")
+            if live_dates(self.schedule, now):
+                time.sleep(interval)
+                continue
+            nxt = next_kickoff(self.schedule, now)
+            if nxt is None:
+                if until_final:
+                    print("No live or upcoming games left this week.")
+                    return
+                time.sleep(max_idle_sleep)
+                continue
+            time.sleep(min(max_idle_sleep, max(interval, (nxt - PRE_KICKOFF - now).total_seconds())))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Poll live scores for one NFL week; rewrite the cache only on change.")
+    parser.add_argument("week", type=int, help="Week number to poll")
+    parser.add_argument("--season", type=int, default=datetime.now().year, help="Season year (defaults to current year)")
+    parser.add_argument("--interval", type=float, default=60.0, help="Seconds between polls while games are live")
+    parser.add_argument("--once", action="store_true", help="Poll once and exit")
+    args = parser.parse_args()
+
+    poller = LivePoller(args.season, args.week)
+    if args.once:
+        evs = poller.poll_once()
+        print(f"{len(evs)} change(s); events appended to {poller.event_log}")
+    else:
+        poller.run(args.interval)
@@ -7,9 +7,15 @@ from typing import Any, Optional
 import os
 import pandas as pd
 
-from nfl_lines.utils.config import CACHE_DIR             # <-- NEW
+from nfl_lines.utils import profiling
+from nfl_lines.utils.config import CACHE_DIR, CACHE_LAYOUT   # <-- NEW
+from nfl_lines.utils.atomic import file_lock, write_parquet_atomic
+from nfl_lines.utils.dataset import write_week
+from nfl_lines.utils.manifest import record_week
+from nfl_lines.utils.read_cache import read_parquet
 from nfl_lines.schedule.week_windows import week_range
 from nfl_lines.io.fetch_api_sports import get_games_by_date
+from nfl_lines.io.normalize import normalize_games
 
 CANONICAL_COLUMNS = [
     "date", "season", "week", "home", "away",
@@ -30,6 +36,10 @@ def _as_bool(v) -> bool:
     return str(v).strip().lower() in {"1", "true", "t", "yes", "y"}
 
 def _normalize(season: int, week: int, raw: list[dict[str, Any]]) -> pd.DataFrame:
+    return normalize_games(season, week, raw)
+
+# Row-by-row reference implementation; scripts/check_normalize_parity.py compares against it.
+def _normalize_rowwise(season: int, week: int, raw: list[dict[str, Any]]) -> pd.DataFrame:
     rows: list[dict[str, Any]] = []
     for g in raw:
         raw_date = g.get("date") or g.get("datetime")
@@ -74,6 +84,7 @@ def _cache_path(season: int, week: int) -> Path:
     return CACHE_DIR / f"{int(season)}_wk{int(week)}.parquet"
     #return CACHE_DIR / f"{int(season)}_wk{int(week):02d}.parquet"
 
+@profiling.timed("fetch.get_week")
 def get_week(
     season: int,
     week: int,
@@ -89,29 +100,52 @@ def get_week(
     """
     p = _cache_path(season, week)
     if p.exists() and not force_refresh:
-        return pd.read_parquet(p)
-
-    date_from, date_to = week_range(season, week)
-    d0 = datetime.fromisoformat(date_from).date()
-    d1 = datetime.fromisoformat(date_to).date()
-
-    lid = int(league_id or os.getenv("API_SPORTS_LEAGUE_ID", "1") or 1)
-
-    raw: list[dict[str, Any]] = []
-    cur = d0
-    while cur <= d1:
-        raw.extend(
-            get_games_by_date(
-                cur.isoformat(),
-                league_id=lid,
-                season=season,
-                api_key=api_key,
-                base_url=base_url,
+        profiling.count("cache.hit")
+        return read_parquet(p)
+
+    with file_lock(p):
+        # another worker may have fetched this week while we waited for the lock
+        if p.exists() and not force_refresh:
+            profiling.count("cache.hit")
+            return read_parquet(p)
+        profiling.count("cache.miss")
+        date_from, date_to = week_range(season, week)
+        d0 = datetime.fromisoformat(date_from).date()
+        d1 = datetime.fromisoformat(date_to).date()
+
+        lid = int(league_id or os.getenv("API_SPORTS_LEAGUE_ID", "1") or 1)
+
+        raw: list[dict[str, Any]] = []
+        cur = d0
+        while cur <= d1:
+            raw.extend(
+                get_games_by_date(
+                    cur.isoformat(),
+                    league_id=lid,
+                    season=season,
+                    api_key=api_key,
+                    base_url=base_url,
+                )
             )
-        )
-        cur += timedelta(days=1)
+            cur += timedelta(days=1)
 
-    df = _normalize(season, week, raw)
-    p.parent.mkdir(parents=True, exist_ok=True)
-    df.to_parquet(p, index=False)
-    return df
+        df = _normalize(season, week, raw)
+        profiling.count("rows.fetched", len(df))
+        _write_week_frame(df, season, week)
+        return df
+
+
+def write_week_frame(df: pd.DataFrame, season: int, week: int) -> Path:
+    """Write one normalized week to the cache (weekly file + manifest + dataset partition)."""
+    with file_lock(_cache_path(season, week)):
+        return _write_week_frame(df, season, week)
+
+
+def _write_week_frame(df: pd.DataFrame, season: int, week: int) -> Path:
+    """write_week_frame for callers already holding the week's lock."""
+    p = _cache_path(season, week)
+    write_parquet_atomic(df, p)
+    record_week(df, p, season, week)
+    if CACHE_LAYOUT == "dataset":
+        write_week(df, season, week)   # keep the season partition in sync
+    return p
@@ -0,0 +1,180 @@
+# src/nfl_lines/io/normalize.py
+from __future__ import annotations
+
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+import pandas as pd
+
+# Columnar normalizers for API-Sports /games payloads.
+#
+# Each raw game is visited once to pull its leaf values into flat lists; every
+# conversion after that (dates, time zones, scores, neutral flags) runs as a
+# column operation. Output matches loader_v0._normalize_rowwise and
+# future_loader._normalize_schedule_rowwise (see scripts/check_normalize_parity.py).
+
+CANONICAL_COLUMNS = [
+    "date", "season", "week", "home", "away",
+    "home_points", "away_points", "neutral",
+]
+EASTERN_TZ = "US/Eastern"
+_TRUE_STRINGS = ["1", "true", "t", "yes", "y"]
+_INT_STRING_RE = r"\s*[+-]?\d+\s*"
+
+
+def _dict(v: Any) -> dict:
+    return v if isinstance(v, dict) else {}
+
+
+def _flatten_game(g: dict) -> tuple:
+    teams = g.get("teams") or {}
+    h = teams.get("home") or {}
+    a = teams.get("away") or {}
+    scores = g.get("scores") or g.get("score") or {}
+    sh, sa = scores.get("home"), scores.get("away")
+    return (
+        g.get("date") or g.get("datetime"),
+        h.get("name") or h.get("nickname") or h.get("code") or g.get("home"),
+        a.get("name") or a.get("nickname") or a.get("code") or g.get("away"),
+        sh.get("total") if isinstance(sh, dict) else sh,
+        sa.get("total") if isinstance(sa, dict) else sa,
+        g.get("neutral"),
+        (g.get("venue") or {}).get("neutral"),
+        g.get("neutral_venue"),
+    )
+
+
+def _flatten_schedule_game(g: dict) -> tuple:
+    teams = g.get("teams") or {}
+    h = teams.get("home") or {}
+    a = teams.get("away") or {}
+    scores = g.get("scores") or {}
+    return (
+        _dict(g.get("game", {}).get("date", {})).get("timestamp"),
+        h.get("name") or g.get("home"),
+        a.get("name") or g.get("away"),
+        _dict(scores.get("home", {})).get("total") if scores else None,
+        _dict(scores.get("away", {})).get("total") if scores else None,
+    )
+
+
+def _to_points(values: Sequence[Any]) -> pd.Series:
+    """int(v) semantics per cell, vectorized: integer strings/numbers -> Int64, anything else -> NA."""
+    s = pd.Series(values, dtype=object)
+    is_str = s.map(type).eq(str)
+    num = pd.to_numeric(s.where(~is_str), errors="coerce")
+    if is_str.any():
+        ok = s[is_str].str.fullmatch(_INT_STRING_RE).fillna(False).astype(bool)
+        num[is_str] = pd.to_numeric(s[is_str].where(ok), errors="coerce")
+    num = num.astype(float)
+    num[~np.isfinite(num)] = np.nan
+    return pd.Series(np.trunc(num), index=s.index).astype("Int64")
+
+
+def _truthy(values: Sequence[Any]) -> np.ndarray:
+    """loader_v0._as_bool over a column: str(v).strip().lower() in the true set."""
+    s = pd.Series(values, dtype=object)
+    return s.astype(str).str.strip().str.lower().isin(_TRUE_STRINGS).to_numpy()
+
+
+def _utc_date_strings(values: Sequence[Any]) -> list:
+    s = pd.Series(values, dtype=object)
+    present = s.map(bool, na_action="ignore").fillna(False).astype(bool)
+    out = pd.Series(None, index=s.index, dtype=object)
+    if present.any():
+        dt = pd.to_datetime(s[present], utc=True, errors="coerce", format="mixed")
+        out[present] = dt.dt.strftime("%Y-%m-%d").where(dt.notna(), None).astype(object)
+    return out.tolist()
+
+
+def _normalize_flat(
+    seasons: np.ndarray,
+    weeks: np.ndarray,
+    cols: list[tuple],
+) -> pd.DataFrame:
+    if cols:
+        raw_date, home, away, sh, sa, n1, n2, n3 = map(list, zip(*cols))
+        df = pd.DataFrame({
+            "date": _utc_date_strings(raw_date),
+            "season": seasons,
+            "week": weeks,
+            "home": home,
+            "away": away,
+            "home_points": _to_points(sh),
+            "away_points": _to_points(sa),
+            "neutral": _truthy(n1) | _truthy(n2) | _truthy(n3),
+        }, columns=CANONICAL_COLUMNS)
+    else:
+        df = pd.DataFrame.from_records([], columns=CANONICAL_COLUMNS)
+    for col in ("season", "week", "home_points", "away_points"):
+        df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
+    df["neutral"] = df["neutral"].fillna(False).astype(bool)
+    return df
+
+
+def normalize_games(season: int, week: int, raw: list[dict[str, Any]]) -> pd.DataFrame:
+    """Columnar equivalent of loader_v0._normalize for one (season, week) payload."""
+    cols = [_flatten_game(g) for g in raw]
+    n = len(cols)
+    return _normalize_flat(np.full(n, int(season)), np.full(n, int(week)), cols)
+
+
+def normalize_many(batches: Iterable[tuple[int, int, list[dict[str, Any]]]]) -> pd.DataFrame:
+    """
+    Normalize many (season, week, raw) payloads in a single pass, e.g. when
+    re-normalizing whole seasons of stored raw responses.
+    """
+    seasons: list[int] = []
+    weeks: list[int] = []
+    cols: list[tuple] = []
+    for season, week, raw in batches:
+        flat = [_flatten_game(g) for g in raw]
+        cols.extend(flat)
+        seasons.extend([int(season)] * len(flat))
+        weeks.extend([int(week)] * len(flat))
+    return _normalize_flat(np.asarray(seasons, dtype=np.int64), np.asarray(weeks, dtype=np.int64), cols)
+
+
+def normalize_schedule(
+    season: int,
+    week: int,
+    raw: list[dict[str, Any]],
+    *,
+    with_status: bool = False,
+) -> pd.DataFrame:
+    """
+    Columnar equivalent of future_loader._normalize_schedule (Eastern-local date/time).
+    with_status=True adds the API's short game status ('NS', 'Q2', 'FT', ...) as 'status'.
+    """
+    if not raw:
+        return pd.DataFrame()
+    ts, home, away, sh, sa = map(list, zip(*(_flatten_schedule_game(g) for g in raw)))
+
+    secs = pd.to_numeric(pd.Series(ts, dtype=object), errors="coerce")
+    kick_utc = pd.to_datetime(np.trunc(secs), unit="s", utc=True)
+    kick_local = kick_utc.dt.tz_convert(EASTERN_TZ).dt.tz_localize(None)
+    has_ts = kick_utc.notna().to_numpy()
+
+    # 'YYYY-MM-DDTHH:MM:SS' for every row in one C-level call, then slice.
+    def iso(s: pd.Series) -> pd.Series:
+        text = np.datetime_as_string(s.dt.tz_localize(None).to_numpy("datetime64[s]"), unit="s")
+        return pd.Series(text, dtype=object).where(has_ts, None)
+
+    utc_iso = iso(kick_utc)
+    local_iso = iso(kick_local)
+    df = pd.DataFrame({
+        "date": local_iso.str[:10].tolist(),             # Eastern local date (YYYY-MM-DD)
+        "season": [season] * len(ts),
+        "week": [week] * len(ts),
+        "home": home,
+        "away": away,
+        "home_points": sh,
+        "away_points": sa,
+        "neutral": [False] * len(ts),                    # API does not expose a neutral flag
+        "kickoff_est": local_iso.str[11:19].tolist(),    # HH:MM:SS (Eastern) — no date, no offset
+        "kickoff_utc": (utc_iso + "+00:00").tolist(),    # ISO8601 UTC for machines
+    })
+    if with_status:
+        df["status"] = [_dict(_dict(g.get("game")).get("status")).get("short") for g in raw]
+    df["_kick"] = kick_local
+    return df.sort_values(["season", "week", "_kick", "home", "away"]).drop(columns="_kick")
@@ -1,32 +1,58 @@
 #week_windows.py
 from __future__ import annotations
+import csv
+import os
 from dataclasses import dataclass
 from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterable, Optional
 
-# One anchor per season: the **Thursday** of NFL Week 1 (Regular Season).
-# Add new seasons as they’re announced.
-WEEK1_THURSDAY: dict[int, date] = {
-    2013: date(2013, 9, 5),
-    2014: date(2014, 9, 4),
-    2015: date(2015, 9, 10),
-    2016: date(2016, 9, 8),
-    2017: date(2017, 9, 7),
-    2018: date(2018, 9, 6),
-    2019: date(2019, 9, 5),
-    2020: date(2020, 9, 10),
-    2021: date(2021, 9, 9),
-    2022: date(2022, 9, 8),
-    2023: date(2023, 9, 7),
-    2024: date(2024, 9, 5),
-    2025: date(2025, 9, 4),
-    #2026: date(2026, 9, 10), # placeholder – to confirm
-    #2027: date(2027, 9, 9),  # placeholder – to confirm
-    #2028: date(2028, 9, 7),  # placeholder – to confirm
-    #2029: date(2029, 9, 6),  # placeholder – to confirm
-    #2030: date(2030, 9, 5),  # placeholder – to confirm
-}
-
-REGULAR_SEASON_WEEKS: int = 18  # adjust if you later include preseason/postseason
+import numpy as np
+import pandas as pd
+
+# One row per season in anchors.csv: the **Thursday** of NFL Week 1 (Regular Season)
+# plus how many Thu..Wed weeks each phase spans. Add new seasons there as they're
+# announced (NFL_ANCHORS_FILE points at an alternative file).
+#
+#   PRE   weeks 0..P-1: the P weeks right before Week 1; week 0 is the Hall of Fame
+#         game week, and since 2021 the last one is the empty Labor Day week.
+#   REG   weeks 1..R.
+#   POST  weeks 1..Q right after the regular season: Wild Card, Divisional,
+#         Conference, the pre-Super Bowl bye, Super Bowl.
+ANCHORS_FILE = Path(os.getenv("NFL_ANCHORS_FILE", str(Path(__file__).with_name("anchors.csv"))))
+
+REGULAR_SEASON_WEEKS: int = 18  # max regular-season weeks (17 through 2020); see SeasonAnchor
+
+PHASES: tuple[str, ...] = ("PRE", "REG", "POST")
+EASTERN_TZ = "US/Eastern"
+
+@dataclass(frozen=True)
+class SeasonAnchor:
+    season: int
+    week1_thursday: date
+    regular_weeks: int
+    preseason_weeks: int
+    postseason_weeks: int
+
+def load_anchors(path: Path | str = ANCHORS_FILE) -> dict[int, SeasonAnchor]:
+    with open(path, newline="") as fh:
+        rows = list(csv.DictReader(fh))
+    anchors = {}
+    for r in rows:
+        a = SeasonAnchor(
+            season=int(r["season"]),
+            week1_thursday=date.fromisoformat(r["week1_thursday"]),
+            regular_weeks=int(r["regular_weeks"]),
+            preseason_weeks=int(r["preseason_weeks"]),
+            postseason_weeks=int(r["postseason_weeks"]),
+        )
+        if a.week1_thursday.weekday() != 3:
+            raise ValueError(f"{path}: week1_thursday for {a.season} is not a Thursday")
+        anchors[a.season] = a
+    return dict(sorted(anchors.items()))
+
+ANCHORS: dict[int, SeasonAnchor] = load_anchors()
+WEEK1_THURSDAY: dict[int, date] = {s: a.week1_thursday for s, a in ANCHORS.items()}
 
 @dataclass(frozen=True)
 class WeekKey:
@@ -42,7 +68,7 @@ def week_range(season: int, week: int) -> tuple[str, str]:
         raise ValueError("week must be >= 1")
     if season not in WEEK1_THURSDAY:
         raise KeyError(
-            f"Unknown season {season}. Add WEEK1_THURSDAY[{season}] = date(YYYY, M, D)."
+            f"Unknown season {season}. Add a row for {season} to {ANCHORS_FILE.name}."
         )
     start_thu = WEEK1_THURSDAY[season] + timedelta(days=7 * (week - 1))
     end_tue   = start_thu + timedelta(days=5)  # Thu..Tue
@@ -61,3 +87,96 @@ def prev_week(season: int, week: int) -> WeekKey:
     if (season - 1) in WEEK1_THURSDAY:
         return WeekKey(season - 1, REGULAR_SEASON_WEEKS)
     return WeekKey(season, 1)
+
+
+class CalendarIndex:
+    """
+    Date -> (season, week, phase) over every Thu..Wed week of the anchored seasons.
+    Weeks are contiguous 7-day bins, so a lookup is one np.searchsorted over the bin
+    starts. Dates outside every window (the offseason) come back as NA.
+    """
+
+    def __init__(self, anchors: Optional[dict[int, SeasonAnchor]] = None):
+        anchors = ANCHORS if anchors is None else anchors
+        starts, seasons, weeks, phases = [], [], [], []
+        for a in anchors.values():
+            w1 = np.datetime64(a.week1_thursday, "D").astype(np.int64)
+            n = a.preseason_weeks + a.regular_weeks + a.postseason_weeks
+            starts.append(w1 + 7 * (np.arange(n) - a.preseason_weeks))
+            seasons.append(np.full(n, a.season))
+            weeks.append(np.concatenate([
+                np.arange(a.preseason_weeks),
+                np.arange(1, a.regular_weeks + 1),
+                np.arange(1, a.postseason_weeks + 1),
+            ]))
+            phases.append(np.repeat([0, 1, 2], [a.preseason_weeks, a.regular_weeks, a.postseason_weeks]))
+        if not starts:
+            raise ValueError("CalendarIndex needs at least one season anchor")
+        order = np.argsort(np.concatenate(starts), kind="stable")
+        self.bin_start = np.concatenate(starts)[order]
+        self.bin_season = np.concatenate(seasons)[order].astype(np.int16)
+        self.bin_week = np.concatenate(weeks)[order].astype(np.int8)
+        self.bin_phase = np.concatenate(phases)[order].astype(np.int8)
+        if (np.diff(self.bin_start) < 7).any():
+            raise ValueError("Season windows overlap; check the anchors file")
+
+    @staticmethod
+    def _to_days(values: Iterable) -> np.ndarray:
+        """
+        Days since epoch of each value's Eastern-local calendar date. Naive dates and
+        timestamps are taken as Eastern already; tz-aware ones (e.g. UTC kickoffs) are
+        converted first, so a Monday 8:15pm ET game stays on Monday. NaT -> int64 min.
+        """
+        if isinstance(values, (pd.Series, pd.Index)) and isinstance(values.dtype, pd.DatetimeTZDtype):
+            ts = pd.DatetimeIndex(values)
+        else:
+            ts = pd.DatetimeIndex(pd.to_datetime(pd.Series(values), errors="coerce", format="mixed"))
+        if ts.tz is not None:
+            ts = ts.tz_convert(EASTERN_TZ).tz_localize(None)
+        days = ts.to_numpy("datetime64[D]").astype(np.int64)
+        return np.where(ts.isna(), np.iinfo(np.int64).min, days)
+
+    def lookup_codes(self, values: Iterable) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(season int16, week int8, phase int8) arrays; -1 where a date is in no window."""
+        days = self._to_days(values)
+        i = np.searchsorted(self.bin_start, days, side="right") - 1
+        ok = (i >= 0) & (days < self.bin_start[np.maximum(i, 0)] + 7)
+        i = np.maximum(i, 0)
+        return (
+            np.where(ok, self.bin_season[i], -1).astype(np.int16),
+            np.where(ok, self.bin_week[i], -1).astype(np.int8),
+            np.where(ok, self.bin_phase[i], -1).astype(np.int8),
+        )
+
+    def lookup(self, values: Iterable) -> pd.DataFrame:
+        """DataFrame[season Int64, week Int64, phase category(PRE/REG/POST)], one row per value."""
+        season, week, phase = self.lookup_codes(values)
+        miss = season < 0
+        return pd.DataFrame({
+            "season": pd.arrays.IntegerArray(season.astype(np.int64), miss),
+            "week": pd.arrays.IntegerArray(week.astype(np.int64), miss.copy()),
+            "phase": pd.Categorical.from_codes(phase, categories=list(PHASES)),
+        })
+
+    def week_start(self, season: int, week: int, phase: str = "REG") -> date:
+        """Thursday that opens (season, week, phase)."""
+        hit = np.flatnonzero(
+            (self.bin_season == season) & (self.bin_week == week) & (self.bin_phase == PHASES.index(phase))
+        )
+        if not len(hit):
+            raise KeyError(f"No {phase} week {week} in season {season}")
+        return date(1970, 1, 1) + timedelta(days=int(self.bin_start[hit[0]]))
+
+
+_INDEX: Optional[CalendarIndex] = None
+
+def calendar_index() -> CalendarIndex:
+    """Shared CalendarIndex over the loaded anchors (built on first use)."""
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = CalendarIndex()
+    return _INDEX
+
+def season_week(values: Iterable) -> pd.DataFrame:
+    """Vectorized (season, week, phase) for an array of dates or timestamps."""
+    return calendar_index().lookup(values)
@@ -0,0 +1,93 @@
+# src/nfl_lines/utils/atomic.py
+from __future__ import annotations
+
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writes are still atomic
+    fcntl = None
+
+# Cache writes that readers can never observe half-done, and advisory locks so
+# parallel fetchers / cron jobs don't interleave read-modify-write cycles.
+#
+# Temp and lock files are dot-prefixed siblings of their target ('.2023_wk1.parquet.lock'),
+# so the '*.parquet' globs and pyarrow datasets never pick them up.
+
+
+@contextmanager
+def atomic_path(path: Path | str) -> Iterator[Path]:
+    """
+    Yield a unique temp path next to `path`; on a clean exit it is fsynced and renamed
+    over `path` in one step (os.replace), otherwise it is removed.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    os.close(fd)
+    tmp = Path(tmp)
+    os.chmod(tmp, 0o644)  # mkstemp creates 0600; cache files are shared between jobs
+    try:
+        yield tmp
+        with open(tmp, "rb") as fh:
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def write_parquet_atomic(df: pd.DataFrame, path: Path | str) -> Path:
+    with atomic_path(path) as tmp:
+        df.to_parquet(tmp, index=False)
+    return Path(path)
+
+
+def write_text_atomic(path: Path | str, text: str) -> Path:
+    with atomic_path(path) as tmp:
+        tmp.write_text(text)
+    return Path(path)
+
+
+def lock_path(path: Path | str) -> Path:
+    path = Path(path)
+    return path.with_name(f".{path.name}.lock")
+
+
+@contextmanager
+def file_lock(path: Path | str, *, shared: bool = False) -> Iterator[None]:
+    """
+    Advisory lock guarding `path` (held on a '.<name>.lock' sibling). Exclusive by
+    default; blocks until granted. A no-op where fcntl is unavailable.
+
+    The last holder removes the lock file on release, so they don't pile up next to
+    the cache files; a waiter that was granted a removed file retries on a fresh one.
+    """
+    lp = lock_path(path)
+    lp.parent.mkdir(parents=True, exist_ok=True)
+    if fcntl is None:
+        yield
+        return
+    while True:
+        fh = open(lp, "a")
+        fcntl.flock(fh.fileno(), fcntl.LOCK_SH if shared else fcntl.LOCK_EX)
+        try:
+            if os.stat(lp).st_ino == os.fstat(fh.fileno()).st_ino:
+                break
+        except FileNotFoundError:
+            pass
+        fh.close()    # unlinked by the previous holder while we waited
+    try:
+        yield
+    finally:
+        try:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            lp.unlink(missing_ok=True)     # no other holder: nobody can be using this file
+        except BlockingIOError:
+            pass
+        fh.close()
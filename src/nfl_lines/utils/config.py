@@ -5,8 +5,16 @@ import os
 
 PROJECT_ROOT = Path(__file__).resolve().parents[3]
 CACHE_ROOT = Path(os.getenv("NFL_CACHE_DIR", str(PROJECT_ROOT / "cache")))
-CACHE_DIR = CACHE_ROOT / "api_sports_nfl"
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
+CACHE_DIR = CACHE_ROOT / "api_sports_nfl"   # created by the first write (see utils/atomic.py)
+
+# Storage layout for reads: "weekly" (one parquet per week) or "dataset"
+# (season-partitioned dataset under CACHE_DIR/dataset, see utils/dataset.py).
+CACHE_LAYOUT: str = os.getenv("NFL_CACHE_LAYOUT", "weekly").strip().lower()
+DATASET_DIR = CACHE_DIR / "dataset"
+SCHEDULE_DIR = CACHE_DIR / "schedule"   # per-(season, week) upcoming-schedule snapshots
+
+# In-process budget for decoded parquet frames (utils/read_cache.py); 0 disables the cache.
+READ_CACHE_MB: int = int(os.getenv("NFL_READ_CACHE_MB", "512"))
 
 # --------------------------------------------------------------------
 # API Sports credentials
@@ -0,0 +1,147 @@
+# src/nfl_lines/utils/dataset.py
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from nfl_lines.utils.atomic import atomic_path, file_lock
+from nfl_lines.utils.config import CACHE_DIR, DATASET_DIR
+
+# Consolidated layout: one hive partition per season, one row group per week.
+#
+#   <CACHE_DIR>/dataset/season=2023/part-0.parquet
+#
+# The weekly '{season}_wk{week}.parquet' files stay the write path of get_week();
+# the dataset is the read-optimised copy (few files, projection, pushdown).
+
+WEEK_FILE_RE = re.compile(r"^(?P<season>\d{4})_wk0*(?P<week>\d+)\.parquet$", re.IGNORECASE)
+PART_FILE = "part-0.parquet"
+
+# 'season' lives in the partition path, not inside the files.
+FILE_SCHEMA = pa.schema([
+    ("date", pa.string()),
+    ("week", pa.int64()),
+    ("home", pa.string()),
+    ("away", pa.string()),
+    ("home_points", pa.int64()),
+    ("away_points", pa.int64()),
+    ("neutral", pa.bool_()),
+])
+PARTITIONING = ds.partitioning(pa.schema([("season", pa.int64())]), flavor="hive")
+COLUMN_ORDER = ["date", "season", "week", "home", "away", "home_points", "away_points", "neutral"]
+_INT_COLUMNS = ("season", "week", "home_points", "away_points")
+
+
+def week_files(
+    cache_dir: Path = CACHE_DIR,
+    seasons: Optional[Iterable[int]] = None,
+) -> list[tuple[int, int, Path]]:
+    """List weekly cache files as (season, week, path), sorted by (season, week)."""
+    wanted = None if seasons is None else {int(s) for s in seasons}
+    out = []
+    for p in Path(cache_dir).glob("*.parquet"):
+        m = WEEK_FILE_RE.match(p.name)
+        if not m:
+            continue
+        s, w = int(m.group("season")), int(m.group("week"))
+        if wanted is None or s in wanted:
+            out.append((s, w, p))
+    out.sort(key=lambda t: (t[0], t[1]))
+    return out
+
+
+def partition_path(season: int, root: Path = DATASET_DIR) -> Path:
+    return Path(root) / f"season={int(season)}" / PART_FILE
+
+
+def has_dataset(root: Path = DATASET_DIR) -> bool:
+    return any(Path(root).glob(f"season=*/{PART_FILE}"))
+
+
+def _to_file_table(df: pd.DataFrame) -> pa.Table:
+    df = df.drop(columns=["season"], errors="ignore")
+    df = df.sort_values(["week", "date", "home", "away"], kind="mergesort", na_position="last")
+    return pa.Table.from_pandas(df[FILE_SCHEMA.names], schema=FILE_SCHEMA, preserve_index=False)
+
+
+def _write_season(df: pd.DataFrame, season: int, root: Path) -> int:
+    """Write one season partition with one row group per week (enables week pruning)."""
+    table = _to_file_table(df)
+    weeks = table.column("week").to_numpy(zero_copy_only=False)
+    with atomic_path(partition_path(season, root)) as tmp:
+        with pq.ParquetWriter(tmp, FILE_SCHEMA) as writer:
+            start = 0
+            for i in range(1, len(weeks) + 1):
+                if i == len(weeks) or weeks[i] != weeks[start]:
+                    writer.write_table(table.slice(start, i - start))
+                    start = i
+    return table.num_rows
+
+
+def write_week(df: pd.DataFrame, season: int, week: int, root: Path = DATASET_DIR) -> int:
+    """Upsert one (season, week) into its season partition. Returns rows in the partition."""
+    p = partition_path(season, root)
+    with file_lock(p):
+        if p.exists():
+            existing = pq.read_table(p).to_pandas()
+            existing = existing[existing["week"] != int(week)]
+            df = pd.concat([existing, df.drop(columns=["season"], errors="ignore")], ignore_index=True)
+        return _write_season(df, season, root)
+
+
+def compact(
+    seasons: Optional[Sequence[int]] = None,
+    *,
+    cache_dir: Path = CACHE_DIR,
+    root: Path = DATASET_DIR,
+) -> dict[int, int]:
+    """
+    Fold the weekly '{season}_wk{week}.parquet' files into the season-partitioned dataset.
+    Each touched season partition is rewritten from its weekly files. Returns {season: rows}.
+    """
+    by_season: dict[int, list[Path]] = {}
+    for s, _, p in week_files(cache_dir, seasons):
+        by_season.setdefault(s, []).append(p)
+
+    written: dict[int, int] = {}
+    for s, paths in by_season.items():
+        with file_lock(partition_path(s, root)):
+            df = pd.concat([pd.read_parquet(p) for p in paths], ignore_index=True)
+            written[s] = _write_season(df, s, root)
+    return written
+
+
+def read_dataset(
+    columns: Optional[Sequence[str]] = None,
+    *,
+    seasons: Optional[Iterable[int]] = None,
+    weeks: Optional[Iterable[int]] = None,
+    root: Path = DATASET_DIR,
+) -> pd.DataFrame:
+    """
+    Read the consolidated dataset with column projection and season/week pushdown.
+    Season filters prune partitions; week filters skip row groups via Parquet statistics.
+    """
+    if not has_dataset(root):
+        raise FileNotFoundError(f"No partitioned dataset found in {root}")
+    dataset = ds.dataset(root, format="parquet", partitioning=PARTITIONING)
+
+    filt = None
+    if seasons is not None:
+        filt = ds.field("season").isin([int(s) for s in seasons])
+    if weeks is not None:
+        wf = ds.field("week").isin([int(w) for w in weeks])
+        filt = wf if filt is None else (filt & wf)
+
+    cols = list(columns) if columns is not None else COLUMN_ORDER
+    df = dataset.to_table(columns=cols, filter=filt).to_pandas()
+    for c in _INT_COLUMNS:
+        if c in df.columns:
+            df[c] = df[c].astype("Int64")
+    return df
@@ -0,0 +1,167 @@
+# src/nfl_lines/utils/manifest.py
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Optional
+
+import pandas as pd
+
+from nfl_lines.utils.atomic import file_lock, write_text_atomic
+from nfl_lines.utils.config import CACHE_DIR
+from nfl_lines.utils.dataset import week_files
+
+# One JSON index per cache dir, updated on every weekly write, so status /
+# staleness / integrity questions never have to open the parquet files.
+# Read-modify-write cycles hold the manifest's advisory lock (see utils/atomic.py).
+MANIFEST_NAME = "_manifest.json"
+MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    season: int
+    week: int
+    path: str         # file name relative to the cache dir
+    rows: int
+    bytes: int
+    sha256: str       # checksum of the file contents
+    fetched_at: str   # ISO-8601 UTC of the write
+    final: bool       # every game has both home_points and away_points
+
+
+def manifest_path(cache_dir: Path = CACHE_DIR) -> Path:
+    return Path(cache_dir) / MANIFEST_NAME
+
+
+def file_checksum(path: Path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _all_final(df: pd.DataFrame) -> bool:
+    if df.empty or not {"home_points", "away_points"}.issubset(df.columns):
+        return False
+    return bool(df["home_points"].notna().all() and df["away_points"].notna().all())
+
+
+def make_entry(
+    df: pd.DataFrame,
+    path: Path,
+    season: int,
+    week: int,
+    *,
+    fetched_at: Optional[datetime] = None,
+) -> ManifestEntry:
+    path = Path(path)
+    ts = fetched_at or datetime.now(timezone.utc)
+    return ManifestEntry(
+        season=int(season),
+        week=int(week),
+        path=path.name,
+        rows=int(len(df)),
+        bytes=int(path.stat().st_size),
+        sha256=file_checksum(path),
+        fetched_at=ts.isoformat(timespec="seconds"),
+        final=_all_final(df),
+    )
+
+
+def load_manifest(cache_dir: Path = CACHE_DIR) -> dict[tuple[int, int], ManifestEntry]:
+    """Return {(season, week): entry}; empty if no manifest has been written yet."""
+    p = manifest_path(cache_dir)
+    if not p.exists():
+        return {}
+    data = json.loads(p.read_text())
+    entries = (ManifestEntry(**e) for e in data.get("entries", []))
+    return {(e.season, e.week): e for e in entries}
+
+
+def save_manifest(entries: dict[tuple[int, int], ManifestEntry], cache_dir: Path = CACHE_DIR) -> Path:
+    p = manifest_path(cache_dir)
+    payload = {
+        "version": MANIFEST_VERSION,
+        "entries": [asdict(entries[k]) for k in sorted(entries)],
+    }
+    return write_text_atomic(p, json.dumps(payload, indent=1))
+
+
+def record_week(
+    df: pd.DataFrame,
+    path: Path,
+    season: int,
+    week: int,
+    cache_dir: Path = CACHE_DIR,
+) -> ManifestEntry:
+    """Update the manifest after writing `df` to `path`."""
+    entry = make_entry(df, path, season, week)
+    with file_lock(manifest_path(cache_dir)):
+        entries = load_manifest(cache_dir)
+        entries[(entry.season, entry.week)] = entry
+        save_manifest(entries, cache_dir)
+    return entry
+
+
+def rebuild_manifest(cache_dir: Path = CACHE_DIR) -> dict[tuple[int, int], ManifestEntry]:
+    """
+    Rebuild the manifest from the weekly files already on disk (one read per file).
+    fetched_at falls back to the file mtime since the original fetch time is unknown.
+    """
+    entries: dict[tuple[int, int], ManifestEntry] = {}
+    for s, w, p in week_files(cache_dir):
+        df = pd.read_parquet(p, columns=["home_points", "away_points"])
+        mtime = datetime.fromtimestamp(p.stat().st_mtime, tz=timezone.utc)
+        entries[(s, w)] = make_entry(df, p, s, w, fetched_at=mtime)
+    with file_lock(manifest_path(cache_dir)):
+        save_manifest(entries, cache_dir)
+    return entries
+
+
+def stale_weeks(
+    entries: dict[tuple[int, int], ManifestEntry],
+    season: int,
+    weeks: Iterable[int],
+) -> list[int]:
+    """Weeks that need a (re)fetch: not in the manifest, or not all games final."""
+    out = []
+    for w in weeks:
+        e = entries.get((int(season), int(w)))
+        if e is None or not e.final:
+            out.append(int(w))
+    return out
+
+
+def verify(
+    entries: dict[tuple[int, int], ManifestEntry],
+    cache_dir: Path = CACHE_DIR,
+    *,
+    checksums: bool = True,
+) -> list[tuple[tuple[int, int], str]]:
+    """
+    Compare the files on disk against the manifest. Returns [((season, week), problem)].
+    With checksums=False only existence and byte size are checked (no file reads).
+    """
+    problems = []
+    for key in sorted(entries):
+        e = entries[key]
+        p = Path(cache_dir) / e.path
+        if not p.exists():
+            problems.append((key, "missing file"))
+            continue
+        size = p.stat().st_size
+        if size != e.bytes:
+            problems.append((key, f"size {size} != manifest {e.bytes}"))
+        elif checksums and file_checksum(p) != e.sha256:
+            problems.append((key, "checksum mismatch"))
+
+    tracked = {e.path for e in entries.values()}
+    for s, w, p in week_files(cache_dir):
+        if p.name not in tracked:
+            problems.append(((s, w), "file not in manifest"))
+    return problems
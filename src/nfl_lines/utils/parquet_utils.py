@@ -1,20 +1,37 @@
 # src/nfl_lines/utils/parquet_utils.py
 from __future__ import annotations
 from pathlib import Path
+from typing import Optional, Sequence
 import pandas as pd
 
-from nfl_lines.utils.config import CACHE_DIR   # <-- NEW
+from nfl_lines.utils.config import CACHE_DIR, CACHE_LAYOUT   # <-- NEW
+from nfl_lines.utils.dataset import has_dataset, read_dataset, week_files
+from nfl_lines.utils.read_cache import read_parquet_many
 
-def load_all_parquet() -> pd.DataFrame:
-    files = sorted(CACHE_DIR.glob("*.parquet"))
+def _use_dataset() -> bool:
+    return CACHE_LAYOUT == "dataset" and has_dataset()
+
+def load_all_parquet(columns: Optional[Sequence[str]] = None, *, use_cache: bool = True) -> pd.DataFrame:
+    if _use_dataset():
+        return read_dataset(columns)
+    files = [p for _, _, p in week_files(CACHE_DIR)]
     if not files:
         raise FileNotFoundError(f"No parquet files found in {CACHE_DIR}")
-    dfs = [pd.read_parquet(f) for f in files]
-    return pd.concat(dfs, ignore_index=True)
+    return read_parquet_many(files, columns, use_cache=use_cache)
 
-def load_season(season: int) -> pd.DataFrame:
-    files = sorted(CACHE_DIR.glob(f"{season}_wk*.parquet"))
+def load_season(
+    season: int,
+    columns: Optional[Sequence[str]] = None,
+    weeks: Optional[Sequence[int]] = None,
+    *,
+    use_cache: bool = True,
+) -> pd.DataFrame:
+    if _use_dataset():
+        df = read_dataset(columns, seasons=[season], weeks=weeks)
+        if df.empty:
+            raise FileNotFoundError(f"No rows found for season {season} in the cache dataset")
+        return df
+    files = [p for _, w, p in week_files(CACHE_DIR, [season]) if weeks is None or w in weeks]
     if not files:
         raise FileNotFoundError(f"No parquet files found for season {season} in {CACHE_DIR}")
-    dfs = [pd.read_parquet(f) for f in files]
-    return pd.concat(dfs, ignore_index=True)
+    return read_parquet_many(files, columns, use_cache=use_cache)
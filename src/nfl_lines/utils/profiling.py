@@ -0,0 +1,59 @@
+# src/nfl_lines/utils/profiling.py
+from __future__ import annotations
+
+import functools
+from typing import Callable, Optional
+
+# Profiling hooks for the ingestion code (HTTP calls, cache reads, normalization).
+# nfl_lines does not depend on nfl_model, so the hooks are no-ops until an entry point
+# that collects timings installs a collector -- any object with timer(name) and
+# count(name, n), in practice nfl_model.profiling:
+#
+#   from nfl_model import profiling
+#   from nfl_lines.utils import profiling as lines_profiling
+#   profiling.enable(); lines_profiling.install(profiling)
+#
+# Everything is then recorded in (and dumped from) that collector's single registry.
+
+_collector = None
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullTimer()
+
+
+def install(collector: Optional[object]) -> None:
+    """Route the hooks below to `collector` (None switches them back off)."""
+    global _collector
+    _collector = collector
+
+
+def timer(name: str):
+    return _NULL if _collector is None else _collector.timer(name)
+
+
+def timed(name: str) -> Callable:
+    """Decorator form of timer(); the collector is looked up per call."""
+    def _wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            if _collector is None:
+                return fn(*args, **kwargs)
+            with _collector.timer(name):
+                return fn(*args, **kwargs)
+        return inner
+    return _wrap
+
+
+def count(name: str, n: float = 1) -> None:
+    if _collector is not None:
+        _collector.count(name, n)
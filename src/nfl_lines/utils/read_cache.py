@@ -0,0 +1,184 @@
+# src/nfl_lines/utils/read_cache.py
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Sequence
+
+import pandas as pd
+
+from nfl_lines.utils import profiling
+from nfl_lines.utils.config import READ_CACHE_MB
+
+# Process-wide cache of decoded parquet frames, so long-running jobs that reload the
+# same weekly files (get_week hits, load_season / load_all_parquet, live polling) read
+# and decode each file once.
+#
+#   key         (resolved path, columns)  or, for a concatenation, the tuple of paths
+#               (read_many reads its files straight from disk and caches only the
+#               concatenation, so the same rows are not held twice)
+#   validity    (mtime_ns, size) of every file, checked by one stat() per file per call
+#   budget      NFL_READ_CACHE_MB (default 512; 0 turns the cache off), LRU eviction
+#
+# Callers get a shallow copy of the cached frame: no data is copied, and pandas'
+# copy-on-write turns any write by the caller into a private copy, so the cached
+# frame never changes. Copy-on-write is always on from pandas 3; on older pandas
+# without pd.options.mode.copy_on_write = True callers get a deep copy instead
+# (slower, but an in-place write can't leak into the cache).
+#
+# Cache writes go through os.replace (utils/atomic.py), which always moves
+# (mtime, size), so a rewritten file is re-read on its next use.
+#
+# bypass() (or use_cache=False) reads straight from disk for one block/call;
+# stats() reports hits, misses, invalidations, evictions and bytes held.
+
+
+def _copy_on_write() -> bool:
+    return int(pd.__version__.split(".")[0]) >= 3 or pd.options.mode.copy_on_write is True
+
+
+def _handout(df: pd.DataFrame) -> pd.DataFrame:
+    """The caller's view of a cached frame: shallow under copy-on-write, deep otherwise."""
+    return df.copy(deep=not _copy_on_write())
+
+
+def _signature(path: Path) -> Optional[tuple[int, int]]:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class ReadCache:
+    def __init__(self, max_bytes: int):
+        self.max_bytes = int(max_bytes)
+        self._entries: OrderedDict = OrderedDict()   # key -> (signature, frame, nbytes)
+        self._bytes = 0
+        self._lock = threading.RLock()
+        self._local = threading.local()
+        self._stats = dict.fromkeys(("hits", "misses", "invalidations", "evictions", "bypassed"), 0)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0 and not getattr(self._local, "bypass", False)
+
+    @contextmanager
+    def bypass(self) -> Iterator[None]:
+        """Read from disk (and leave the cache untouched) inside this block, on this thread."""
+        prev = getattr(self._local, "bypass", False)
+        self._local.bypass = True
+        try:
+            yield
+        finally:
+            self._local.bypass = prev
+
+    def _bump(self, name: str, n: int = 1) -> None:
+        self._stats[name] += n
+        profiling.count(f"read_cache.{name}", n)
+
+    def _lookup(self, key, signature) -> Optional[pd.DataFrame]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._bump("misses")
+                return None
+            if entry[0] != signature:
+                self._drop(key)
+                self._bump("invalidations")
+                return None
+            self._entries.move_to_end(key)
+            self._bump("hits")
+            return _handout(entry[1])
+
+    def _store(self, key, signature, df: pd.DataFrame) -> None:
+        nbytes = int(df.memory_usage(deep=True).sum())
+        if nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._drop(key)
+            self._entries[key] = (signature, df, nbytes)
+            self._bytes += nbytes
+            while self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self._bump("evictions")
+
+    def _drop(self, key) -> None:
+        _, _, nbytes = self._entries.pop(key)
+        self._bytes -= nbytes
+
+    def read(self, path: Path | str, columns: Optional[Sequence[str]] = None, use_cache: bool = True) -> pd.DataFrame:
+        """pd.read_parquet(path, columns=columns), served from memory while the file is unchanged."""
+        if not (use_cache and self.enabled):
+            self._bump("bypassed")
+            return pd.read_parquet(path, columns=columns)
+        path = Path(path).resolve()
+        key = (str(path), tuple(columns) if columns is not None else None)
+        sig = _signature(path)
+        if sig is not None:
+            df = self._lookup(key, sig)
+            if df is not None:
+                return df
+        with profiling.timer("read_cache.read"):
+            df = pd.read_parquet(path, columns=columns)
+        # a write between stat() and the read makes the signature stale: that only costs a re-read
+        self._store(key, sig, df)
+        return _handout(df)
+
+    def read_many(
+        self, paths: Sequence[Path | str], columns: Optional[Sequence[str]] = None, use_cache: bool = True,
+    ) -> pd.DataFrame:
+        """pd.concat of pd.read_parquet over `paths` (ignore_index), cached as a whole while no file changes."""
+        if not (use_cache and self.enabled):
+            self._bump("bypassed")
+            return pd.concat([pd.read_parquet(p, columns=columns) for p in paths], ignore_index=True)
+        paths = [Path(p).resolve() for p in paths]
+        key = ("concat", tuple(map(str, paths)), tuple(columns) if columns is not None else None)
+        sig = tuple(_signature(p) for p in paths)
+        df = self._lookup(key, sig) if None not in sig else None
+        if df is not None:
+            return df
+        with profiling.timer("read_cache.read"):
+            df = pd.concat([pd.read_parquet(p, columns=columns) for p in paths], ignore_index=True)
+        self._store(key, sig, df)
+        return _handout(df)
+
+    def discard(self, path: Path | str) -> None:
+        """Forget every entry reading `path` (its own and concatenations including it)."""
+        p = str(Path(path).resolve())
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == p or (k[0] == "concat" and p in k[1])]:
+                self._drop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {**self._stats, "entries": len(self._entries), "bytes": self._bytes, "max_bytes": self.max_bytes}
+
+
+READ_CACHE = ReadCache(READ_CACHE_MB * (1 << 20))
+
+
+def read_parquet(path: Path | str, columns: Optional[Sequence[str]] = None, *, use_cache: bool = True) -> pd.DataFrame:
+    return READ_CACHE.read(path, columns, use_cache)
+
+
+def read_parquet_many(
+    paths: Sequence[Path | str], columns: Optional[Sequence[str]] = None, *, use_cache: bool = True,
+) -> pd.DataFrame:
+    return READ_CACHE.read_many(paths, columns, use_cache)
+
+
+def bypass():
+    return READ_CACHE.bypass()
+
+
+def stats() -> dict:
+    return READ_CACHE.stats()
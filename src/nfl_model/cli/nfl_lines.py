@@ -1,37 +1,83 @@
 from __future__ import annotations
 import argparse
 from pathlib import Path
+from typing import Optional
 import pandas as pd
 import yaml
 
+from nfl_model import profiling
 from nfl_model.config import Params, PipelineConfig
 from nfl_model.io.loaders import load_ratings, load_schedule
-from nfl_model.engine import Engine
+from nfl_model.io.ratings_store import RatingsStore
+from nfl_model.engine import Engine, merge_lines, merge_ratings as _merge
+from nfl_model.features import FeatureStore, season_of
+from nfl_model.pricing.greeks import GREEK_COLUMNS, price_greeks
+from nfl_model.pricing.margins import margin_table_for_cache
+from nfl_model.schemas import LineOutput
+from nfl_model.season import OUTPUT_COLUMNS, RatingsDir, StaticRatings, parse_weeks, price_season
+from nfl_model.travel import ScheduleContext
+from nfl_model.validation import check_frame
 
 
-def _merge(schedule, ratings):
-    r = ratings.set_index("team_key").to_dict(orient="index")
-    df = schedule.copy()
-    df["_rat_home"] = df["home_key"].map(r.get)
-    df["_rat_away"] = df["away_key"].map(r.get)
-    # Fail fast if any team missing
-    if df["_rat_home"].isna().any() or df["_rat_away"].isna().any():
-        missing = set(df.loc[df["_rat_home"].isna(), "home_key"]).union(set(df.loc[df["_rat_away"].isna(), "away_key"]))
-        raise ValueError(f"Missing ratings for: {missing}")
-    return df
+def _write(out: pd.DataFrame, args) -> None:
+    if args.out:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        out.to_csv(args.out, index=False)
+        print(f"[wrote] {args.out}")
+    else:
+        with pd.option_context("display.max_columns", None, "display.width", 200):
+            print(out)
 
 
-def main():
+def main(argv: Optional[list[str]] = None):
     ap = argparse.ArgumentParser(description="Produce NFL model lines from modular pipeline")
-    ap.add_argument("--ratings", required=True, type=Path)
-    ap.add_argument("--schedule", required=True, type=Path)
+    ap.add_argument("--ratings", required=False, type=Path)
+    ap.add_argument("--ratings-store", type=Path,
+                    help="Versioned ratings store (io.ratings_store) instead of --ratings; latest version unless --ratings-asof")
+    ap.add_argument("--ratings-asof", help="With --ratings-store: price with the version current at this UTC time")
+    ap.add_argument("--schedule", required=False, type=Path)
     ap.add_argument("--params", required=False, type=Path)
     ap.add_argument("--out", required=False, type=Path)
-    args = ap.parse_args()
+    ap.add_argument("--features-cache", required=False, type=Path,
+                    help="Parquet cache root; enables team features for factors such as recent_form")
+    ap.add_argument("--state", required=False, type=Path,
+                    help="Priced-lines parquet from the last run; reprice only games whose inputs changed")
+    ap.add_argument("--greeks", action="store_true",
+                    help="Add closed-form sensitivities to ratings and params (pricing.greeks.GREEK_COLUMNS)")
+    season = ap.add_argument_group("season mode", "price cached weeks of one season against as-of ratings")
+    season.add_argument("--season", type=int, help="Price this season's games from the parquet cache instead of --schedule")
+    season.add_argument("--weeks", help="Weeks to price, e.g. '1-18' or '1,3,5-7' (default: every cached week)")
+    season.add_argument("--cache", type=Path, help="Parquet cache root holding '{season}_wk{week}.parquet' (default: --features-cache)")
+    season.add_argument("--ratings-dir", type=Path,
+                        help="Ratings files '{season}_wk{week}.csv' / 'wk{week}.csv'; each week uses the latest at or before it")
+    season.add_argument("--workers", type=int, help="Worker processes across weeks (default: CPU count)")
+    profiling.add_cli_flags(ap)
+    args = ap.parse_args(argv)
+    if args.ratings_asof and not args.ratings_store:
+        ap.error("--ratings-asof needs --ratings-store")
+    if args.ratings is not None and args.ratings_store is not None:
+        ap.error("use one of --ratings or --ratings-store")
+    if args.season is None and ((args.ratings is None and args.ratings_store is None) or args.schedule is None):
+        ap.error("--ratings (or --ratings-store) and --schedule are required (or use --season)")
+    if args.season is not None:
+        if sum(x is not None for x in (args.ratings, args.ratings_dir, args.ratings_store)) != 1:
+            ap.error("--season needs exactly one of --ratings, --ratings-dir or --ratings-store")
+        if args.ratings_asof:
+            ap.error("--ratings-asof is not supported with --season (weeks use their own versions)")
+        if not (args.cache or args.features_cache):
+            ap.error("--season needs --cache (or --features-cache)")
+        if args.state:
+            ap.error("--state is not supported with --season")
+    if args.profile:
+        profiling.enable()
+    try:
+        _run(args)
+    finally:
+        if args.profile:
+            profiling.dump(args.profile, args.profile_out)
 
-    ratings = load_ratings(args.ratings)
-    schedule = load_schedule(args.schedule)
 
+def _run(args) -> None:
     params_d = {}
     pipe_d = {}
     if args.params and args.params.exists():
@@ -42,24 +88,69 @@ def main():
     params = Params(**params_d)
     pipe = PipelineConfig(**pipe_d)
 
-    merged = _merge(schedule, ratings)
-    eng = Engine(params, pipe)
-    out = eng.price(merged)
+    margins = None
+    if params.margin_model == "key_numbers" and not params.margin_table:
+        if not args.features_cache:
+            raise SystemExit("margin_model: key_numbers needs margin_table in --params or a --features-cache to build it from")
+        margins = margin_table_for_cache(args.features_cache, params.margin_sd, params.spread_cap)
 
-    cols = [
-        "week", "date", "away", "home", "neutral",
-        "model_spread_home", "model_total", "home_team_total", "away_team_total",
-        "home_win_prob", "away_win_prob", "ml_home", "ml_away",
-    ]
-    out = out[cols]
+    if args.season is not None:
+        if args.ratings_store:
+            source = RatingsStore(args.ratings_store)
+        else:
+            source = RatingsDir(args.ratings_dir) if args.ratings_dir else StaticRatings(args.ratings)
+        weeks = parse_weeks(args.weeks) if args.weeks else None
+        out = price_season(args.cache or args.features_cache, args.season, weeks, source, params, pipe,
+                           features_cache=args.features_cache, margins=margins, workers=args.workers,
+                           greeks=args.greeks)
+        missing = sorted(set(weeks or ()) - set(out["week"]))
+        if missing:
+            print(f"[season] no cached games for week(s) {missing}")
+        print(f"[season] priced {len(out)} games over {out['week'].nunique()} week(s) of {args.season}")
+        out = check_frame(out, LineOutput, "model lines")
+        _write(out, args)
+        return
 
-    if args.out:
-        args.out.parent.mkdir(parents=True, exist_ok=True)
-        out.to_csv(args.out, index=False)
-        print(f"[wrote] {args.out}")
+    if args.ratings_store:
+        store = RatingsStore(args.ratings_store)
+        version = store.version_at(args.ratings_asof) if args.ratings_asof else store.latest()
+        print(f"[ratings] {store.label(version)}")
+        ratings = store.view(version)
     else:
-        with pd.option_context("display.max_columns", None, "display.width", 200):
-            print(out)
+        ratings = load_ratings(args.ratings)
+    schedule = load_schedule(args.schedule)
+    merged = _merge(schedule, ratings)
+    features = FeatureStore(args.features_cache) if args.features_cache else None
+    eng = Engine(params, pipe, features, margins)
+    cache = args.cache or args.features_cache
+    if eng.uses_schedule and cache:
+        # rest days across the schedule's first week: previous games come from the cache
+        seasons = set(season_of(schedule["date"]).tolist())
+        eng.schedule = ScheduleContext.from_cache(cache, seasons | {s - 1 for s in seasons}, schedule)
+    if args.state:
+        previous = pd.read_parquet(args.state) if args.state.exists() else None
+        run = eng.price_incremental(merged, previous)
+        out = run.lines
+        check_frame(out[OUTPUT_COLUMNS], LineOutput, "model lines")
+        state = merge_lines(previous, out.drop(columns=["_rat_home", "_rat_away"]))
+        args.state.parent.mkdir(parents=True, exist_ok=True)
+        tmp = args.state.with_name(args.state.name + ".tmp")
+        state.to_parquet(tmp, index=False)
+        tmp.replace(args.state)
+        print(f"[incremental] repriced {run.repriced} of {len(out)} games; {len(run.moved)} line(s) moved; "
+              f"{len(state)} stored")
+        if not run.moved.empty:
+            with pd.option_context("display.max_columns", None, "display.width", 200):
+                print(run.moved)
+        if args.greeks:
+            out[GREEK_COLUMNS] = price_greeks(out["model_spread_home"], out["model_total"], out["neutral"].fillna(0),
+                                              params, pipe, eng.margins, out["home_win_prob"]).to_numpy()
+    else:
+        out = eng.price(merged, greeks=args.greeks)
+
+    check_frame(out[OUTPUT_COLUMNS], LineOutput, "model lines")
+    out = out[OUTPUT_COLUMNS + (GREEK_COLUMNS if args.greeks else [])]
+    _write(out, args)
 
 if __name__ == "__main__":
     main()
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 from pydantic import BaseModel, Field
-from typing import List, Literal
+from typing import List, Literal, Optional
 
 class Params(BaseModel):
     home_field_points: float = 1.65
@@ -13,6 +13,15 @@ class Params(BaseModel):
     margin_sd: float = 13.45
     spread_cap: float = 30.0
     use_off_def_for_total: bool = True
+    form_weight: float = 0.0  # recent_form: points of spread per point of EWMA margin edge
+    margin_model: Literal["normal", "key_numbers"] = "normal"  # key_numbers: empirical table (pricing.margins)
+    margin_table: Optional[str] = None  # .npz from MarginTable.save; else built from --features-cache
+    rest_points_per_day: float = 0.1  # rest_days factor; rest difference capped at rest_cap_days
+    rest_cap_days: float = 7.0
+    travel_points_per_1000mi: float = 0.3  # travel factor
+    tz_points_per_hour: float = 0.3  # timezone_shift factor
+    total_sd: float = 10.0
+    margin_total_rho: Optional[float] = None  # pricing.joint; None: fitted from the long table (else 0)
 
 class PipelineConfig(BaseModel):
     spread_factors: List[str] = Field(default_factory=lambda: [
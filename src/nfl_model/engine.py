@@ -4,45 +4,237 @@
 from __future__ import annotations
 
 from . import factors
+from . import profiling
 
+import hashlib
+import json
 from dataclasses import dataclass
+from typing import Optional
+import numpy as np
 import pandas as pd
 
 from .config import Params, PipelineConfig
+from .features import FeatureStore
 from .models.spread_model import SpreadModel
 from .models.total_model import TotalModel
-from .pricing.odds import win_prob_from_spread, american_odds_from_prob
+from .pricing.greeks import GREEK_COLUMNS, price_greeks
+from .pricing.margins import MarginTable
+from .pricing.odds import american_odds_from_probs, win_prob_from_spread, american_odds_from_prob
+from .travel import SCHEDULE_COLUMNS, ScheduleContext, schedule_features
+
+# Identity of a game across runs, and the columns `price` adds.
+GAME_KEY = ["week", "date", "home_key", "away_key"]
+LINE_COLUMNS = [
+    "model_spread_home", "home_win_prob", "away_win_prob", "ml_home", "ml_away",
+    "model_total", "home_team_total", "away_team_total",
+]
+MOVED_COLUMNS = ["model_spread_home", "model_total", "ml_home", "ml_away"]
+# Factors reading travel.SCHEDULE_COLUMNS from game_row
+SCHEDULE_FACTORS = {"rest_days", "travel", "timezone_shift"}
+
+
+def _digest(obj) -> str:
+    return hashlib.sha256(json.dumps(obj, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _key_strings(df: pd.DataFrame) -> pd.Index:
+    keys = GAME_KEY + (["season"] if "season" in df.columns else [])
+    # compared as strings: a state file read back from CSV needn't keep the slate's dtypes
+    cols = [df[k].astype(str) for k in keys]
+    return pd.Index(cols[0].str.cat(cols[1:], sep="|", na_rep=""))
+
+
+@profiling.timed("merge")
+def merge_ratings(schedule: pd.DataFrame, ratings: pd.DataFrame) -> pd.DataFrame:
+    """Attach each side's ratings row (dict) as '_rat_home' / '_rat_away', keyed by team_key."""
+    r = ratings.set_index("team_key").to_dict(orient="index")
+    df = schedule.copy()
+    df["_rat_home"] = df["home_key"].map(r.get)
+    df["_rat_away"] = df["away_key"].map(r.get)
+    # Fail fast if any team missing
+    if df["_rat_home"].isna().any() or df["_rat_away"].isna().any():
+        missing = set(df.loc[df["_rat_home"].isna(), "home_key"]).union(set(df.loc[df["_rat_away"].isna(), "away_key"]))
+        raise ValueError(f"Missing ratings for: {missing}")
+    profiling.count("rows.merged", len(df))
+    return df
+
+
+def merge_lines(previous: Optional[pd.DataFrame], lines: pd.DataFrame) -> pd.DataFrame:
+    """
+    Stored lines updated with `lines`: rows with a key in both are replaced in place,
+    new keys are appended, and every other stored row (other weeks, simulations) is kept.
+    """
+    if previous is None or previous.empty:
+        return lines.reset_index(drop=True)
+    both = pd.concat([previous, lines], ignore_index=True)
+    keys = _key_strings(both)
+    codes = pd.factorize(keys)[0]              # first appearance order
+    last = ~keys.duplicated(keep="last")       # the newest row per key
+    return both[last].iloc[np.argsort(codes[last], kind="stable")].reset_index(drop=True)
+
+
+@dataclass
+class IncrementalRun:
+    lines: pd.DataFrame     # full priced slate, with '_fingerprint'
+    moved: pd.DataFrame     # repriced games whose lines changed (prev_<col> alongside)
+    repriced: int           # games actually run through the models
+
 
 @dataclass
 class Engine:
     params: Params
     pipe: PipelineConfig
+    features: Optional[FeatureStore] = None
+    margins: Optional[MarginTable] = None
+    schedule: Optional[ScheduleContext] = None   # rest-day history; default: the slate being priced
 
     def __post_init__(self):
         self._spread_model = SpreadModel(self.params, self.pipe)
         self._total_model = TotalModel(self.params, self.pipe)
+        self._schedule_inputs = bool(SCHEDULE_FACTORS & set(self.pipe.spread_factors + self.pipe.total_factors))
+        if self.params.margin_model == "key_numbers" and self.margins is None:
+            if not self.params.margin_table:
+                raise ValueError("margin_model 'key_numbers' needs a MarginTable (margin_table path or a features cache)")
+            self.margins = MarginTable.load(self.params.margin_table)
 
-    def price(self, merged: pd.DataFrame) -> pd.DataFrame:
-        df = merged.copy()
+    @property
+    def uses_schedule(self) -> bool:
+        return self._schedule_inputs
+
+    def with_schedule(self, merged: pd.DataFrame) -> pd.DataFrame:
+        """`merged` plus SCHEDULE_COLUMNS (rest, travel, time zones) when a schedule factor is enabled."""
+        if not self._schedule_inputs or set(SCHEDULE_COLUMNS) <= set(merged.columns):
+            return merged
+        with profiling.timer("engine.schedule"):
+            sched = schedule_features(merged, self.schedule)
+        return pd.concat([merged, sched], axis=1)
+
+    @profiling.timed("engine.price")
+    def price(self, merged: pd.DataFrame, greeks: bool = False) -> pd.DataFrame:
+        """Lines for `merged` (merge_ratings output); greeks=True adds pricing.greeks.GREEK_COLUMNS."""
+        profiling.count("rows.priced", len(merged))
+        df = self.with_schedule(merged).copy()
+        if self.features is not None:
+            with profiling.timer("engine.features"):
+                feats_home, feats_away = self.features.for_games(df)
+        else:
+            feats_home = feats_away = [{}] * len(df)
         # Compute spread & totals
-        df["model_spread_home"] = [
-            self._spread_model.compute(rh, ra, g)
-            for rh, ra, g in zip(
-                df["_rat_home"], df["_rat_away"], df.to_dict(orient="records")
-            )
-        ]
-        df["home_win_prob"] = df["model_spread_home"].apply(lambda s: win_prob_from_spread(s, self.params.margin_sd))
-        df["away_win_prob"] = 1.0 - df["home_win_prob"]
-        df["ml_home"] = df["home_win_prob"].apply(american_odds_from_prob)
-        df["ml_away"] = df["away_win_prob"].apply(american_odds_from_prob)
-
-        df["model_total"] = [
-            self._total_model.compute(rh, ra, g)
-            for rh, ra, g in zip(
-                df["_rat_home"], df["_rat_away"], df.to_dict(orient="records")
-            )
-        ]
+        with profiling.timer("engine.spread"):
+            df["model_spread_home"] = [
+                self._spread_model.compute(rh, ra, g, fh, fa)
+                for rh, ra, g, fh, fa in zip(
+                    df["_rat_home"], df["_rat_away"], df.to_dict(orient="records"), feats_home, feats_away
+                )
+            ]
+        with profiling.timer("engine.odds"):
+            if self.params.margin_model == "key_numbers":
+                df["home_win_prob"] = self.margins.win_prob(df["model_spread_home"].to_numpy(dtype=float))
+                df["away_win_prob"] = 1.0 - df["home_win_prob"]
+                df["ml_home"] = american_odds_from_probs(df["home_win_prob"])
+                df["ml_away"] = american_odds_from_probs(df["away_win_prob"])
+            else:
+                df["home_win_prob"] = df["model_spread_home"].apply(lambda s: win_prob_from_spread(s, self.params.margin_sd))
+                df["away_win_prob"] = 1.0 - df["home_win_prob"]
+                df["ml_home"] = df["home_win_prob"].apply(american_odds_from_prob)
+                df["ml_away"] = df["away_win_prob"].apply(american_odds_from_prob)
+
+        with profiling.timer("engine.total"):
+            df["model_total"] = [
+                self._total_model.compute(rh, ra, g, fh, fa)
+                for rh, ra, g, fh, fa in zip(
+                    df["_rat_home"], df["_rat_away"], df.to_dict(orient="records"), feats_home, feats_away
+                )
+            ]
         df["home_team_total"] = (df["model_total"] + df["model_spread_home"]) / 2.0
         df["away_team_total"] = df["model_total"] - df["home_team_total"]
 
+        if greeks:
+            with profiling.timer("engine.greeks"):
+                g = price_greeks(df["model_spread_home"], df["model_total"], df["neutral"].fillna(0),
+                                 self.params, self.pipe, self.margins, df["home_win_prob"])
+            df[GREEK_COLUMNS] = g.to_numpy()
         return df
+
+    def params_hash(self) -> str:
+        table = self.margins.digest if self.params.margin_model == "key_numbers" else None
+        return _digest([self.params.model_dump(), self.pipe.model_dump()] + ([table] if table else []))
+
+    def fingerprints(self, merged: pd.DataFrame, feats_home=None, feats_away=None) -> pd.Series:
+        """
+        Per-game hash of everything `price` reads: both teams' rating rows, the neutral
+        flag, params + pipeline, the teams' features when a FeatureStore is set, and the
+        rest/travel inputs when a schedule factor is on. Rating rows are hashed once per team.
+        """
+        merged = self.with_schedule(merged)
+        team_hash: dict[str, str] = {}
+        for key, row in zip(
+            pd.concat([merged["home_key"], merged["away_key"]]),
+            pd.concat([merged["_rat_home"], merged["_rat_away"]]),
+        ):
+            if key not in team_hash:
+                team_hash[key] = _digest(row)
+        ph = self.params_hash()
+        feats_home = feats_home if feats_home is not None else [None] * len(merged)
+        feats_away = feats_away if feats_away is not None else [None] * len(merged)
+        sched = (merged[SCHEDULE_COLUMNS].to_numpy(dtype=float).round(6).tolist()
+                 if self._schedule_inputs else [None] * len(merged))
+        fps = [
+            _digest([team_hash[h], team_hash[a], int(n or 0), ph, fh, fa] + ([sc] if sc is not None else []))[:32]
+            for h, a, n, fh, fa, sc in zip(merged["home_key"], merged["away_key"], merged["neutral"],
+                                           feats_home, feats_away, sched)
+        ]
+        return pd.Series(fps, index=merged.index, name="_fingerprint")
+
+    def price_incremental(self, merged: pd.DataFrame, previous: Optional[pd.DataFrame] = None) -> IncrementalRun:
+        """
+        Price only games whose fingerprint differs from `previous` (an earlier
+        `IncrementalRun.lines`); reuse stored lines for the rest.
+        """
+        merged = self.with_schedule(merged)
+        feats_home = feats_away = None
+        if self.features is not None:
+            feats_home, feats_away = self.features.for_games(merged)
+        fp = self.fingerprints(merged, feats_home, feats_away)
+
+        df = merged.copy()
+        prev_pos = np.full(len(df), -1)
+        if previous is not None and not previous.empty and "_fingerprint" in previous.columns:
+            prev = previous[~_key_strings(previous).duplicated(keep="last")]
+            prev_pos = _key_strings(prev).get_indexer(_key_strings(df))
+            hit = prev_pos >= 0
+            same = np.zeros(len(df), dtype=bool)
+            same[hit] = prev["_fingerprint"].to_numpy()[prev_pos[hit]] == fp.to_numpy()[hit]
+        else:
+            prev = None
+            same = np.zeros(len(df), dtype=bool)
+
+        todo = ~same
+        for c in LINE_COLUMNS:
+            df[c] = prev[c].to_numpy()[prev_pos].copy() if prev is not None else np.nan
+        if todo.any():
+            priced = self.price(merged[todo])
+            for c in LINE_COLUMNS:
+                col = df[c].to_numpy(dtype=float, copy=True)
+                col[todo] = priced[c].to_numpy(dtype=float)
+                df[c] = col
+        for c in ("ml_home", "ml_away"):
+            df[c] = df[c].astype(int)
+        df["_fingerprint"] = fp
+
+        changed = todo & (prev_pos >= 0)       # a game without stored lines is new, not moved
+        if prev is not None:
+            old = {c: np.where(prev_pos >= 0, prev[c].to_numpy()[prev_pos], np.nan) for c in MOVED_COLUMNS}
+            same_line = np.ones(len(df), dtype=bool)
+            for c in MOVED_COLUMNS:
+                same_line &= np.isclose(df[c].to_numpy(dtype=float), old[c].astype(float), rtol=0, atol=1e-9)
+            changed &= ~same_line
+        else:
+            old = {c: np.full(len(df), np.nan) for c in MOVED_COLUMNS}
+        moved = df.loc[changed, [c for c in ("week", "date", "away", "home") if c in df.columns]].copy()
+        for c in MOVED_COLUMNS:
+            prev_vals = pd.Series(old[c][changed], index=moved.index, dtype=float)
+            moved[f"prev_{c}"] = prev_vals.astype("Int64") if c.startswith("ml_") else prev_vals
+            moved[c] = df.loc[changed, c]
+        profiling.count("engine.reused", int(same.sum()))
+        return IncrementalRun(lines=df, moved=moved.reset_index(drop=True), repriced=int(todo.sum()))
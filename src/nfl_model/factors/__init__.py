@@ -2,6 +2,8 @@
 from .home_field import HomeField      # registers "home_field"
 from .qb_adjust import QBAdjust        # registers "qb_adjust"
 from .off_def_total import OffDefTotal # registers "off_def_total"
+from .recent_form import RecentForm    # registers "recent_form"
+from .rest_travel import RestDays, Travel, TimezoneShift  # registers "rest_days", "travel", "timezone_shift"
 
-__all__ = ["HomeField", "QBAdjust", "OffDefTotal"]
+__all__ = ["HomeField", "QBAdjust", "OffDefTotal", "RecentForm", "RestDays", "Travel", "TimezoneShift"]
 
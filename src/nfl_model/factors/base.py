@@ -1,7 +1,7 @@
 ## `src/nfl_model/factors/base.py`
 
 from __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any
 
 @dataclass
@@ -10,6 +10,9 @@ class FactorContext:
     ratings_row_home: dict
     ratings_row_away: dict
     game_row: dict
+    # Pre-game team features (see nfl_model.features); empty unless the Engine has a FeatureStore
+    features_home: dict = field(default_factory=dict)
+    features_away: dict = field(default_factory=dict)
 
 class Factor:
     """Base factor interface. Implement `apply` and return a dict of adjustments.
@@ -0,0 +1,16 @@
+## `src/nfl_model/factors/recent_form.py`
+
+from __future__ import annotations
+import math
+from .base import Factor, FactorContext
+from ..registry import register_factor
+
+@register_factor("recent_form")
+class RecentForm(Factor):
+    """Spread nudge from the teams' EWMA scoring margins (needs an Engine FeatureStore)."""
+    def apply(self, ctx: FactorContext):
+        h = ctx.features_home.get("margin_ewm")
+        a = ctx.features_away.get("margin_ewm")
+        if h is None or a is None or math.isnan(h) or math.isnan(a):
+            return {"spread_delta": 0.0}
+        return {"spread_delta": ctx.params.form_weight * (h - a)}
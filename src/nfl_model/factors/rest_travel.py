@@ -0,0 +1,41 @@
+## `src/nfl_model/factors/rest_travel.py`
+
+from __future__ import annotations
+import math
+from .base import Factor, FactorContext
+from ..registry import register_factor
+
+# Schedule factors. Their inputs (nfl_model.travel.SCHEDULE_COLUMNS) are computed once
+# per slate by the Engine and arrive in game_row; missing (NaN) inputs contribute 0.
+
+def _num(row: dict, key: str) -> float:
+    v = row.get(key)
+    return float("nan") if v is None else float(v)
+
+@register_factor("rest_days")
+class RestDays(Factor):
+    """Rest advantage: points per day of extra rest, difference capped at rest_cap_days."""
+    def apply(self, ctx: FactorContext):
+        diff = _num(ctx.game_row, "home_rest_days") - _num(ctx.game_row, "away_rest_days")
+        if math.isnan(diff):
+            return {"spread_delta": 0.0}
+        cap = ctx.params.rest_cap_days
+        return {"spread_delta": ctx.params.rest_points_per_day * max(-cap, min(cap, diff))}
+
+@register_factor("travel")
+class Travel(Factor):
+    """Distance disadvantage: points per 1000 miles the away team travels beyond the home team."""
+    def apply(self, ctx: FactorContext):
+        diff = _num(ctx.game_row, "away_travel_mi") - _num(ctx.game_row, "home_travel_mi")
+        if math.isnan(diff):
+            return {"spread_delta": 0.0}
+        return {"spread_delta": ctx.params.travel_points_per_1000mi * diff / 1000.0}
+
+@register_factor("timezone_shift")
+class TimezoneShift(Factor):
+    """Body-clock disadvantage: points per time zone the away team crosses beyond the home team."""
+    def apply(self, ctx: FactorContext):
+        diff = abs(_num(ctx.game_row, "away_tz_shift")) - abs(_num(ctx.game_row, "home_tz_shift"))
+        if math.isnan(diff):
+            return {"spread_delta": 0.0}
+        return {"spread_delta": ctx.params.tz_points_per_hour * diff}
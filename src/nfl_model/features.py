@@ -0,0 +1,189 @@
+## `src/nfl_model/features.py`
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .io.files import write_atomic
+from .io.long_builder import _resolve_cache_root
+from .io.long_store import STORE_DIRNAME, load_team_perspective_long, store_fingerprint
+from .teams import team_codes
+
+# Rolling team feature store over the team-perspective long table.
+#
+# `compute_team_features` gives each team's *post-game* state after every week it
+# played. Lookups for (team, season, week) are strict as-of joins on that state, so
+# week W only ever sees games from weeks before W. `pregame_features` is the same
+# thing aligned to the long table's own rows (a groupby-shift).
+
+FEATURE_VERSION = 2
+STAT_COLUMNS = [
+    "games",
+    "pf_roll", "pa_roll", "margin_roll",
+    "pf_ewm", "pa_ewm", "margin_ewm",
+    "home_margin_ewm", "away_margin_ewm",
+]
+
+
+@dataclass(frozen=True)
+class FeatureConfig:
+    window: int = 4          # rolling window, in games
+    halflife: float = 3.0    # EWMA half-life, in games
+
+
+def season_of(dates: Iterable) -> np.ndarray:
+    """NFL season for game dates: January/February games belong to the previous season."""
+    d = pd.to_datetime(pd.Series(dates), errors="coerce")
+    return (d.dt.year - (d.dt.month < 3)).to_numpy()
+
+
+def _week_key(season, week) -> np.ndarray:
+    return np.asarray(season, dtype=np.int64) * 100 + np.asarray(week, dtype=np.int64)
+
+
+def compute_team_features(long_df: pd.DataFrame, config: FeatureConfig = FeatureConfig()) -> pd.DataFrame:
+    """
+    Post-game state per (team, season, week), from games up to and including that week.
+    Rows are sorted by (t, team_code) where t = season*100 + week.
+    """
+    week = pd.to_numeric(long_df["week"], errors="coerce")
+    df = pd.DataFrame({
+        "team_code": team_codes(long_df["team"]),
+        "season": long_df["season"].to_numpy(dtype=np.int64),
+        "week": week,
+        "is_home": long_df["is_home"].to_numpy(dtype=bool),
+        "pf": pd.to_numeric(long_df["points_for"], errors="coerce").astype(float),
+        "pa": pd.to_numeric(long_df["points_against"], errors="coerce").astype(float),
+    })[week.notna().to_numpy()]
+    df["week"] = df["week"].astype(np.int64)
+    df["t"] = _week_key(df["season"], df["week"])
+    df["margin"] = df["pf"] - df["pa"]
+    df["home_margin"] = df["margin"].where(df["is_home"])
+    df["away_margin"] = df["margin"].where(~df["is_home"])
+    df = df.sort_values(["team_code", "t"], kind="mergesort").reset_index(drop=True)
+
+    g = df.groupby("team_code", sort=False)
+    out = df[["team_code", "season", "week", "t"]].copy()
+    # scheduled / unscored rows keep their place in the timeline but aren't games played
+    out["games"] = (df["pf"].notna() & df["pa"].notna()).astype(np.int64).groupby(df["team_code"]).cumsum()
+    for name in ("pf", "pa", "margin"):
+        out[f"{name}_roll"] = g[name].rolling(config.window, min_periods=1).mean().droplevel(0)
+        out[f"{name}_ewm"] = g[name].ewm(halflife=config.halflife).mean().droplevel(0)
+    for name in ("home_margin", "away_margin"):
+        out[f"{name}_ewm"] = g[name].ewm(halflife=config.halflife, ignore_na=True).mean().droplevel(0)
+    return out.sort_values(["t", "team_code"], kind="mergesort").reset_index(drop=True)
+
+
+def asof_features(
+    state: pd.DataFrame,
+    teams: Iterable,
+    seasons: Iterable[int],
+    weeks: Iterable[int],
+) -> pd.DataFrame:
+    """
+    Features for each (team, season, week) query from the latest state strictly before
+    that week, in query order. rest_days = 7 * weeks since the team's last game that
+    season (NaN for its first game of a season). `teams` are names or integer team codes.
+    """
+    teams = teams if isinstance(teams, pd.Series) else pd.Series(list(teams))
+    if pd.api.types.is_integer_dtype(teams.dtype):
+        code = teams.to_numpy(dtype=np.int8)
+        if (code < 0).any():
+            raise ValueError("Unknown team(s) (code -1) in feature query")
+    else:
+        code = team_codes(teams)
+    q = pd.DataFrame({
+        "team_code": code,
+        "q_season": np.asarray(list(seasons), dtype=np.int64),
+        "q_week": np.asarray(list(weeks), dtype=np.int64),
+    })
+    q["t"] = _week_key(q["q_season"], q["q_week"])
+    q["_row"] = np.arange(len(q))
+    q = q.sort_values("t", kind="mergesort")
+    m = pd.merge_asof(q, state, on="t", by="team_code", allow_exact_matches=False)
+    same_season = (m["season"] == m["q_season"]).to_numpy()
+    m["rest_days"] = np.where(same_season, 7.0 * (m["q_week"] - m["week"]), np.nan)
+    m = m.sort_values("_row").reset_index(drop=True)
+    return m[STAT_COLUMNS + ["rest_days"]]
+
+
+def pregame_features(long_df: pd.DataFrame, config: FeatureConfig = FeatureConfig()) -> pd.DataFrame:
+    """
+    Pre-game features aligned row-for-row with `long_df`: each team's post-game state
+    shifted back one game (groupby-shift), plus rest_days.
+    """
+    state = compute_team_features(long_df, config)
+    by_team = state.sort_values(["team_code", "t"], kind="mergesort")
+    g = by_team.groupby("team_code", sort=False)
+    prior = g[STAT_COLUMNS].shift(1)
+    prev_season = g["season"].shift(1)
+    prior["rest_days"] = np.where(prev_season == by_team["season"], 7.0 * g["week"].diff(), np.nan)
+    prior["team_code"] = by_team["team_code"]
+    prior["t"] = by_team["t"]
+
+    keys = pd.DataFrame({
+        "team_code": team_codes(long_df["team"]),
+        "t": _week_key(long_df["season"], pd.to_numeric(long_df["week"], errors="coerce").fillna(-1)),
+    })
+    out = keys.merge(prior, on=["team_code", "t"], how="left")
+    out.index = long_df.index
+    return out[STAT_COLUMNS + ["rest_days"]]
+
+
+class FeatureStore:
+    """
+    Team features over a parquet cache, persisted to '<cache_root>/derived/' and keyed
+    by the cache fingerprint, so history is only recomputed when weekly files change.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | str,
+        config: FeatureConfig = FeatureConfig(),
+        store_dir: Optional[Path | str] = None,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.config = config
+        self.store_dir = Path(store_dir) if store_dir else _resolve_cache_root(cache_dir) / STORE_DIRNAME
+        self._state: Optional[pd.DataFrame] = None
+
+    def state(self) -> pd.DataFrame:
+        if self._state is None:
+            long_df = load_team_perspective_long(self.cache_dir, store_dir=self.store_dir)
+            # '<config>_<data>' names: a rebuild only replaces files for the same config, so
+            # stores with other configs on the same cache keep theirs
+            config_key = hashlib.sha256(f"{self.config}|{FEATURE_VERSION}".encode()).hexdigest()[:8]
+            data_key = store_fingerprint(self.cache_dir, self.store_dir)[:16]
+            path = self.store_dir / f"team_features_{config_key}_{data_key}.parquet"
+            if path.exists():
+                self._state = pd.read_parquet(path)
+            else:
+                self._state = compute_team_features(long_df, self.config)
+                self.store_dir.mkdir(parents=True, exist_ok=True)
+                state = self._state
+                write_atomic(path, lambda p: state.to_parquet(p, index=False))
+                for old in self.store_dir.glob(f"team_features_{config_key}_*.parquet"):
+                    if old != path:
+                        old.unlink(missing_ok=True)
+        return self._state
+
+    def asof(self, teams: Iterable, seasons: Iterable[int], weeks: Iterable[int]) -> pd.DataFrame:
+        return asof_features(self.state(), teams, seasons, weeks)
+
+    def for_games(self, games: pd.DataFrame) -> tuple[list[dict], list[dict]]:
+        """
+        Per-game (home, away) feature dicts for a schedule/merged frame with home_key,
+        away_key (or the loaders' home_code, away_code), week and either season or date.
+        """
+        season = games["season"].to_numpy() if "season" in games.columns else season_of(games["date"])
+        week = games["week"].to_numpy()
+        side = "code" if {"home_code", "away_code"} <= set(games.columns) else "key"
+        home = self.asof(games[f"home_{side}"], season, week)
+        away = self.asof(games[f"away_{side}"], season, week)
+        return home.to_dict(orient="records"), away.to_dict(orient="records")
@@ -0,0 +1,39 @@
+## `src/nfl_model/io/files.py`
+
+from __future__ import annotations
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable
+
+# File helpers shared by the derived stores (long table, features, margin tables) and
+# the pipeline runner. They mirror nfl_lines.utils.atomic / manifest.file_checksum,
+# which the packaged nfl_model can't import.
+
+
+def write_atomic(path: Path, write: Callable[[Path], object]) -> None:
+    """
+    write(tmp) to a unique sibling, then fsync it and rename it over `path`; concurrent
+    writers never mix and readers never see a half-written file.
+    """
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    os.close(fd)
+    os.chmod(tmp, 0o644)  # mkstemp creates 0600; derived files are shared between jobs
+    try:
+        write(Path(tmp))
+        with open(tmp, "rb") as fh:
+            os.fsync(fh.fileno())
+        os.replace(tmp, path)
+    finally:
+        Path(tmp).unlink(missing_ok=True)
+
+
+def file_checksum(path: Path, chunk_size: int = 1 << 20) -> str:
+    """sha256 of a file's contents, read in chunks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(chunk_size), b""):
+            h.update(chunk)
+    return h.hexdigest()
@@ -1,15 +1,35 @@
 ## `src/nfl_model/io/loaders.py`
 
 from __future__ import annotations
+import warnings
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from typing import Iterable, Optional
+
+from .. import profiling
+from ..teams import TEAM_CODES, resolve_teams, team_codes
+from ..schemas import Game, TeamRating
+from ..validation import check_frame
+from .long_builder import WEEK_FILE_RE, _list_week_files, _resolve_cache_root, _resolve_columns
 
 REQUIRED_RATINGS = {"team", "power"}
 REQUIRED_SCHEDULE = {"week", "date", "away", "home"}
 
-def _norm_team(x: str) -> str:
-    return x.strip().upper()
+def _team_columns(df: pd.DataFrame, sides: dict[str, str]) -> None:
+    """
+    Add '<side>_code' (int8 TEAM_CODES index, -1 for unknown teams) and '<side>_key'
+    (join key: abbreviation, or the stripped upper-cased name) for team columns
+    {column: side}, resolving every column through one alias lookup.
+    """
+    cols = list(sides)
+    codes, keys = resolve_teams(pd.concat([df[c] for c in cols], ignore_index=True))
+    n = len(df)
+    for i, c in enumerate(cols):
+        df[f"{sides[c]}_code"] = codes[i * n:(i + 1) * n]
+        df[f"{sides[c]}_key"] = keys[i * n:(i + 1) * n]
 
+@profiling.timed("load.ratings")
 def load_ratings(path: str | Path) -> pd.DataFrame:
     df = pd.read_csv(path)
     cols = {c.lower(): c for c in df.columns}
@@ -17,9 +37,12 @@ def load_ratings(path: str | Path) -> pd.DataFrame:
     if not REQUIRED_RATINGS.issubset(lower.columns):
         missing = REQUIRED_RATINGS - set(lower.columns)
         raise ValueError(f"ratings missing: {missing}")
-    lower["team_key"] = lower["team"].map(_norm_team)
+    check_frame(lower, TeamRating, f"ratings {path}")
+    _team_columns(lower, {"team": "team"})
+    profiling.count("rows.ratings", len(lower))
     return lower
 
+@profiling.timed("load.schedule")
 def load_schedule(path: str | Path) -> pd.DataFrame:
     df = pd.read_csv(path).rename(columns=str.lower)
     if not REQUIRED_SCHEDULE.issubset(df.columns):
@@ -27,6 +50,57 @@ def load_schedule(path: str | Path) -> pd.DataFrame:
         raise ValueError(f"schedule missing: {missing}")
     if "neutral" not in df.columns:
         df["neutral"] = 0
-    df["home_key"] = df["home"].map(_norm_team)
-    df["away_key"] = df["away"].map(_norm_team)
+    check_frame(df, Game, f"schedule {path}")
+    _team_columns(df, {"home": "home", "away": "away"})
+    profiling.count("rows.schedule", len(df))
+    return df
+
+@profiling.timed("load.cached_schedule")
+def load_cached_schedule(cache_dir: str | Path, season: int, weeks: Optional[Iterable[int]] = None) -> pd.DataFrame:
+    """
+    A season's games from the weekly parquet cache ('{season}_wk{week}.parquet') as a
+    schedule frame like load_schedule's, plus 'season'. Full and historical team names
+    become abbreviations; scores are dropped. Games without a usable date can't be
+    priced or placed in the calendar: they are skipped with a warning.
+    """
+    cache_root = _resolve_cache_root(cache_dir)
+    wanted = None if weeks is None else {int(w) for w in weeks}
+    frames = []
+    for f in _list_week_files(cache_root, [int(season)]):
+        week = int(WEEK_FILE_RE.search(f.name).group("week"))
+        if wanted is not None and week not in wanted:
+            continue
+        raw = pd.read_parquet(f)
+        if raw.empty:
+            continue
+        colmap = _resolve_columns(list(raw.columns), strict=False)
+        frames.append(pd.DataFrame({
+            "week": week,
+            "date": pd.to_datetime(raw["date"], errors="coerce").dt.strftime("%Y-%m-%d") if "date" in raw else None,
+            "away": raw[colmap["away_team"]].to_numpy(),
+            "home": raw[colmap["home_team"]].to_numpy(),
+            "neutral": raw[colmap["neutral"]].fillna(False).astype(int).to_numpy() if colmap["neutral"] else 0,
+        }))
+    if not frames:
+        raise FileNotFoundError(f"No cached weeks for season {season} under {cache_root}")
+    df = pd.concat(frames, ignore_index=True)
+    n = len(df)
+    codes = team_codes(pd.concat([df["home"], df["away"]], ignore_index=True))
+    abbr = np.asarray(TEAM_CODES, dtype=object)
+    df["home"], df["away"] = abbr[codes[:n]], abbr[codes[n:]]
+    undated = df["date"].isna().to_numpy()
+    if undated.any():
+        weeks_hit = sorted(set(df.loc[undated, "week"].tolist()))
+        warnings.warn(f"cached schedule {season}: skipping {int(undated.sum())} game(s) without a date "
+                      f"in week(s) {weeks_hit}", stacklevel=3)
+        profiling.count("rows.undated", int(undated.sum()))
+        df, codes = df[~undated].reset_index(drop=True), np.concatenate([codes[:n][~undated], codes[n:][~undated]])
+        n = len(df)
+        if not n:
+            raise FileNotFoundError(f"No dated cached games for season {season} under {cache_root}")
+    check_frame(df, Game, f"cached schedule {season}")
+    df["season"] = int(season)
+    df["home_code"], df["away_code"] = codes[:n], codes[n:]
+    df["home_key"], df["away_key"] = df["home"], df["away"]
+    profiling.count("rows.schedule", len(df))
     return df
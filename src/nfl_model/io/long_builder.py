@@ -3,19 +3,30 @@ from __future__ import annotations
 
 from pathlib import Path
 from typing import Iterable, Optional, Sequence, Tuple
+import os
 import re
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .. import profiling
+from ..teams import TEAM_CODES, TEAM_DTYPE, clean_names, team_codes
 
 
 # --------------------------- Public API --------------------------------------
 
+@profiling.timed("long.build")
 def build_team_perspective_long(
     cache_dir: Path | str,
     seasons: Optional[Sequence[int]] = None,
     through_week: Optional[int] = None,
     include_playoffs: bool = False,
     strict_columns: bool = False,
+    layout: Optional[str] = None,
+    compact: bool = False,
 ) -> pd.DataFrame:
     """
     Load weekly cached Parquets like '2024_wk1.parquet' from `cache_dir/api_sports_nfl/`
@@ -54,86 +65,131 @@ def build_team_perspective_long(
     strict_columns:
         If True, raise on missing/renamed columns. If False, try to auto-map a few
         common variants (underscores/casing/space differences).
+    layout:
+        "weekly" reads the per-week files; "dataset" reads the season-partitioned
+        dataset under '<cache_root>/dataset' in one scan (see `cache_tool compact`).
+        Defaults to $NFL_CACHE_LAYOUT, else "weekly".
+    compact:
+        If True, return the compact dtypes of `to_compact_long` (categorical teams,
+        small ints, packed integer game_id). Requires numeric weeks and known teams.
 
     Returns
     -------
     pd.DataFrame
         Team-perspective long frame sorted by (season, week, game_id, team).
     """
-    cache_dir = Path(cache_dir)
-    if (cache_dir / "api_sports_nfl").exists():
-        cache_root = cache_dir / "api_sports_nfl"
+    cache_root = _resolve_cache_root(cache_dir)
+
+    layout = (layout or os.getenv("NFL_CACHE_LAYOUT", "weekly")).strip().lower()
+    dataset_root = cache_root / "dataset"
+    if layout == "dataset" and any(dataset_root.glob("season=*/*.parquet")):
+        games = _scan_dataset(dataset_root, seasons, strict_columns)
     else:
-        cache_root = cache_dir  # allow pointing directly at .../api_sports_nfl
-
-    files = _list_week_files(cache_root, seasons)
-    if not files:
-        raise FileNotFoundError(f"No weekly parquet files found under {cache_root}")
-
-    frames = []
-    for f in files:
-        df = pd.read_parquet(f)
-
-        # Normalize columns (lightweight mapping if user isn't strict)
-        df = _normalize_cache_columns(df, strict=strict_columns)
-
-        # Filter weeks if asked
-        if through_week is not None:
-            # Only applies to regular-season numeric weeks
-            if pd.api.types.is_integer_dtype(df["week"]):
-                df = df[df["week"] <= int(through_week)]
-            else:
-                # if non-integer weeks exist (e.g., "WC"), leave as-is and rely on include_playoffs
-                pass
-
-        if not include_playoffs:
-            # Keep only integer weeks in [1..18]
-            if pd.api.types.is_integer_dtype(df["week"]):
-                df = df[(df["week"] >= 1) & (df["week"] <= 18)]
-            else:
-                # drop non-numeric week labels
-                df = df[df["week"].apply(lambda x: isinstance(x, (int, pd.Int64Dtype.type)))]
-
-        if df.empty:
-            continue
+        files = _list_week_files(cache_root, seasons)
+        if not files:
+            raise FileNotFoundError(f"No weekly parquet files found under {cache_root}")
+        games = _scan_week_files(files, strict_columns)
+        profiling.count("long.files_read", len(files))
 
-        # Build two rows per game
-        long_df = _to_team_long(df)
-        frames.append(long_df)
+    games = games[_week_mask(games["week"], through_week, include_playoffs)]
 
-    if not frames:
-        return pd.DataFrame(
-            columns=[
-                "season", "week", "game_id", "team", "opp",
-                "is_home", "is_neutral", "points_for", "points_against"
-            ]
-        )
+    if games.empty:
+        out = pd.DataFrame(columns=LONG_COLUMNS)
+        return to_compact_long(out) if compact else out
 
-    out = pd.concat(frames, ignore_index=True)
+    # Build two rows per game
+    out = _to_team_long(games)
 
     # Sort for deterministic downstream behavior
     out = out.sort_values(["season", "week", "game_id", "team"], kind="mergesort").reset_index(drop=True)
+    out = _finish_long(out)
+    profiling.count("rows.long", len(out))
+    return to_compact_long(out) if compact else out
+
+
+def to_compact_long(long_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Compact dtypes for the long table (row order unchanged):
+
+        season:int16, week:int8
+        game_id:int32        # packed SSSSWWHHAA: season, week, home code, away code
+        team/opp:category    # fixed TEAM_CODES dictionary (abbreviations)
+        points_for/points_against:Int16
+
+    `game_id_labels(df["game_id"])` gives a readable "YYYY_WW_<HOME>_vs_<AWAY>" id
+    with team abbreviations.
+    """
+    week = pd.to_numeric(long_df["week"], errors="coerce")
+    if week.isna().any():
+        raise ValueError("compact long table needs numeric weeks (drop playoff labels first)")
+    team = team_codes(long_df["team"])
+    opp = team_codes(long_df["opp"])
+    is_home = long_df["is_home"].to_numpy(dtype=bool)
+    season = long_df["season"].to_numpy(dtype=np.int32)
+    week_i = week.to_numpy(dtype=np.int32)
+    home = np.where(is_home, team, opp).astype(np.int32)
+    away = np.where(is_home, opp, team).astype(np.int32)
+    return pd.DataFrame({
+        "season": season.astype(np.int16),
+        "week": week_i.astype(np.int8),
+        "game_id": season * 1_000_000 + week_i * 10_000 + home * 100 + away,
+        "team": pd.Categorical.from_codes(team, dtype=TEAM_DTYPE),
+        "opp": pd.Categorical.from_codes(opp, dtype=TEAM_DTYPE),
+        "is_home": is_home,
+        "is_neutral": long_df["is_neutral"].to_numpy(dtype=bool),
+        "points_for": pd.array(long_df["points_for"], dtype="Int16"),
+        "points_against": pd.array(long_df["points_against"], dtype="Int16"),
+    }, columns=LONG_COLUMNS)
+
+
+def unpack_game_id(keys) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Split packed game ids into (season, week, home code, away code) arrays."""
+    k = np.asarray(keys, dtype=np.int64)
+    return k // 1_000_000, k // 10_000 % 100, k // 100 % 100, k % 100
+
+
+def game_id_labels(keys) -> np.ndarray:
+    """Readable ids for packed keys, computed on demand: '2024_01_KC_vs_BUF'."""
+    season, week, home, away = unpack_game_id(keys)
+    abbr = np.array(TEAM_CODES, dtype=object)
+    week_str = pd.Series(week).astype(str).str.zfill(2).to_numpy(dtype=object)
+    return season.astype(str).astype(object) + "_" + week_str + "_" + abbr[home] + "_vs_" + abbr[away]
+
+
+# --------------------------- Internals ---------------------------------------
+
+LONG_COLUMNS = [
+    "season", "week", "game_id", "team", "opp",
+    "is_home", "is_neutral", "points_for", "points_against",
+]
+
+def _resolve_cache_root(cache_dir: Path | str) -> Path:
+    cache_dir = Path(cache_dir)
+    if (cache_dir / "api_sports_nfl").exists():
+        return cache_dir / "api_sports_nfl"
+    return cache_dir  # allow pointing directly at .../api_sports_nfl
+
+
+def _week_mask(week: pd.Series, through_week: Optional[int], include_playoffs: bool) -> np.ndarray:
+    """Week filters, vectorized: numeric weeks compare, labels like "WC" come through as NaN."""
+    week_num = pd.to_numeric(week, errors="coerce")
+    keep = np.ones(len(week), dtype=bool)
+    if through_week is not None:
+        keep &= ~(week_num > int(through_week)).to_numpy()
+    if not include_playoffs:
+        keep &= week_num.between(1, 18).to_numpy()
+    return keep
+
 
-    # Dtypes (nice-to-have, not strictly required)
+def _finish_long(out: pd.DataFrame) -> pd.DataFrame:
+    """Output dtypes (nice-to-have, not strictly required)."""
     out["season"] = out["season"].astype(int)
     # week may be Int64 (nullable); if it's numeric, cast to int
     if pd.api.types.is_integer_dtype(out["week"]):
         out["week"] = out["week"].astype(int)
-
-    # Sanity
-    expected_cols = [
-        "season", "week", "game_id", "team", "opp",
-        "is_home", "is_neutral", "points_for", "points_against"
-    ]
-    missing = [c for c in expected_cols if c not in out.columns]
-    if missing:
-        raise ValueError(f"Long-table missing columns: {missing}")
-
     return out
 
 
-# --------------------------- Internals ---------------------------------------
-
 WEEK_FILE_RE = re.compile(r"(?P<season>\d{4})_wk0*(?P<week>\d+)\.parquet$", re.IGNORECASE)
 
 def _list_week_files(cache_root: Path, seasons: Optional[Sequence[int]]) -> list[Path]:
@@ -154,71 +210,103 @@ def _list_week_files(cache_root: Path, seasons: Optional[Sequence[int]]) -> list
     return files
 
 
+_DATASET_PARTITIONING = ds.partitioning(pa.schema([("season", pa.int64())]), flavor="hive")
+
+def _scan_dataset(dataset_root: Path, seasons: Optional[Sequence[int]], strict: bool) -> pd.DataFrame:
+    """Read the season-partitioned cache dataset; season filters prune whole partitions."""
+    dataset = ds.dataset(dataset_root, format="parquet", partitioning=_DATASET_PARTITIONING)
+    colmap = _resolve_columns(dataset.schema.names, strict)
+    filt = None if seasons is None else ds.field("season").isin([int(s) for s in seasons])
+    table = dataset.to_table(columns=[c for c in colmap.values() if c], filter=filt)
+    return _canonical_games(table, colmap)
+
+
+def _scan_week_files(files: Sequence[Path], strict: bool, with_source: bool = False) -> pd.DataFrame:
+    """
+    Read all weekly files in one multi-file scan per distinct file schema, projecting
+    only the columns the long table needs. Column variants are resolved once per schema.
+    Rows come back in file order, i.e. (season, week). With `with_source=True` a '_file'
+    column holds each row's index into `files`.
+    """
+    groups: dict[pa.Schema, list[int]] = {}
+    for i, f in enumerate(files):
+        groups.setdefault(pq.read_schema(f).remove_metadata(), []).append(i)
+
+    # per-row file index is only needed to restore file order across schemas (or if asked)
+    track = with_source or len(groups) > 1
+    tables = []
+    order = []
+    for schema, idx in groups.items():
+        colmap = _resolve_columns(schema.names, strict)
+        dataset = ds.dataset([str(files[i]) for i in idx], schema=schema, format="parquet")
+        tables.append(_canonical_games(dataset.to_table(columns=[c for c in colmap.values() if c]), colmap))
+        if track:
+            rows = [frag.count_rows() for frag in dataset.get_fragments()]
+            order.append(np.repeat(np.asarray(idx), rows))
+    if not track:
+        return tables[0]
+    file_idx = np.concatenate(order)
+    perm = np.argsort(file_idx, kind="stable")
+    out = pd.concat(tables, ignore_index=True).iloc[perm].reset_index(drop=True)
+    if with_source:
+        out["_file"] = file_idx[perm]
+    return out
+
+
 _COL_VARIANTS = {
     "season": {"season", "Season"},
     "week": {"week", "Week"},
     "home_team": {"home_team", "homeTeam", "HomeTeam", "home team", "home"},
     "away_team": {"away_team", "awayTeam", "AwayTeam", "away team", "away"},
-    "home_score": {"home_score", "homeScore", "HomeScore", "home score", "homescore", "home_pts"},
-    "away_score": {"away_score", "awayScore", "AwayScore", "away score", "awayscore", "away_pts"},
+    "home_score": {"home_score", "homeScore", "HomeScore", "home score", "homescore", "home_pts", "home_points"},
+    "away_score": {"away_score", "awayScore", "AwayScore", "away score", "awayscore", "away_pts", "away_points"},
     "neutral": {"neutral", "is_neutral", "neutral_site", "neutralSite", "Neutral"},
 }
 
-def _normalize_cache_columns(df: pd.DataFrame, strict: bool) -> pd.DataFrame:
+def _squash(name: str) -> str:
+    return name.lower().replace(" ", "").replace("-", "").replace("/", "")
+
+def _resolve_columns(names: Sequence[str], strict: bool) -> dict[str, Optional[str]]:
     """
-    Ensure required columns exist. If strict=False, try to auto-map common name variants.
+    Map canonical names to the source column names of one schema. If strict=False a
+    missing 'neutral' column maps to None (filled with False); anything else raises.
     """
-    colmap = {}
-    lower_map = {c.lower().replace(" ", "").replace("-", "").replace("/", ""): c for c in df.columns}
-
-    def pick(name: str, variants: set[str]) -> Optional[str]:
-        for v in variants:
-            key = v.lower().replace(" ", "").replace("-", "").replace("/", "")
-            if key in lower_map:
-                return lower_map[key]
-        return None
-
+    lower_map = {_squash(c): c for c in names}
+    colmap: dict[str, Optional[str]] = {}
     for canonical, variants in _COL_VARIANTS.items():
-        src = pick(canonical, variants)
-        if src is None:
-            if strict:
-                raise KeyError(f"Missing required column '{canonical}' (tried variants {sorted(variants)})")
-            else:
-                # provide sensible fallback defaults only where safe
-                if canonical == "neutral":
-                    df["neutral"] = False
-                    src = "neutral"
-                else:
-                    raise KeyError(f"Missing required column '{canonical}' (tried variants {sorted(variants)})")
+        src = next((lower_map[_squash(v)] for v in variants if _squash(v) in lower_map), None)
+        if src is None and (strict or canonical != "neutral"):
+            raise KeyError(f"Missing required column '{canonical}' (tried variants {sorted(variants)})")
         colmap[canonical] = src
+    return colmap
 
-    # Rename a copy to canonical names
-    out = df.rename(columns={v: k for k, v in colmap.items() if v != k}).copy()
 
-    # Types (be tolerant—just coerce if possible)
-    for c in ("season", "week"):
-        if c in out.columns:
-            try:
-                out[c] = pd.to_numeric(out[c], errors="ignore")
-            except Exception:
-                pass
+def _canonical_games(table: pa.Table, colmap: dict[str, Optional[str]]) -> pd.DataFrame:
+    """Rename a projected table to canonical game columns with tolerant dtypes."""
+    df = table.to_pandas()
+    out = pd.DataFrame({k: df[v] for k, v in colmap.items() if v is not None})
     for c in ("home_score", "away_score"):
-        if c in out.columns:
-            out[c] = pd.to_numeric(out[c], errors="coerce")
-
-    if "neutral" in out.columns:
+        out[c] = pd.to_numeric(out[c], errors="coerce")
+    if colmap["neutral"] is None:
+        out["neutral"] = False
+    else:
         out["neutral"] = out["neutral"].fillna(False).astype(bool)
-
     return out
 
 
-def _make_game_id(season: int, week: int, home_team: str, away_team: str) -> str:
-    """Create a deterministic human-readable game id."""
-    week_str = f"{int(week):02d}" if pd.notna(week) else "??"
-    # Clean team names lightly for IDs
-    def clean(s: str) -> str:
-        return re.sub(r"[^\w]+", "", str(s)).upper()
-    return f"{int(season)}_{week_str}_{clean(home_team)}_vs_{clean(away_team)}"
+def _make_game_ids(season: pd.Series, week: pd.Series, home_team: pd.Series, away_team: pd.Series) -> np.ndarray:
+    """
+    Deterministic human-readable game ids, '{season}_{week:02d}_{HOME}_vs_{AWAY}' ('??' for
+    a missing week), vectorized: team names are cleaned once per distinct name.
+    """
+    codes, uniques = pd.factorize(pd.concat([home_team, away_team], ignore_index=True).astype(object), use_na_sentinel=False)
+    cleaned = clean_names(pd.Series(uniques, dtype=object))
+    names = cleaned.to_numpy(dtype=object)[codes]
+    n = len(season)
+    week_num = pd.to_numeric(week, errors="coerce")
+    week_str = np.where(week_num.notna(), week_num.fillna(0).astype(np.int64).astype(str).str.zfill(2), "??")
+    season_str = season.astype(np.int64).astype(str).to_numpy(dtype=object)
+    return season_str + "_" + week_str.astype(object) + "_" + names[:n] + "_vs_" + names[n:]
 
 
 def _to_team_long(df_games: pd.DataFrame) -> pd.DataFrame:
@@ -226,47 +314,29 @@ def _to_team_long(df_games: pd.DataFrame) -> pd.DataFrame:
     Convert a wide game table to two team-rows per game with is_neutral copied to both rows.
     Assumes columns are already normalized to canonical names.
     """
-    # Synthesize a game_id
-    game_id = df_games.apply(
-        lambda r: _make_game_id(r["season"], r["week"], r["home_team"], r["away_team"]),
-        axis=1
-    )
-    g = df_games.assign(game_id=game_id)
-
-    # Home rows
-    home = g[["season", "week", "game_id", "home_team", "away_team", "home_score", "away_score", "neutral"]].copy()
-    home.rename(columns={
-        "home_team": "team",
-        "away_team": "opp",
-        "home_score": "points_for",
-        "away_score": "points_against",
-        "neutral": "is_neutral",
-    }, inplace=True)
-    home["is_home"] = True
-
-    # Away rows
-    away = g[["season", "week", "game_id", "home_team", "away_team", "home_score", "away_score", "neutral"]].copy()
-    away.rename(columns={
-        "away_team": "team",
-        "home_team": "opp",
-        "away_score": "points_for",
-        "home_score": "points_against",
-        "neutral": "is_neutral",
-    }, inplace=True)
-    away["is_home"] = False
-
-    long_df = pd.concat([home, away], ignore_index=True)
-
-    # Order columns
-    long_df = long_df[
-        ["season", "week", "game_id", "team", "opp",
-         "is_home", "is_neutral", "points_for", "points_against"]
-    ]
-
-    # Type hygiene
-    long_df["is_home"] = long_df["is_home"].astype(bool)
-    long_df["is_neutral"] = long_df["is_neutral"].astype(bool)
-    long_df["points_for"] = pd.to_numeric(long_df["points_for"], errors="coerce").astype("Int64")
-    long_df["points_against"] = pd.to_numeric(long_df["points_against"], errors="coerce").astype("Int64")
-
+    game_id = _make_game_ids(df_games["season"], df_games["week"], df_games["home_team"], df_games["away_team"])
+
+    def twice(values):
+        if isinstance(values, pd.Series):
+            return pd.concat([values, values], ignore_index=True)
+        return np.concatenate([values, values])
+
+    home_team = df_games["home_team"].to_numpy()
+    away_team = df_games["away_team"].to_numpy()
+    home_score = pd.to_numeric(df_games["home_score"], errors="coerce").astype("Int64").array
+    away_score = pd.to_numeric(df_games["away_score"], errors="coerce").astype("Int64").array
+    n = len(df_games)
+
+    # Home rows first, then away rows (same layout as before: concat of two blocks)
+    long_df = pd.DataFrame({
+        "season": twice(df_games["season"]),
+        "week": twice(df_games["week"]),
+        "game_id": twice(game_id),
+        "team": np.concatenate([home_team, away_team]),
+        "opp": np.concatenate([away_team, home_team]),
+        "is_home": np.repeat([True, False], n),
+        "is_neutral": twice(df_games["neutral"].astype(bool).to_numpy()),
+        "points_for": pd.array(np.concatenate([home_score, away_score]), dtype="Int64"),
+        "points_against": pd.array(np.concatenate([away_score, home_score]), dtype="Int64"),
+    }, columns=LONG_COLUMNS)
     return long_df
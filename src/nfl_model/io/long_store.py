@@ -0,0 +1,146 @@
+## `src/nfl_model/io/long_store.py`
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .. import profiling
+from .files import file_checksum, write_atomic
+from .long_builder import (
+    LONG_COLUMNS,
+    _finish_long,
+    _list_week_files,
+    _resolve_cache_root,
+    _scan_week_files,
+    _to_team_long,
+    _week_mask,
+    to_compact_long,
+)
+
+# Persisted materialization of the team-perspective long table.
+#
+#   <cache_root>/derived/team_long.parquet         all weeks, plus a '_source' column
+#   <cache_root>/derived/team_long.sources.json    {file: {mtime_ns, size, sha256}}
+#
+# Each weekly file is one partition of the table. A refresh re-reads only files whose
+# (mtime, size) moved *and* whose checksum changed, and drops rows of deleted files.
+
+STORE_DIRNAME = "derived"
+TABLE_NAME = "team_long.parquet"
+SOURCES_NAME = "team_long.sources.json"
+SOURCES_VERSION = 1
+SORT_KEYS = ["season", "week", "game_id", "team"]
+
+
+def _load_sources(store_dir: Path) -> dict[str, dict]:
+    p = store_dir / SOURCES_NAME
+    if not p.exists() or not (store_dir / TABLE_NAME).exists():
+        return {}
+    data = json.loads(p.read_text())
+    if data.get("version") != SOURCES_VERSION:
+        return {}
+    return data.get("sources", {})
+
+
+@profiling.timed("long.refresh_store")
+def refresh_team_long_store(
+    cache_dir: Path | str,
+    store_dir: Optional[Path | str] = None,
+    strict_columns: bool = False,
+) -> pd.DataFrame:
+    """
+    Bring the materialized long table in line with the weekly files and return it
+    (all seasons and weeks, sorted by (season, week, game_id, team), with '_source').
+    """
+    cache_root = _resolve_cache_root(cache_dir)
+    store_dir = Path(store_dir) if store_dir else cache_root / STORE_DIRNAME
+    files = _list_week_files(cache_root, None)
+    if not files:
+        raise FileNotFoundError(f"No weekly parquet files found under {cache_root}")
+
+    previous = _load_sources(store_dir)
+    current: dict[str, dict] = {}
+    changed: list[Path] = []
+    for f in files:
+        st = f.stat()
+        old = previous.get(f.name)
+        if old and old["mtime_ns"] == st.st_mtime_ns and old["size"] == st.st_size:
+            current[f.name] = old
+            continue
+        digest = file_checksum(f)
+        current[f.name] = {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "sha256": digest}
+        if not old or old["sha256"] != digest:
+            changed.append(f)
+    removed = set(previous) - set(current)
+    profiling.count("long.files_read", len(changed))
+    profiling.count("long.files_reused", len(files) - len(changed))
+
+    table_path = store_dir / TABLE_NAME
+    stored = pd.read_parquet(table_path) if previous else None
+    if changed or removed or stored is None:
+        drop = {f.name for f in changed} | removed
+        parts = [] if stored is None else [stored[~stored["_source"].isin(drop)]]
+        if changed:
+            games = _scan_week_files(changed, strict_columns, with_source=True)
+            new_rows = _to_team_long(games)
+            names = np.array([f.name for f in changed], dtype=object)
+            new_rows["_source"] = np.concatenate([names[games["_file"]]] * 2)
+            parts.append(new_rows)
+        table = pd.concat(parts, ignore_index=True) if parts else stored
+
+        # Same order as a full rebuild: file order first, then a stable sort on the keys
+        rank = {f.name: i for i, f in enumerate(files)}
+        table = table.iloc[np.argsort(table["_source"].map(rank).to_numpy(), kind="stable")]
+        table = table.sort_values(SORT_KEYS, kind="mergesort").reset_index(drop=True)
+
+        store_dir.mkdir(parents=True, exist_ok=True)
+        write_atomic(table_path, lambda p: table.to_parquet(p, index=False))
+        stored = table
+
+    if current != previous:
+        store_dir.mkdir(parents=True, exist_ok=True)
+        payload = {"version": SOURCES_VERSION, "sources": current}
+        write_atomic(store_dir / SOURCES_NAME, lambda p: p.write_text(json.dumps(payload, indent=1)))
+    return stored
+
+
+def store_fingerprint(cache_dir: Path | str, store_dir: Optional[Path | str] = None) -> str:
+    """
+    Content fingerprint of the weekly files the materialized table was last built from
+    (hash of their checksums). Call after a refresh; keys derived caches on the same data.
+    """
+    cache_root = _resolve_cache_root(cache_dir)
+    store_dir = Path(store_dir) if store_dir else cache_root / STORE_DIRNAME
+    sources = _load_sources(store_dir)
+    h = hashlib.sha256()
+    for name in sorted(sources):
+        h.update(f"{name}:{sources[name]['sha256']}\n".encode())
+    return h.hexdigest()
+
+
+def load_team_perspective_long(
+    cache_dir: Path | str,
+    seasons: Optional[Sequence[int]] = None,
+    through_week: Optional[int] = None,
+    include_playoffs: bool = False,
+    strict_columns: bool = False,
+    store_dir: Optional[Path | str] = None,
+    compact: bool = False,
+) -> pd.DataFrame:
+    """
+    Drop-in for `build_team_perspective_long` (same arguments and output) served from
+    the materialized table; only weekly files that changed since the last call are read.
+    """
+    table = refresh_team_long_store(cache_dir, store_dir, strict_columns)
+    keep = _week_mask(table["week"], through_week, include_playoffs)
+    if seasons is not None:
+        keep &= table["season"].isin([int(s) for s in seasons]).to_numpy()
+    out = table[keep].drop(columns="_source").reset_index(drop=True)
+    out = pd.DataFrame(columns=LONG_COLUMNS) if out.empty else _finish_long(out)
+    return to_compact_long(out) if compact else out
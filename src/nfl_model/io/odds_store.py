@@ -0,0 +1,169 @@
+## `src/nfl_model/io/odds_store.py`
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Iterable, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from .. import profiling
+from ..features import season_of
+from .files import write_atomic
+from ..teams import team_codes
+
+# Columnar store of sportsbook odds ticks, one hive partition per season:
+#
+#   <root>/season=2023/part-<digest>.parquet
+#
+# One tick = one quote of one market by one book at one time:
+#
+#   ts        UTC timestamp of the quote
+#   book      sportsbook name
+#   date      game date (Eastern, YYYY-MM-DD), with home/away identifying the game
+#   market    "spread" | "total" | "moneyline"
+#   line      spread: home handicap (-3.5 = home gives 3.5); total: points; moneyline: NaN
+#   price_a   spread: home price; total: over price; moneyline: home price (American)
+#   price_b   spread: away price; total: under price; moneyline: away price
+#
+# Teams are stored as int8 codes (nfl_model.teams) and the game as one int64 key,
+# so the as-of joins in pricing.market run on integer columns only.
+
+MARKETS: tuple[str, ...] = ("spread", "total", "moneyline")
+TICK_COLUMNS = ["ts", "book", "date", "home", "away", "market", "line", "price_a", "price_b"]
+
+STORE_SCHEMA = pa.schema([
+    ("ts", pa.timestamp("ns", tz="UTC")),
+    ("book", pa.string()),
+    ("game_key", pa.int64()),
+    ("home_code", pa.int8()),
+    ("away_code", pa.int8()),
+    ("market", pa.int8()),
+    ("line", pa.float32()),
+    ("price_a", pa.float32()),
+    ("price_b", pa.float32()),
+])
+PARTITIONING = ds.partitioning(pa.schema([("season", pa.int64())]), flavor="hive")
+
+# Accepted spellings in incoming files -> canonical tick column.
+_ALIASES = {
+    "timestamp": "ts", "time": "ts", "updated_at": "ts",
+    "sportsbook": "book", "bookmaker": "book",
+    "game_date": "date",
+    "home_team": "home", "away_team": "away",
+    "point": "line", "points": "line",
+    "home_price": "price_a", "over_price": "price_a",
+    "away_price": "price_b", "under_price": "price_b",
+}
+
+
+def game_keys(dates: Iterable, home_codes: np.ndarray, away_codes: np.ndarray) -> np.ndarray:
+    """int64 game key: days since epoch of the (Eastern) game date, then home and away codes."""
+    days = pd.to_datetime(pd.Series(dates), errors="coerce").to_numpy("datetime64[D]").astype(np.int64)
+    return days * 10_000 + np.asarray(home_codes, dtype=np.int64) * 100 + np.asarray(away_codes, dtype=np.int64)
+
+
+def game_key_days(keys: np.ndarray) -> np.ndarray:
+    return np.asarray(keys, dtype=np.int64) // 10_000
+
+
+def normalize_ticks(df: pd.DataFrame) -> pd.DataFrame:
+    """Raw tick rows (aliases allowed) -> store columns plus 'season'. Rows with unknown markets are dropped."""
+    df = df.rename(columns=lambda c: _ALIASES.get(str(c).strip().lower(), str(c).strip().lower()))
+    missing = set(TICK_COLUMNS) - set(df.columns) - {"line"}
+    if missing:
+        raise ValueError(f"odds ticks missing: {sorted(missing)}")
+    market = pd.Series(df["market"], dtype=object).str.strip().str.lower()
+    market = market.replace({"spreads": "spread", "totals": "total", "h2h": "moneyline", "ml": "moneyline"})
+    code = pd.Categorical(market, categories=list(MARKETS)).codes.astype(np.int8)
+    keep = code >= 0
+    df, code = df[keep], code[keep]
+
+    home = team_codes(df["home"])
+    away = team_codes(df["away"])
+    out = pd.DataFrame({
+        "ts": pd.to_datetime(df["ts"], utc=True, errors="coerce"),
+        "book": df["book"].astype(str).str.strip().to_numpy(),
+        "game_key": game_keys(df["date"], home, away),
+        "home_code": home,
+        "away_code": away,
+        "market": code,
+        "line": pd.to_numeric(df["line"], errors="coerce").astype(np.float32) if "line" in df else np.float32("nan"),
+        "price_a": pd.to_numeric(df["price_a"], errors="coerce").astype(np.float32),
+        "price_b": pd.to_numeric(df["price_b"], errors="coerce").astype(np.float32),
+    })
+    out["season"] = season_of(df["date"])
+    return out[out["ts"].notna().to_numpy()].reset_index(drop=True)
+
+
+def read_ticks_file(path: Path | str) -> pd.DataFrame:
+    path = Path(path)
+    raw = pd.read_parquet(path) if path.suffix == ".parquet" else pd.read_csv(path)
+    return normalize_ticks(raw)
+
+
+def _write_partition(part: pd.DataFrame, season: int, root: Path) -> Path:
+    part = part.sort_values(["game_key", "ts", "book", "market"], kind="mergesort")[STORE_SCHEMA.names]
+    table = pa.Table.from_pandas(part, schema=STORE_SCHEMA, preserve_index=False)
+    rows = pd.util.hash_pandas_object(part, index=False).to_numpy()
+    digest = hashlib.sha256(rows.tobytes()).hexdigest()[:16]
+    p = root / f"season={int(season)}" / f"part-{digest}.parquet"
+    p.parent.mkdir(parents=True, exist_ok=True)
+    write_atomic(p, lambda tmp: pq.write_table(table, tmp))
+    return p
+
+
+@profiling.timed("odds.ingest")
+def ingest_ticks(paths: Sequence[Path | str], root: Path | str) -> dict[int, int]:
+    """
+    Append tick files (CSV or parquet) to the store as new part files, one per season.
+    Re-ingesting the same ticks writes the same part name, so it replaces rather than
+    duplicates. Returns {season: rows written}.
+    """
+    root = Path(root)
+    written: dict[int, int] = {}
+    if not paths:
+        return written
+    ticks = pd.concat([read_ticks_file(p) for p in paths], ignore_index=True)
+    for season, part in ticks.groupby("season", sort=True):
+        _write_partition(part, int(season), root)
+        written[int(season)] = len(part)
+    profiling.count("rows.odds_ingested", sum(written.values()))
+    return written
+
+
+@profiling.timed("odds.load")
+def load_ticks(
+    root: Path | str,
+    *,
+    seasons: Optional[Iterable[int]] = None,
+    books: Optional[Iterable[str]] = None,
+    keys: Optional[Iterable[int]] = None,
+    until: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """Read ticks with season/book/game/time pushdown; columns as STORE_SCHEMA plus 'season'."""
+    root = Path(root)
+    if not any(root.glob("season=*/*.parquet")):
+        raise FileNotFoundError(f"No odds ticks found under {root}")
+    dataset = ds.dataset(root, format="parquet", partitioning=PARTITIONING)
+    filt = None
+
+    def _and(f):
+        return f if filt is None else (filt & f)
+
+    if seasons is not None:
+        filt = _and(ds.field("season").isin([int(s) for s in seasons]))
+    if books is not None:
+        filt = _and(ds.field("book").isin([str(b) for b in books]))
+    if keys is not None:
+        filt = _and(ds.field("game_key").isin(np.unique(np.asarray(list(keys), dtype=np.int64))))
+    if until is not None:
+        filt = _and(ds.field("ts") <= pa.scalar(pd.Timestamp(until).tz_convert("UTC"), type=pa.timestamp("ns", tz="UTC")))
+    df = dataset.to_table(filter=filt).to_pandas()
+    profiling.count("rows.odds_loaded", len(df))
+    return df
@@ -0,0 +1,272 @@
+## `src/nfl_model/io/ratings_store.py`
+
+from __future__ import annotations
+
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .. import profiling
+from ..schemas import TeamRating
+from ..teams import TEAM_CODES, team_codes
+from ..validation import check_frame
+
+# Append-only, versioned ratings history.
+#
+#   <root>/v000001.parquet, v000002.parquet, ...     one immutable file per version
+#   <root>/base-v000120.parquet                      compact(): versions 1..120 in one file
+#
+# Every row carries its version's (version, season, week, ts, label) next to the
+# team's ratings, so the files alone are the store; there is no index to keep in sync.
+# A version is never rewritten: parts are hard-linked into place, so two writers
+# racing for the same number cannot clobber each other (the loser takes the next one).
+#
+# Loaded, all versions form one columnar table sorted by (version, team_code) with
+# per-version row offsets. Lookups are binary searches:
+#
+#   version_at(ts)                 last version written at or before ts
+#   version_for_week(season, wk)   last written version tagged (season, week) or earlier
+#
+# and view(version) is a load_ratings-shaped row slice of the loaded frame (no copy
+# under copy-on-write), which merge_ratings / Engine price against directly. The
+# store is also a season.RatingsSource: asof(season, week) -> (label, view).
+
+RATING_COLUMNS = [name.rstrip("_") for name in TeamRating.model_fields if name != "team"]
+META_COLUMNS = ["version", "season", "week", "ts", "label"]
+
+STORE_SCHEMA = pa.schema(
+    [("version", pa.int32()), ("season", pa.int16()), ("week", pa.int8()),
+     ("ts", pa.timestamp("ns", tz="UTC")), ("label", pa.string()), ("team_code", pa.int8())]
+    + [(c, pa.float64()) for c in RATING_COLUMNS]
+)
+PART_RE = re.compile(r"^(?:base-)?v(?P<v>\d+)\.parquet$")
+_ABBR = np.asarray(TEAM_CODES, dtype=object)
+
+
+def _utc(ts) -> pd.Timestamp:
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+class RatingsStore:
+    def __init__(self, root: Path | str):
+        self.root = Path(root)
+        self._loaded: Optional[tuple[str, ...]] = None
+        self._versions = pd.DataFrame(columns=META_COLUMNS + ["start", "stop"])
+        self._frame = pd.DataFrame()
+
+    def _files(self) -> tuple[str, ...]:
+        """The newest base plus the versions after it (a compaction in flight may leave both)."""
+        names = sorted(p.name for p in self.root.glob("*.parquet") if PART_RE.match(p.name))
+        bases = [int(PART_RE.match(n).group("v")) for n in names if n.startswith("base-")]
+        if not bases:
+            return tuple(names)
+        last = max(bases)
+        return (f"base-v{last:06d}.parquet",) + tuple(
+            n for n in names if not n.startswith("base-") and int(PART_RE.match(n).group("v")) > last)
+
+    def _next_version(self) -> int:
+        nums = [int(PART_RE.match(f).group("v")) for f in self._files()]
+        return max(nums) + 1 if nums else 1
+
+    # ---------- writing ----------
+
+    @profiling.timed("ratings_store.append")
+    def append(
+        self,
+        ratings: pd.DataFrame,
+        season: int,
+        week: int,
+        ts=None,
+        label: Optional[str] = None,
+    ) -> int:
+        """
+        Record `ratings` (load_ratings frame or raw ratings columns) as a new version
+        tagged (season, week) at `ts` (default: now, UTC). Returns the version number.
+        """
+        df = ratings.rename(columns=str.lower)
+        check_frame(df, TeamRating, f"ratings for {season} week {week}")
+        codes = team_codes(df["team"])
+        if len(np.unique(codes)) != len(codes):
+            raise ValueError("ratings list a team more than once (after resolving aliases)")
+        order = np.argsort(codes, kind="stable")
+        ts = _utc(ts if ts is not None else pd.Timestamp.now(tz="UTC"))
+        part = pd.DataFrame({"team_code": codes[order]})
+        for c in RATING_COLUMNS:
+            part[c] = (pd.to_numeric(df[c], errors="coerce").to_numpy(dtype=float)[order]
+                       if c in df.columns else np.nan)
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        version = self._next_version()
+        while True:
+            meta = {"version": version, "season": int(season), "week": int(week), "ts": ts, "label": label or ""}
+            table = pa.Table.from_pandas(part.assign(**meta)[STORE_SCHEMA.names], schema=STORE_SCHEMA,
+                                         preserve_index=False)
+            try:
+                self._link_new(table, f"v{version:06d}.parquet")
+                break
+            except FileExistsError:
+                version += 1
+        self._loaded = None
+        profiling.count("rows.ratings_stored", len(part))
+        return version
+
+    def _link_new(self, table: pa.Table, name: str) -> None:
+        """Write `table` under a temp name and hard-link it to `name`; FileExistsError if taken."""
+        fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=self.root)
+        os.close(fd)
+        try:
+            pq.write_table(table, tmp)
+            os.link(tmp, self.root / name)
+        finally:
+            Path(tmp).unlink(missing_ok=True)
+
+    @profiling.timed("ratings_store.compact")
+    def compact(self) -> int:
+        """
+        Pack every version into one 'base-v{N}.parquet' and drop the files it covers
+        (contents unchanged; loads then read one file). Returns N, the last version packed.
+        """
+        files = self._files()
+        if len(files) < 2:
+            return self.refresh().latest() if files else 0
+        table = self._read(files)
+        last = int(pc.max(table.column("version")).as_py())
+        self._link_new(table, f"base-v{last:06d}.parquet")
+        for f in self.root.glob("*.parquet"):
+            m = PART_RE.match(f.name)
+            if m and int(m.group("v")) <= last and f.name != f"base-v{last:06d}.parquet":
+                f.unlink(missing_ok=True)
+        self._loaded = None
+        return last
+
+    # ---------- reading ----------
+
+    def _read(self, files: tuple[str, ...]) -> pa.Table:
+        tables = [pq.ParquetFile(self.root / f).read() for f in files]
+        table = pa.concat_tables([t.cast(STORE_SCHEMA) for t in tables])
+        return table.sort_by([("version", "ascending"), ("team_code", "ascending")])
+
+    @profiling.timed("ratings_store.load")
+    def refresh(self) -> "RatingsStore":
+        """
+        (Re)load when versions were added or compacted since the last load. Lookups use
+        the loaded state (loading once on first use); call this to see other writers' versions.
+        """
+        files = self._files()
+        if files == self._loaded:
+            return self
+        if not files:
+            raise FileNotFoundError(f"No ratings versions under {self.root}")
+        table = self._read(files)
+        code = table.column("team_code").to_numpy()
+        self._frame = pd.DataFrame({"team": _ABBR[code]})
+        for c in RATING_COLUMNS:
+            self._frame[c] = table.column(c).to_numpy()
+        self._frame["team_code"] = code
+        self._frame["team_key"] = self._frame["team"]
+
+        version = table.column("version").to_numpy()
+        first = np.flatnonzero(np.r_[True, version[1:] != version[:-1]])
+        meta = table.select(META_COLUMNS).take(pa.array(first)).to_pandas()
+        meta["ts"] = meta["ts"].dt.as_unit("ns")
+        meta["start"] = first
+        meta["stop"] = np.r_[first[1:], len(version)]
+        self._versions = meta
+        self._version = meta["version"].to_numpy(dtype=np.int64)
+        self._start, self._stop = meta["start"].to_numpy(), meta["stop"].to_numpy()
+        # sort orders for the two as-of searches (ties: the later version wins)
+        ts_ns = meta["ts"].array.asi8
+        self._by_ts = np.lexsort((self._version, ts_ns))
+        self._ts_sorted = ts_ns[self._by_ts]
+        week_key = meta["season"].to_numpy(dtype=np.int64) * 100 + meta["week"].to_numpy(dtype=np.int64)
+        self._by_week = np.lexsort((self._version, ts_ns, week_key))
+        self._week_sorted = week_key[self._by_week]
+        self._loaded = files
+        profiling.count("rows.ratings_loaded", len(version))
+        return self
+
+    def _ready(self) -> "RatingsStore":
+        return self if self._loaded is not None else self.refresh()
+
+    @property
+    def versions(self) -> pd.DataFrame:
+        """One row per version: version, season, week, ts, label, n_teams."""
+        v = self._ready()._versions
+        return v[META_COLUMNS].assign(n_teams=(v["stop"] - v["start"]).to_numpy())
+
+    def _row(self, version: int) -> int:
+        self._ready()
+        i = int(np.searchsorted(self._version, int(version)))
+        if i == len(self._version) or self._version[i] != int(version):
+            raise KeyError(f"No ratings version {version} in {self.root}")
+        return i
+
+    def latest(self) -> int:
+        return int(self._ready()._version[-1])
+
+    def version_at(self, ts) -> int:
+        """Last version written at or before `ts` (naive timestamps are UTC)."""
+        self._ready()
+        j = np.searchsorted(self._ts_sorted, _utc(ts).as_unit("ns").value, side="right") - 1
+        if j < 0:
+            raise KeyError(f"No ratings version at or before {ts}")
+        return int(self._version[self._by_ts[j]])
+
+    def version_for_week(self, season: int, week: int) -> int:
+        """Latest-written version tagged (season, week), else the nearest earlier week's."""
+        self._ready()
+        j = np.searchsorted(self._week_sorted, int(season) * 100 + int(week), side="right") - 1
+        if j < 0:
+            raise KeyError(f"No ratings version at or before {season} week {week}")
+        return int(self._version[self._by_week[j]])
+
+    def view(self, version: int) -> pd.DataFrame:
+        """load_ratings-shaped frame (team, ratings, team_code, team_key) for one version, without copying."""
+        i = self._row(version)
+        return self._frame.iloc[int(self._start[i]):int(self._stop[i])].reset_index(drop=True)
+
+    def label(self, version: int) -> str:
+        i = self._row(version)
+        row = self._versions.iloc[i]
+        tag = f"v{int(row['version'])} {int(row['season'])}wk{int(row['week'])} {row['ts']:%Y-%m-%dT%H:%MZ}"
+        return f"{tag} {row['label']}" if row["label"] else tag
+
+    def asof(self, season: int, week: int) -> tuple[str, pd.DataFrame]:
+        """season.RatingsSource: the version for (season, week)."""
+        v = self.version_for_week(season, week)
+        return self.label(v), self.view(v)
+
+    def diff(self, a: int, b: int) -> pd.DataFrame:
+        """
+        Teams whose ratings differ between versions `a` and `b`: change ('added',
+        'removed', 'changed') plus <col>_a, <col>_b and <col>_delta for each rating.
+        """
+        slots = []
+        for v in (a, b):
+            view = self.view(v)
+            grid = np.full((len(TEAM_CODES), len(RATING_COLUMNS)), np.nan)
+            grid[view["team_code"].to_numpy()] = view[RATING_COLUMNS].to_numpy(dtype=float)
+            present = np.zeros(len(TEAM_CODES), dtype=bool)
+            present[view["team_code"].to_numpy()] = True
+            slots.append((grid, present))
+        (ga, pa_), (gb, pb) = slots
+        same = (ga == gb) | (np.isnan(ga) & np.isnan(gb))
+        changed = pa_ & pb & ~same.all(axis=1)
+        rows = np.flatnonzero(changed | (pa_ != pb))
+        out = pd.DataFrame({
+            "team": _ABBR[rows],
+            "change": np.where(~pa_[rows], "added", np.where(~pb[rows], "removed", "changed")),
+        })
+        for j, c in enumerate(RATING_COLUMNS):
+            out[f"{c}_a"], out[f"{c}_b"] = ga[rows, j], gb[rows, j]
+            out[f"{c}_delta"] = gb[rows, j] - ga[rows, j]
+        return out
@@ -1,6 +1,7 @@
 ## `src/nfl_model/models/total_model.py`
 
 from __future__ import annotations
+from .. import profiling
 from ..config import Params, PipelineConfig
 from ..registry import get_factor
 
@@ -8,12 +9,22 @@ class TotalModel:
     def __init__(self, params: Params, pipe: PipelineConfig):
         self.params = params
         self.factors = [get_factor(name)() for name in pipe.total_factors]
+        self._timer_names = [f"factor.total.{name}" for name in pipe.total_factors]
 
-    def compute(self, ratings_row_home: dict, ratings_row_away: dict, game_row: dict) -> float:
+    def compute(
+        self,
+        ratings_row_home: dict,
+        ratings_row_away: dict,
+        game_row: dict,
+        features_home: dict | None = None,
+        features_away: dict | None = None,
+    ) -> float:
         total = self.params.league_total + 2 * self.params.pace_points
         from ..factors.base import FactorContext
-        ctx = FactorContext(params=self.params, ratings_row_home=ratings_row_home, ratings_row_away=ratings_row_away, game_row=game_row)
-        for f in self.factors:
-            adj = f.apply(ctx)
+        ctx = FactorContext(params=self.params, ratings_row_home=ratings_row_home, ratings_row_away=ratings_row_away, game_row=game_row,
+                            features_home=features_home or {}, features_away=features_away or {})
+        for f, timer_name in zip(self.factors, self._timer_names):
+            with profiling.timer(timer_name):
+                adj = f.apply(ctx)
             total += float(adj.get("total_delta", 0.0))
         return max(0.0, total)
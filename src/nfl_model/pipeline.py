@@ -0,0 +1,249 @@
+## `src/nfl_model/pipeline.py`
+
+from __future__ import annotations
+
+import fnmatch
+import hashlib
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Sequence
+
+from . import profiling
+from .io.files import file_checksum, write_atomic
+
+# Stage runner: declared inputs/outputs, content fingerprints, skip-if-unchanged.
+#
+#   Stage("long", refresh, inputs=["cache/*_wk*.parquet"], outputs=["cache/derived/team_long.parquet"])
+#
+# Inputs and outputs are paths, directories (every non-hidden file below) or glob
+# patterns. A stage depends on every stage with an output overlapping one of its inputs
+# (plus its explicit `after`); stages run as soon as their dependencies finish, in a
+# thread pool, so independent branches overlap.
+#
+# A stage's fingerprint hashes its input files' contents (sha256, recomputed only when
+# a file's (mtime, size) moved, as in io/long_store) and its key() value (params,
+# dates). A stage is skipped when its fingerprint matches the last successful run and
+# its outputs exist, so an upstream stage that rewrote identical bytes does not ripple
+# downstream.
+#
+#   <state_path>  {"version", "stages": {name: {fingerprint, finished_at, seconds}}, "files": {...}}
+
+STATE_VERSION = 1
+_GLOB = set("*?[")
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    run: Callable[[], object]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    key: Optional[Callable[[], object]] = None    # extra fingerprint input; must be JSON-serializable
+    after: tuple[str, ...] = ()                   # explicit dependencies beyond inputs/outputs
+
+
+@dataclass(frozen=True)
+class StageResult:
+    name: str
+    status: str          # 'ran', 'skipped', 'failed' or 'blocked' (a dependency failed)
+    seconds: float
+    fingerprint: str = ""
+    error: str = ""
+
+
+def _base(spec: str) -> Path:
+    """Leading non-glob part of a path spec."""
+    parts = Path(spec).parts
+    for i, part in enumerate(parts):
+        if _GLOB & set(part):
+            return Path(*parts[:i]) if i else Path(".")
+    return Path(spec)
+
+
+def _overlaps(output: str, input_: str) -> bool:
+    if _GLOB & set(input_):
+        o, i = Path(output).parts, Path(input_).parts
+        if len(o) == len(i) and all(fnmatch.fnmatch(x, y) for x, y in zip(o, i)):
+            return True
+        out, base = Path(output), _base(input_)
+        return base == out or base.is_relative_to(out)     # output is a directory above the pattern
+    a, b = Path(output), Path(input_)
+    return a == b or a.is_relative_to(b) or b.is_relative_to(a)
+
+
+def expand(spec: str) -> list[Path]:
+    """Files a spec names: the glob's matches, a directory's non-hidden files, or the path itself."""
+    p = Path(spec)
+    if _GLOB & set(spec):
+        base = _base(spec)
+        files = base.glob(str(p.relative_to(base))) if base.exists() else []
+    elif p.is_dir():
+        files = p.rglob("*")
+    else:
+        return [p] if p.exists() else []
+    return sorted(f for f in files if f.is_file() and not f.name.startswith("."))
+
+
+class Pipeline:
+    def __init__(self, stages: Sequence[Stage], state_path: Path | str):
+        self.stages = {s.name: s for s in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("duplicate stage names")
+        self.state_path = Path(state_path)
+        self.deps = {s.name: self._deps(s) for s in stages}
+        self.order = self._toposort()
+
+    def _deps(self, stage: Stage) -> set[str]:
+        unknown = set(stage.after) - set(self.stages)
+        if unknown:
+            raise ValueError(f"stage {stage.name!r}: unknown dependencies {sorted(unknown)}")
+        deps = set(stage.after)
+        for other in self.stages.values():
+            if other.name != stage.name and any(
+                    _overlaps(o, i) for o in other.outputs for i in stage.inputs):
+                deps.add(other.name)
+        return deps
+
+    def _toposort(self) -> list[str]:
+        order, done = [], set()
+        pending = list(self.stages)
+        while pending:
+            ready = [n for n in pending if self.deps[n] <= done]
+            if not ready:
+                raise ValueError(f"dependency cycle among stages {pending}")
+            order += ready
+            done |= set(ready)
+            pending = [n for n in pending if n not in done]
+        return order
+
+    # ---------- state ----------
+
+    def _load_state(self) -> dict:
+        if self.state_path.exists():
+            data = json.loads(self.state_path.read_text())
+            if data.get("version") == STATE_VERSION:
+                return data
+        return {"version": STATE_VERSION, "stages": {}, "files": {}}
+
+    def _save_state(self, state: dict) -> None:
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.state_path, lambda p: p.write_text(json.dumps(state, indent=1, sort_keys=True)))
+
+    def fingerprint(self, stage: Stage, files: dict) -> str:
+        """Hash of the stage's key() and input file contents; `files` caches checksums by (mtime, size)."""
+        h = hashlib.sha256(stage.name.encode())
+        h.update(json.dumps(stage.key() if stage.key else None, sort_keys=True, default=str).encode())
+        for spec in stage.inputs:
+            h.update(f"\n{spec}".encode())
+            for f in expand(spec):
+                st = f.stat()
+                old = files.get(str(f))
+                if old and old[0] == st.st_mtime_ns and old[1] == st.st_size:
+                    digest = old[2]
+                else:
+                    digest = file_checksum(f)
+                    files[str(f)] = [st.st_mtime_ns, st.st_size, digest]
+                    profiling.count("pipeline.files_hashed")
+                h.update(f"\n{f}:{digest}".encode())
+        return h.hexdigest()
+
+    def _outputs_exist(self, stage: Stage) -> bool:
+        return all(expand(spec) for spec in stage.outputs)
+
+    # ---------- running ----------
+
+    def targets(self, names: Optional[Iterable[str]] = None) -> list[str]:
+        """`names` and everything they depend on, in run order (default: all stages)."""
+        if not names:
+            return list(self.order)
+        want, todo = set(), list(names)
+        while todo:
+            n = todo.pop()
+            if n not in self.stages:
+                raise KeyError(f"unknown stage {n!r}")
+            if n not in want:
+                want.add(n)
+                todo += self.deps[n]
+        return [n for n in self.order if n in want]
+
+    def status(self) -> list[dict]:
+        """Per stage: whether it would run now, and the last run's time and duration."""
+        state = self._load_state()
+        rows = []
+        for name in self.order:
+            stage, last = self.stages[name], state["stages"].get(name, {})
+            fp = self.fingerprint(stage, state["files"])
+            stale = fp != last.get("fingerprint") or not self._outputs_exist(stage)
+            rows.append({"stage": name, "after": ",".join(sorted(self.deps[name])), "stale": stale,
+                         "last_run": last.get("finished_at", ""), "seconds": last.get("seconds")})
+        return rows
+
+    @profiling.timed("pipeline.run")
+    def run(
+        self,
+        targets: Optional[Iterable[str]] = None,
+        force: Iterable[str] = (),
+        workers: int = 4,
+    ) -> list[StageResult]:
+        """
+        Bring `targets` (default: every stage) up to date: each stage runs once its
+        dependencies are done, and only when its fingerprint changed, its outputs are
+        missing, or it is in `force`. A failed stage blocks its dependents; the others finish.
+        """
+        names = self.targets(targets)
+        force = set(force)
+        state = self._load_state()
+        results: dict[str, StageResult] = {}
+        running: dict = {}
+
+        def execute(stage: Stage, fp: str) -> StageResult:
+            t0 = time.perf_counter()
+            try:
+                with profiling.timer(f"pipeline.{stage.name}"):
+                    stage.run()
+            except (Exception, SystemExit) as e:     # CLI entry points exit on bad arguments
+                return StageResult(stage.name, "failed", time.perf_counter() - t0, fp, f"{type(e).__name__}: {e}")
+            return StageResult(stage.name, "ran", time.perf_counter() - t0, fp)
+
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            while len(results) < len(names):
+                for name in names:
+                    if name in results or name in running.values():
+                        continue
+                    deps = self.deps[name] & set(names)
+                    if any(results.get(d) and results[d].status in ("failed", "blocked") for d in deps):
+                        results[name] = StageResult(name, "blocked", 0.0)
+                        continue
+                    if not all(d in results for d in deps):
+                        continue
+                    stage = self.stages[name]
+                    # inputs are only final once the dependencies are done, so fingerprint here
+                    fp = self.fingerprint(stage, state["files"])
+                    last = state["stages"].get(name, {}).get("fingerprint")
+                    if name not in force and fp == last and self._outputs_exist(stage):
+                        results[name] = StageResult(name, "skipped", 0.0, fp)
+                    else:
+                        running[pool.submit(execute, stage, fp)] = name
+                if not running:
+                    continue
+                finished, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    res = fut.result()
+                    del running[fut]
+                    results[res.name] = res
+                    if res.status == "ran":
+                        state["stages"][res.name] = {
+                            "fingerprint": res.fingerprint,
+                            "finished_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                            "seconds": round(res.seconds, 3),
+                        }
+                        self._save_state(state)
+        state["files"] = {f: v for f, v in state["files"].items() if Path(f).exists()}
+        self._save_state(state)
+        for res in results.values():
+            profiling.count(f"pipeline.stages_{res.status}")
+        return [results[n] for n in names]
@@ -0,0 +1,148 @@
+## `src/nfl_model/pricing/greeks.py`
+
+from __future__ import annotations
+
+import math
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from .margins import MarginTable
+from .odds import norm_cdf
+
+# Closed-form sensitivities of Engine prices to ratings and params.
+#
+# The spread is linear in the inputs before the cap,
+#
+#   S = power_h - power_a + qb_weight * (qb_h - qb_a) + home_field_points * (1 - neutral) + ...
+#
+# and the normal margin model prices the home side at p = Phi(S / margin_sd), so every
+# derivative is a product of a few per-game factors (the same for a whole slate):
+#
+#   dp/dS  = phi(S / sd) / sd            dp/dsd = -phi(S / sd) * S / sd^2
+#   dml/dp = -100 / (1 - p)^2  (p >= .5)  -100 / p^2  (p < .5)     (unrounded moneyline)
+#
+# Columns are derivatives with respect to the HOME team's input; the away team's are
+# the negatives (d_model_total_d_off/def are the same for both teams). A capped spread
+# or a zero-floored total has zero sensitivity. Under margin_model 'key_numbers'
+# dp/dS is the table's central difference at S, and d/d margin_sd is NaN (the table
+# is fitted at one sd).
+
+GREEK_INPUTS = ["power", "qb_points", "home_field_points", "margin_sd"]
+GREEK_OUTPUTS = ["home_win_prob", "ml_home", "ml_away"]
+GREEK_COLUMNS = [f"d_{o}_d_{i}" for i in GREEK_INPUTS for o in GREEK_OUTPUTS] + [
+    "d_model_total_d_off", "d_model_total_d_def",
+]
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def norm_pdf(x) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    return _INV_SQRT_2PI * np.exp(-0.5 * x * x)
+
+
+def dml_dp(p) -> np.ndarray:
+    """Slope of the (unrounded) American odds curve in win probability."""
+    p = np.clip(np.asarray(p, dtype=float), 1e-6, 1 - 1e-6)
+    return np.where(p >= 0.5, -100.0 / (1 - p) ** 2, -100.0 / p ** 2)
+
+
+def _table_slope(margins: MarginTable, spread: np.ndarray) -> np.ndarray:
+    step = margins.mu_step
+    return (margins.win_prob(spread + step) - margins.win_prob(spread - step)) / (2 * step)
+
+
+def price_greeks(
+    spread,
+    total,
+    neutral,
+    params,
+    pipe,
+    margins: Optional[MarginTable] = None,
+    home_win_prob=None,
+) -> pd.DataFrame:
+    """
+    GREEK_COLUMNS for games priced at home spread `spread` and `total` (Engine output),
+    under `params` / `pipe` (factor lists decide which inputs the prices depend on).
+    Pass the priced `home_win_prob` to skip recomputing it.
+    """
+    s = np.asarray(spread, dtype=float)
+    t = np.asarray(total, dtype=float)
+    neutral = np.asarray(neutral, dtype=float)
+    uncapped = np.ones_like(s) if params.spread_cap is None else (np.abs(s) < params.spread_cap).astype(float)
+
+    dS = {
+        "power": uncapped,
+        "qb_points": uncapped * (params.qb_weight if "qb_adjust" in pipe.spread_factors else 0.0),
+        "home_field_points": uncapped * (1.0 - neutral) * ("home_field" in pipe.spread_factors),
+    }
+    sd = params.margin_sd
+    if params.margin_model == "key_numbers":
+        dp_ds = _table_slope(margins, s)
+        dp_dsd = np.full_like(s, np.nan)
+    else:
+        z = s / sd
+        dp_ds = norm_pdf(z) / sd
+        dp_dsd = -norm_pdf(z) * z / sd
+    if home_win_prob is not None:
+        p = np.asarray(home_win_prob, dtype=float)
+    else:
+        p = margins.win_prob(s) if params.margin_model == "key_numbers" else norm_cdf(s / sd)
+    ml_home, ml_away = dml_dp(p), dml_dp(1.0 - p)
+
+    out = {}
+    for name in GREEK_INPUTS:
+        dp = dp_dsd if name == "margin_sd" else dp_ds * dS[name]
+        out[f"d_home_win_prob_d_{name}"] = dp
+        out[f"d_ml_home_d_{name}"] = ml_home * dp
+        out[f"d_ml_away_d_{name}"] = -ml_away * dp
+    off_def = ("off_def_total" in pipe.total_factors) and params.use_off_def_for_total
+    live = (t > 0).astype(float) * off_def
+    out["d_model_total_d_off"] = live
+    out["d_model_total_d_def"] = -live
+    return pd.DataFrame(out, columns=GREEK_COLUMNS)
+
+
+EXPOSURE_INPUTS = ["power", "qb_points", "off", "def"]
+
+
+def team_exposure(lines: pd.DataFrame, positions: pd.DataFrame, total_sd: float = 10.0) -> pd.DataFrame:
+    """
+    Per-team exposure of a book of positions to each rating: sum over positions of
+    stake * d P(position wins) / d rating, for `lines` priced with greeks.
+
+    positions: week, date, away, home, side ('home', 'away', 'over', 'under'), stake,
+    and for over/under the total `line` (P(over) is normal around model_total, total_sd).
+    """
+    key = ["week", "date", "away", "home"]
+    cols = key + ["model_total", "d_home_win_prob_d_power", "d_home_win_prob_d_qb_points",
+                  "d_model_total_d_off", "d_model_total_d_def"]
+    book = positions.merge(lines[cols], on=key, how="left", validate="many_to_one")
+    if book["model_total"].isna().any():
+        missing = book.loc[book["model_total"].isna(), key].drop_duplicates()
+        raise ValueError(f"positions on games not in lines:\n{missing.to_string(index=False)}")
+    side = book["side"].to_numpy(dtype=str)
+    unknown = sorted(set(side) - {"home", "away", "over", "under"})
+    if unknown:
+        raise ValueError(f"unknown position side(s): {unknown}")
+    stake = book["stake"].to_numpy(dtype=float)
+
+    # dP(side)/dS for spread sides (home team's input; away team's is the negative)
+    sign = np.where(side == "home", 1.0, np.where(side == "away", -1.0, 0.0))
+    power = stake * sign * book["d_home_win_prob_d_power"].to_numpy(dtype=float)
+    qb = stake * sign * book["d_home_win_prob_d_qb_points"].to_numpy(dtype=float)
+    # dP(over)/dT for total sides (the same for both teams)
+    line = book["line"].to_numpy(dtype=float) if "line" in book.columns else np.full(len(book), np.nan)
+    over = np.where(side == "over", 1.0, np.where(side == "under", -1.0, 0.0))
+    dp_dt = np.where(over != 0, norm_pdf((line - book["model_total"].to_numpy(dtype=float)) / total_sd) / total_sd, 0.0)
+    if np.isnan(dp_dt).any():
+        raise ValueError("over/under positions need a 'line'")
+    off = stake * over * dp_dt * book["d_model_total_d_off"].to_numpy(dtype=float)
+    def_ = stake * over * dp_dt * book["d_model_total_d_def"].to_numpy(dtype=float)
+
+    per_side = pd.concat([
+        pd.DataFrame({"team": book["home"].to_numpy(), "power": power, "qb_points": qb, "off": off, "def": def_}),
+        pd.DataFrame({"team": book["away"].to_numpy(), "power": -power, "qb_points": -qb, "off": off, "def": def_}),
+    ], ignore_index=True)
+    return per_side.groupby("team", sort=True)[EXPOSURE_INPUTS].sum().reset_index()
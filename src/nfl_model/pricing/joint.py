@@ -0,0 +1,220 @@
+## `src/nfl_model/pricing/joint.py`
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from ..io.long_store import load_team_perspective_long
+from .odds import norm_cdf
+
+# Joint (margin, total) pricing.
+#
+# Home margin M and game total T are bivariate normal:
+#
+#   M ~ N(model_spread_home, margin_sd)    T ~ N(model_total, total_sd)    corr(M, T) = rho
+#
+# so team points H = (T + M) / 2 and A = (T - M) / 2 are normal too, and every
+# same-game combination of a spread side and a total side is one bivariate normal
+# orthant probability. Those come from bvn_upper (Genz's Gauss-Legendre method, as in
+# his BVND), vectorized over games; simulate_combos is the Monte Carlo cross-check.
+#
+# Means are unchanged (the engine's team totals are still (total +/- spread) / 2);
+# rho only moves the combination and team-total probabilities.
+
+# Gauss-Legendre nodes/weights on (-1, 1), positive half (symmetric), for 6, 12, 20 points.
+_GL = {
+    6: (np.array([0.9324695142031522, 0.6612093864662647, 0.2386191860831970]),
+        np.array([0.1713244923791705, 0.3607615730481384, 0.4679139345726904])),
+    12: (np.array([0.9815606342467191, 0.9041172563704750, 0.7699026741943050,
+                   0.5873179542866171, 0.3678314989981802, 0.1252334085114692]),
+         np.array([0.04717533638651177, 0.1069393259953183, 0.1600783285433464,
+                   0.2031674267230659, 0.2334925365383547, 0.2491470458134029])),
+    20: (np.array([0.9931285991850949, 0.9639719272779138, 0.9122344282513259,
+                   0.8391169718222188, 0.7463319064601508, 0.6360536807265150,
+                   0.5108670019508271, 0.3737060887154196, 0.2277858511416451,
+                   0.07652652113349733]),
+         np.array([0.01761400713915212, 0.04060142980038694, 0.06267204833410906,
+                   0.08327674157670475, 0.1019301198172404, 0.1181945319615184,
+                   0.1316886384491766, 0.1420961093183821, 0.1491729864726037,
+                   0.1527533871307259])),
+}
+_TWOPI = 2.0 * math.pi
+
+
+def _nodes(r_abs: float) -> tuple[np.ndarray, np.ndarray]:
+    x, w = _GL[6 if r_abs < 0.3 else 12 if r_abs < 0.75 else 20]
+    return np.concatenate([-x, x]), np.concatenate([w, w])
+
+
+def _bvn_moderate(h: np.ndarray, k: np.ndarray, r: float) -> np.ndarray:
+    x, w = _nodes(abs(r))
+    hk = h * k
+    hs = (h * h + k * k) / 2
+    asr = math.asin(r)
+    sn = np.sin(asr * (x + 1) / 2)                                   # (nodes,)
+    terms = np.exp((sn[None, :] * hk[:, None] - hs[:, None]) / (1 - sn * sn)[None, :])
+    return terms @ w * asr / (2 * _TWOPI) + norm_cdf(-h) * norm_cdf(-k)
+
+
+def _bvn_high(h: np.ndarray, k: np.ndarray, r: float) -> np.ndarray:
+    x, w = _nodes(1.0)
+    if r < 0:
+        k = -k
+    hk = h * k
+    bvn = np.zeros_like(h)
+    if abs(r) < 1:
+        a2 = (1 - r) * (1 + r)
+        a = math.sqrt(a2)
+        bs = (h - k) ** 2
+        c = (4 - hk) / 8
+        d = (12 - hk) / 16
+        bvn = a * np.exp(-(bs / a2 + hk) / 2) * (1 - c * (bs - a2) * (1 - d * bs / 5) / 3 + c * d * a2 * a2 / 5)
+        b = np.sqrt(bs)
+        tail = np.where(hk > -160, np.exp(-hk / 2) * math.sqrt(_TWOPI) * norm_cdf(-b / a) * b
+                        * (1 - c * bs * (1 - d * bs / 5) / 3), 0.0)
+        bvn = bvn - tail
+        a /= 2
+        xs = (a * (x + 1)) ** 2                                       # (nodes,)
+        rs = np.sqrt(1 - xs)
+        asr = -(bs[:, None] / xs[None, :] + hk[:, None]) / 2
+        sp = 1 + c[:, None] * xs[None, :] * (1 + d[:, None] * xs[None, :])
+        ep = np.exp(-hk[:, None] * (1 - rs)[None, :] / (2 * (1 + rs))[None, :]) / rs[None, :]
+        terms = np.where(asr > -100, np.exp(np.maximum(asr, -100)) * (ep - sp), 0.0)
+        bvn = -(bvn + a * (terms @ w)) / _TWOPI
+    if r > 0:
+        return bvn + norm_cdf(-np.maximum(h, k))
+    return -bvn + np.maximum(0.0, norm_cdf(-h) - norm_cdf(-k))
+
+
+def bvn_upper(h, k, r: float) -> np.ndarray:
+    """P(X > h, Y > k) for standard bivariate normal X, Y with correlation r (arrays h, k)."""
+    h, k = np.broadcast_arrays(np.asarray(h, dtype=float), np.asarray(k, dtype=float))
+    shape = h.shape
+    h, k = h.ravel(), k.ravel()
+    if r == 0:
+        p = norm_cdf(-h) * norm_cdf(-k)
+    elif abs(r) < 0.925:
+        p = _bvn_moderate(h, k, r)
+    else:
+        p = _bvn_high(h, k, r)
+    return np.clip(p, 0.0, 1.0).reshape(shape)
+
+
+def fit_rho(long_df: pd.DataFrame) -> float:
+    """Correlation of home margin and game total over a team-perspective long table's games."""
+    home = long_df[long_df["is_home"].to_numpy(dtype=bool)]
+    pf = pd.to_numeric(home["points_for"], errors="coerce").to_numpy(dtype=float)
+    pa = pd.to_numeric(home["points_against"], errors="coerce").to_numpy(dtype=float)
+    ok = np.isfinite(pf) & np.isfinite(pa)
+    if ok.sum() < 3:
+        return 0.0
+    return float(np.corrcoef(pf[ok] - pa[ok], pf[ok] + pa[ok])[0, 1])
+
+
+COMBOS = ["home_over", "home_under", "away_over", "away_under"]
+
+
+@dataclass(frozen=True)
+class JointModel:
+    margin_sd: float = 13.45
+    total_sd: float = 10.0
+    rho: float = 0.0
+
+    @classmethod
+    def from_params(cls, params, long_df: Optional[pd.DataFrame] = None) -> "JointModel":
+        """Params.margin_total_rho when set, else fitted from `long_df`, else 0."""
+        rho = params.margin_total_rho
+        if rho is None:
+            rho = fit_rho(long_df) if long_df is not None else 0.0
+        return cls(params.margin_sd, params.total_sd, float(rho))
+
+    def combos(self, mu_margin, mu_total, spread_line, total_line) -> pd.DataFrame:
+        """
+        Same-game pairs, one row per game: P(side covers and total lands over/under),
+        for the home or away side of `spread_line` (home handicap) and `total_line`.
+        """
+        mu_m, mu_t, line, tot = np.broadcast_arrays(*(np.asarray(v, dtype=float)
+                                                      for v in (mu_margin, mu_total, spread_line, total_line)))
+        zm = (-line - mu_m) / self.margin_sd        # home covers: M > -line
+        zt = (tot - mu_t) / self.total_sd           # over: T > total_line
+        home_over = bvn_upper(zm, zt, self.rho)
+        home = norm_cdf(-zm)
+        over = norm_cdf(-zt)
+        out = pd.DataFrame({
+            "home_over": home_over,
+            "home_under": home - home_over,
+            "away_over": over - home_over,
+            "away_under": 1 - home - over + home_over,
+        })
+        return out.clip(lower=0.0)
+
+    def favorite_combos(self, mu_margin, mu_total, spread_line, total_line) -> pd.DataFrame:
+        """combos() relabeled by the market favorite (spread_line < 0: home is favored)."""
+        c = self.combos(mu_margin, mu_total, spread_line, total_line)
+        home_fav = np.asarray(spread_line, dtype=float) < 0
+        home_fav = np.broadcast_to(home_fav, (len(c),))
+        return pd.DataFrame({
+            "fav_over": np.where(home_fav, c["home_over"], c["away_over"]),
+            "fav_under": np.where(home_fav, c["home_under"], c["away_under"]),
+            "dog_over": np.where(home_fav, c["away_over"], c["home_over"]),
+            "dog_under": np.where(home_fav, c["away_under"], c["home_under"]),
+        })
+
+    def team_points(self, mu_margin, mu_total, side: str = "home") -> tuple[np.ndarray, float]:
+        """(mean, sd) of one team's points: (T + M)/2 for home, (T - M)/2 for away."""
+        s = 1.0 if side == "home" else -1.0
+        mean = (np.asarray(mu_total, dtype=float) + s * np.asarray(mu_margin, dtype=float)) / 2
+        var = (self.total_sd ** 2 + self.margin_sd ** 2 + 2 * s * self.rho * self.total_sd * self.margin_sd) / 4
+        return mean, math.sqrt(var)
+
+    def team_total_ladder(self, mu_margin, mu_total, ladder, side: str = "home") -> np.ndarray:
+        """P(team points > line) for every game x ladder line: shape (games, len(ladder))."""
+        mean, sd = self.team_points(mu_margin, mu_total, side)
+        ladder = np.asarray(ladder, dtype=float)
+        return norm_cdf((np.atleast_1d(mean)[:, None] - ladder[None, :]) / sd)
+
+
+def joint_model_for_cache(params, cache_dir: Optional[Path | str] = None) -> JointModel:
+    """JointModel.from_params, fitting rho from the parquet cache's long table when unset."""
+    long_df = None
+    if params.margin_total_rho is None and cache_dir is not None:
+        long_df = load_team_perspective_long(cache_dir)
+    return JointModel.from_params(params, long_df)
+
+
+def same_game_prices(lines: pd.DataFrame, model: JointModel, spread_line, total_line) -> pd.DataFrame:
+    """
+    Favorite/dog x over/under probabilities for nfl-lines output `lines` against
+    `spread_line` (home handicap) and `total_line`: arrays, scalars or column names.
+    """
+    spread_line = lines[spread_line] if isinstance(spread_line, str) else spread_line
+    total_line = lines[total_line] if isinstance(total_line, str) else total_line
+    spread_line, total_line = (np.broadcast_to(np.asarray(v, dtype=float), (len(lines),))
+                               for v in (spread_line, total_line))
+    combos = model.favorite_combos(lines["model_spread_home"], lines["model_total"], spread_line, total_line)
+    out = lines[["week", "date", "away", "home"]].reset_index(drop=True)
+    out["spread_line"], out["total_line"] = spread_line, total_line
+    return pd.concat([out, combos], axis=1)
+
+
+def simulate_combos(
+    model: JointModel, mu_margin, mu_total, spread_line, total_line, n: int = 200_000, seed: int = 0,
+) -> pd.DataFrame:
+    """Monte Carlo version of JointModel.combos (fallback and cross-check)."""
+    mu_m, mu_t, line, tot = (np.atleast_1d(np.asarray(v, dtype=float))
+                             for v in np.broadcast_arrays(mu_margin, mu_total, spread_line, total_line))
+    rng = np.random.default_rng(seed)
+    z1 = rng.standard_normal(n)
+    z2 = model.rho * z1 + math.sqrt(1 - model.rho ** 2) * rng.standard_normal(n)
+    rows = []
+    for m, t, l, o in zip(mu_m, mu_t, line, tot):
+        home = m + model.margin_sd * z1 + l > 0
+        over = t + model.total_sd * z2 > o
+        rows.append([np.mean(home & over), np.mean(home & ~over), np.mean(~home & over), np.mean(~home & ~over)])
+    return pd.DataFrame(rows, columns=COMBOS)
@@ -0,0 +1,186 @@
+## `src/nfl_model/pricing/margins.py`
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from ..io.files import write_atomic
+from ..io.long_builder import _resolve_cache_root
+from ..io.long_store import STORE_DIRNAME, load_team_perspective_long, store_fingerprint
+from .odds import norm_cdf
+
+# Final-margin distribution with NFL key numbers, as a precomputed lookup table.
+#
+# A normal margin around the model spread puts almost the same mass on 3 as on 2 or 4.
+# Real margins spike at 3, 7, 10, 14, ... The table keeps the normal shape (centered on
+# the model spread, `margin_sd` wide) and reweights each integer margin m by a key
+# multiplier w[|m|] estimated from history:
+#
+#   w[k] = (observed games with |margin| == k + prior) / (normal-expected games + prior)
+#
+# so thinly observed margins shrink to 1 (plain normal). Row i of the table is the
+# pmf over integer margins for expected margin mu = mu_lo + i * mu_step; lookups round
+# mu to the grid and index the cumulative table, so cover/push/loss is O(1) per line.
+#
+# The long table carries no historical closing lines, so the conditioning on the
+# spread is the normal center; the key-number shape is pooled across all games.
+
+TABLE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class MarginTable:
+    mu_lo: float
+    mu_step: float
+    m_lo: int                 # margin of column 0 (columns run m_lo .. -m_lo)
+    pmf: np.ndarray           # (n_mu, n_m) P(margin == m | mu)
+    cdf: np.ndarray           # (n_mu, n_m + 2) P(margin <= m), padded with 0 before and 1 after
+    key_weights: np.ndarray   # w[|m|], |m| = 0 .. -m_lo
+    margin_sd: float
+    n_games: int
+
+    @property
+    def digest(self) -> str:
+        h = hashlib.sha256()
+        h.update(np.asarray([self.mu_lo, self.mu_step, self.m_lo, self.margin_sd], dtype=float).tobytes())
+        h.update(np.ascontiguousarray(self.key_weights).tobytes())
+        return h.hexdigest()[:16]
+
+    def _rows(self, mu) -> np.ndarray:
+        i = np.rint((np.asarray(mu, dtype=float) - self.mu_lo) / self.mu_step)
+        return np.clip(np.nan_to_num(i, nan=0), 0, len(self.pmf) - 1).astype(np.intp)
+
+    def _cols(self, m) -> np.ndarray:
+        # index into the padded cdf: margin m -> m - m_lo + 1; below range -> 0, above -> last
+        return np.clip(np.asarray(m, dtype=np.int64) - self.m_lo + 1, 0, self.cdf.shape[1] - 1)
+
+    def cover_push_loss(self, mu, line) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Home (cover, push, loss) probabilities for expected home margin `mu` against a
+        home handicap `line` (-3.5 = home gives 3.5): the home side covers if margin + line > 0.
+        """
+        mu, line = np.broadcast_arrays(np.asarray(mu, dtype=float), np.asarray(line, dtype=float))
+        rows = self._rows(mu)
+        t = -line
+        k = np.floor(t)
+        at = self.cdf[rows, self._cols(np.nan_to_num(k))]
+        below = self.cdf[rows, self._cols(np.nan_to_num(k) - 1)]
+        push = np.where(t == k, at - below, 0.0)
+        cover = 1.0 - at
+        loss = 1.0 - cover - push
+        bad = ~(np.isfinite(mu) & np.isfinite(line))
+        if bad.any():
+            cover, push, loss = (np.where(bad, np.nan, a) for a in (cover, push, loss))
+        return cover, push, loss
+
+    def win_prob(self, mu) -> np.ndarray:
+        """Home win probability, ties split evenly (so home + away = 1)."""
+        cover, push, _ = self.cover_push_loss(mu, 0.0)
+        return cover + 0.5 * push
+
+    def save(self, path: Path | str) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = dict(
+            version=TABLE_VERSION, mu_lo=self.mu_lo, mu_step=self.mu_step, m_lo=self.m_lo,
+            pmf=self.pmf, key_weights=self.key_weights, margin_sd=self.margin_sd, n_games=self.n_games,
+        )
+        # np.savez appends '.npz' to names without it; hand it an open file instead
+        def _write(p: Path) -> None:
+            with open(p, "wb") as fh:
+                np.savez(fh, **arrays)
+        write_atomic(path, _write)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "MarginTable":
+        with np.load(path) as z:
+            if int(z["version"]) != TABLE_VERSION:
+                raise ValueError(f"{path}: margin table version {int(z['version'])}, expected {TABLE_VERSION}")
+            pmf = z["pmf"]
+            return cls(float(z["mu_lo"]), float(z["mu_step"]), int(z["m_lo"]), pmf, _padded_cdf(pmf),
+                       z["key_weights"], float(z["margin_sd"]), int(z["n_games"]))
+
+
+def _padded_cdf(pmf: np.ndarray) -> np.ndarray:
+    c = np.cumsum(pmf, axis=1)
+    return np.hstack([np.zeros((len(pmf), 1)), c, np.ones((len(pmf), 1))])
+
+
+def game_margins(long_df: pd.DataFrame) -> np.ndarray:
+    """Home-minus-away final margin, one per game of a team-perspective long table."""
+    home = long_df[long_df["is_home"].to_numpy(dtype=bool)]
+    pf = pd.to_numeric(home["points_for"], errors="coerce").to_numpy(dtype=float)
+    pa = pd.to_numeric(home["points_against"], errors="coerce").to_numpy(dtype=float)
+    m = pf - pa
+    return m[np.isfinite(m)].astype(np.int64)
+
+
+def _normal_bins(mu: np.ndarray, m: np.ndarray, sd: float) -> np.ndarray:
+    """P(round(X) == m) for X ~ N(mu, sd): (len(mu), len(m))."""
+    hi = norm_cdf((m[None, :] + 0.5 - mu[:, None]) / sd)
+    lo = norm_cdf((m[None, :] - 0.5 - mu[:, None]) / sd)
+    return hi - lo
+
+
+def key_weights(margins: np.ndarray, margin_sd: float, max_margin: int, prior: float = 5.0) -> np.ndarray:
+    """Shrunk observed/normal-expected ratio of games at each |margin| 0 .. max_margin."""
+    margins = np.asarray(margins, dtype=np.int64)
+    n = len(margins)
+    obs = np.bincount(np.minimum(np.abs(margins), max_margin), minlength=max_margin + 1).astype(float)
+    m = np.arange(-max_margin, max_margin + 1)
+    center = float(margins.mean()) if n else 0.0
+    p = _normal_bins(np.array([center]), m, margin_sd)[0]
+    exp = np.zeros(max_margin + 1)
+    np.add.at(exp, np.abs(m), p * n)
+    return (obs + prior) / (exp + prior)
+
+
+def build_margin_table(
+    margins: np.ndarray,
+    margin_sd: float = 13.45,
+    spread_cap: float = 30.0,
+    mu_step: float = 0.05,
+    max_margin: int = 80,
+    prior: float = 5.0,
+) -> MarginTable:
+    """Key-number margin table for expected margins in [-spread_cap, spread_cap]."""
+    w = key_weights(margins, margin_sd, max_margin, prior)
+    n_mu = int(round(2 * spread_cap / mu_step)) + 1
+    mu = -spread_cap + mu_step * np.arange(n_mu)
+    m = np.arange(-max_margin, max_margin + 1)
+    pmf = _normal_bins(mu, m, margin_sd) * w[np.abs(m)][None, :]
+    pmf /= pmf.sum(axis=1, keepdims=True)
+    return MarginTable(float(-spread_cap), float(mu_step), -max_margin, pmf, _padded_cdf(pmf),
+                       w, float(margin_sd), int(len(margins)))
+
+
+def margin_table_for_cache(
+    cache_dir: Path | str,
+    margin_sd: float = 13.45,
+    spread_cap: float = 30.0,
+    store_dir: Optional[Path | str] = None,
+) -> MarginTable:
+    """
+    Margin table built from a parquet cache's long table, persisted next to the team
+    features in '<cache_root>/derived/' and keyed by the cache fingerprint.
+    """
+    store_dir = Path(store_dir) if store_dir else _resolve_cache_root(cache_dir) / STORE_DIRNAME
+    long_df = load_team_perspective_long(cache_dir, store_dir=store_dir)
+    # '<params>_<data>' names: a rebuild only replaces tables for the same parameters
+    params_key = hashlib.sha256(f"{margin_sd}|{spread_cap}|{TABLE_VERSION}".encode()).hexdigest()[:8]
+    data_key = store_fingerprint(cache_dir, store_dir)[:16]
+    path = store_dir / f"margin_table_{params_key}_{data_key}.npz"
+    if path.exists():
+        return MarginTable.load(path)
+    table = build_margin_table(game_margins(long_df), margin_sd, spread_cap)
+    table.save(path)
+    for old in store_dir.glob(f"margin_table_{params_key}_*.npz"):
+        if old != path:
+            old.unlink(missing_ok=True)
+    return table
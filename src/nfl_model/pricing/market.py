@@ -0,0 +1,176 @@
+## `src/nfl_model/pricing/market.py`
+
+from __future__ import annotations
+
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from .. import profiling
+from ..config import Params
+from ..io.odds_store import MARKETS, game_keys
+from ..teams import team_codes
+from .margins import MarginTable
+from .odds import no_vig, norm_cdf, payout
+
+# Model lines vs market odds, per (game, book).
+#
+# For every game in the model output and every book that quoted it, take each
+# market's latest tick at the bet time (as-of) and at the close, then compare:
+#
+#   spread     edge_pts = model_spread_home + line   (> 0: the home side has value)
+#   total      edge_pts = model_total - line         (> 0: the over has value)
+#   moneyline  edge_prob = model home win prob - no-vig market prob
+#
+# CLV is measured for the side the edge points to: line moved toward it by the close
+# (points) for spreads/totals, no-vig probability gained by the close for moneylines.
+
+EASTERN_TZ = "US/Eastern"
+AsOf = Union[None, str, pd.Timestamp]
+
+_QUOTE = ["line", "price_a", "price_b"]
+
+
+def _ns(values) -> np.ndarray:
+    return pd.DatetimeIndex(pd.to_datetime(values, utc=True)).as_unit("ns").asi8
+
+
+def asof_quotes(ticks: pd.DataFrame, queries: pd.DataFrame, market: str) -> pd.DataFrame:
+    """
+    Latest `market` tick at or before each query's time, for every book that quoted the
+    game. `queries` has '_row', 'game_key' and 't' (UTC); returns one row per
+    (_row, book) with line/price_a/price_b (NaN when the book had not quoted yet).
+    """
+    tk = ticks[(ticks["market"].to_numpy() == MARKETS.index(market))
+               & ticks["game_key"].isin(queries["game_key"]).to_numpy()]
+    book_code, books = pd.factorize(tk["book"], sort=True)
+    nb = max(len(books), 1)
+    # Times as int64 ns: tz-aware columns would round-trip through Timestamp objects.
+    tk = pd.DataFrame({
+        "ts": _ns(tk["ts"]),
+        "sid": tk["game_key"].to_numpy(dtype=np.int64) * nb + book_code,
+        **{c: tk[c].to_numpy() for c in _QUOTE},
+    }).sort_values("ts", kind="mergesort")
+
+    # One query per (game, book) that ever quoted this market for the game.
+    pairs = pd.DataFrame({"sid": np.unique(tk["sid"].to_numpy())})
+    pairs["game_key"] = pairs["sid"] // nb
+    pairs["book"] = np.asarray(books, dtype=object)[pairs["sid"] % nb] if len(books) else pd.Series(dtype=object)
+    q = queries[["_row", "game_key", "t"]].merge(pairs, on="game_key")
+    q["t"] = _ns(q["t"])
+    q = q.sort_values("t", kind="mergesort")
+    m = pd.merge_asof(q, tk, left_on="t", right_on="ts", by="sid", direction="backward")
+    return m[["_row", "book"] + _QUOTE]
+
+
+def _times(lines: pd.DataFrame, spec: AsOf, default: pd.Series) -> pd.Series:
+    if spec is None:
+        return default
+    if isinstance(spec, str) and spec in lines.columns:
+        return pd.to_datetime(lines[spec], utc=True).reset_index(drop=True)
+    ts = pd.Timestamp(spec)
+    ts = ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+    return pd.Series(ts, index=default.index)
+
+
+def close_times(lines: pd.DataFrame) -> pd.Series:
+    """Kickoff (UTC) when the lines carry 'kickoff_utc', else the end of the Eastern game date."""
+    if "kickoff_utc" in lines.columns:
+        return pd.to_datetime(lines["kickoff_utc"], utc=True).reset_index(drop=True)
+    day_end = pd.to_datetime(lines["date"]).dt.normalize() + pd.Timedelta(days=1)
+    return day_end.dt.tz_localize(EASTERN_TZ).dt.tz_convert("UTC").reset_index(drop=True)
+
+
+@profiling.timed("market.edges")
+def market_edges(
+    lines: pd.DataFrame,
+    ticks: pd.DataFrame,
+    *,
+    as_of: AsOf = None,
+    params: Params = Params(),
+    margins: Optional[MarginTable] = None,
+) -> pd.DataFrame:
+    """
+    Edges, no-vig probabilities and CLV for model `lines` (nfl-lines output) against
+    odds `ticks` (odds_store.load_ticks). `as_of` is the bet time: None (the close),
+    a timestamp, or a column of `lines`. One row per (game, book). The normal margin
+    and total widths are params.margin_sd / params.total_sd, as in pricing.joint. With `margins`,
+    spread probabilities come from the key-number table: push odds on whole-number
+    lines, and the model side probability is cover / (cover + loss).
+    """
+    margin_sd, total_sd = params.margin_sd, params.total_sd
+    lines = lines.reset_index(drop=True)
+    key = game_keys(lines["date"], team_codes(lines["home"]), team_codes(lines["away"]))
+    t_close = close_times(lines)
+    t_bet = _times(lines, as_of, t_close)
+    base = pd.DataFrame({"_row": np.arange(len(lines)), "game_key": key})
+
+    out = None
+    for market in MARKETS:
+        bet = asof_quotes(ticks, base.assign(t=t_bet), market)
+        close = asof_quotes(ticks, base.assign(t=t_close), market)
+        both = bet.merge(close, on=["_row", "book"], suffixes=("", "_close"))
+        both = both.rename(columns={c: f"{market}_{c}" for c in both.columns if c not in ("_row", "book")})
+        out = both if out is None else out.merge(both, on=["_row", "book"], how="outer")
+    out = out.sort_values(["_row", "book"], kind="mergesort").reset_index(drop=True)
+
+    game_cols = [c for c in ("week", "date", "away", "home", "model_spread_home", "model_total") if c in lines.columns]
+    g = lines.loc[out["_row"].to_numpy(), game_cols].reset_index(drop=True)
+    res = pd.concat([g, out[["book"]]], axis=1)
+    ms = g["model_spread_home"].to_numpy(dtype=float)
+    mt = g["model_total"].to_numpy(dtype=float)
+
+    # spread: price_a = home, price_b = away
+    line, close = out["spread_line"].to_numpy(float), out["spread_line_close"].to_numpy(float)
+    nv_home, _, vig = no_vig(out["spread_price_a"], out["spread_price_b"])
+    res["spread_line"] = line
+    res["spread_price_home"] = out["spread_price_a"].to_numpy(float)
+    res["spread_price_away"] = out["spread_price_b"].to_numpy(float)
+    res["spread_vig"] = vig
+    res["spread_nv_home"] = nv_home
+    if margins is not None:
+        cover, push, loss = margins.cover_push_loss(ms, line)
+        res["spread_push"] = push
+        with np.errstate(divide="ignore", invalid="ignore"):
+            res["spread_model_home"] = cover / (cover + loss)
+    else:
+        res["spread_model_home"] = norm_cdf((ms + line) / margin_sd)
+    res["spread_edge_pts"] = ms + line
+    res["spread_edge_prob"] = res["spread_model_home"] - nv_home
+    res["spread_close"] = close
+    res["spread_clv_pts"] = np.sign(res["spread_edge_pts"]) * (line - close)
+
+    # total: price_a = over, price_b = under
+    line, close = out["total_line"].to_numpy(float), out["total_line_close"].to_numpy(float)
+    nv_over, _, vig = no_vig(out["total_price_a"], out["total_price_b"])
+    res["total_line"] = line
+    res["total_price_over"] = out["total_price_a"].to_numpy(float)
+    res["total_price_under"] = out["total_price_b"].to_numpy(float)
+    res["total_vig"] = vig
+    res["total_nv_over"] = nv_over
+    res["total_model_over"] = norm_cdf((mt - line) / total_sd)
+    res["total_edge_pts"] = mt - line
+    res["total_edge_prob"] = res["total_model_over"] - nv_over
+    res["total_close"] = close
+    res["total_clv_pts"] = np.sign(res["total_edge_pts"]) * (close - line)
+
+    # moneyline: price_a = home, price_b = away
+    ph, pa = out["moneyline_price_a"].to_numpy(float), out["moneyline_price_b"].to_numpy(float)
+    nv_home, _, vig = no_vig(ph, pa)
+    nv_close, _, _ = no_vig(out["moneyline_price_a_close"], out["moneyline_price_b_close"])
+    model_home = (lines.loc[out["_row"].to_numpy(), "home_win_prob"].to_numpy(float)
+                  if "home_win_prob" in lines.columns else norm_cdf(ms / margin_sd))
+    res["ml_price_home"] = ph
+    res["ml_price_away"] = pa
+    res["ml_vig"] = vig
+    res["ml_nv_home"] = nv_home
+    res["ml_model_home"] = model_home
+    res["ml_edge_prob"] = model_home - nv_home
+    res["ml_ev_home"] = model_home * payout(ph) - (1 - model_home)
+    res["ml_ev_away"] = (1 - model_home) * payout(pa) - model_home
+    res["ml_close_nv_home"] = nv_close
+    res["ml_clv_prob"] = np.sign(res["ml_edge_prob"]) * (nv_close - nv_home)
+
+    profiling.count("rows.market_edges", len(res))
+    return res
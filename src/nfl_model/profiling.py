@@ -0,0 +1,174 @@
+## `src/nfl_model/profiling.py`
+
+from __future__ import annotations
+
+import functools
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+# Process-wide stage timers and counters. Off by default: every hook is then a single
+# check of the module-level ENABLED flag (timer() hands back a shared no-op context).
+#
+#   timer("engine.price")     wall time per stage: calls, total, max
+#   count("http.bytes", n)    monotonically increasing counters
+#
+# enable() switches collection on; snapshot()/to_prometheus()/dump() read it out.
+# Updates take a lock, so thread-pool stages and caches can record concurrently.
+# Ingestion code (nfl_lines) records here through nfl_lines.utils.profiling once an
+# entry point installs this module as its collector.
+
+ENABLED = False
+
+_timers: dict[str, list[float]] = {}    # name -> [calls, total_s, max_s]
+_counters: dict[str, float] = {}
+_lock = threading.Lock()
+
+
+class _NullTimer:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL = _NullTimer()
+
+
+class _Timer:
+    __slots__ = ("name", "t0")
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        add_time(self.name, time.perf_counter() - self.t0)
+        return False
+
+
+def enable(on: bool = True) -> None:
+    global ENABLED
+    ENABLED = on
+
+
+def reset() -> None:
+    with _lock:
+        _timers.clear()
+        _counters.clear()
+
+
+def add_time(name: str, seconds: float) -> None:
+    with _lock:
+        t = _timers.get(name)
+        if t is None:
+            _timers[name] = [1, seconds, seconds]
+        else:
+            t[0] += 1
+            t[1] += seconds
+            if seconds > t[2]:
+                t[2] = seconds
+
+
+def timer(name: str):
+    """Context manager timing one stage; a shared no-op when profiling is off."""
+    return _Timer(name) if ENABLED else _NULL
+
+
+def timed(name: str) -> Callable:
+    """Decorator form of timer()."""
+    def _wrap(fn):
+        @functools.wraps(fn)
+        def inner(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            with _Timer(name):
+                return fn(*args, **kwargs)
+        return inner
+    return _wrap
+
+
+def count(name: str, n: float = 1) -> None:
+    if ENABLED:
+        with _lock:
+            _counters[name] = _counters.get(name, 0) + n
+
+
+def snapshot() -> dict:
+    with _lock:
+        return {
+            "timers": {
+                k: {"calls": int(c), "total_s": round(tot, 6), "max_s": round(mx, 6)}
+                for k, (c, tot, mx) in sorted(_timers.items())
+            },
+            "counters": dict(sorted(_counters.items())),
+        }
+
+
+def merge(snap: dict) -> None:
+    """Fold a snapshot() taken elsewhere (e.g. in a worker process) into this process's totals."""
+    with _lock:
+        for k, t in snap.get("timers", {}).items():
+            cur = _timers.get(k)
+            if cur is None:
+                _timers[k] = [t["calls"], t["total_s"], t["max_s"]]
+            else:
+                cur[0] += t["calls"]
+                cur[1] += t["total_s"]
+                cur[2] = max(cur[2], t["max_s"])
+        for k, v in snap.get("counters", {}).items():
+            _counters[k] = _counters.get(k, 0) + v
+
+
+def to_prometheus(prefix: str = "nfl") -> str:
+    """Prometheus text exposition of the current snapshot."""
+    def esc(v: str) -> str:
+        return v.replace("\\", "\\\\").replace('"', '\\"')
+
+    lines = [
+        f"# HELP {prefix}_stage_calls_total Calls per instrumented stage.",
+        f"# TYPE {prefix}_stage_calls_total counter",
+    ]
+    lines += [f'{prefix}_stage_calls_total{{stage="{esc(k)}"}} {int(c)}' for k, (c, _, _) in sorted(_timers.items())]
+    lines += [
+        f"# HELP {prefix}_stage_seconds_total Wall time per instrumented stage.",
+        f"# TYPE {prefix}_stage_seconds_total counter",
+    ]
+    lines += [f'{prefix}_stage_seconds_total{{stage="{esc(k)}"}} {t:.6f}' for k, (_, t, _) in sorted(_timers.items())]
+    lines += [
+        f"# HELP {prefix}_stage_seconds_max Slowest single call per stage.",
+        f"# TYPE {prefix}_stage_seconds_max gauge",
+    ]
+    lines += [f'{prefix}_stage_seconds_max{{stage="{esc(k)}"}} {m:.6f}' for k, (_, _, m) in sorted(_timers.items())]
+    lines += [
+        f"# HELP {prefix}_events_total Counted events (HTTP calls, bytes, cache hits, rows).",
+        f"# TYPE {prefix}_events_total counter",
+    ]
+    lines += [f'{prefix}_events_total{{name="{esc(k)}"}} {v:g}' for k, v in sorted(_counters.items())]
+    return "\n".join(lines) + "\n"
+
+
+def dump(fmt: str = "json", out: Optional[Path | str] = None) -> None:
+    """Write the snapshot as 'json' or 'prom' to `out` (a path), or stderr."""
+    text = to_prometheus() if fmt == "prom" else json.dumps(snapshot(), indent=1) + "\n"
+    if out is None:
+        sys.stderr.write(text)
+        return
+    Path(out).parent.mkdir(parents=True, exist_ok=True)
+    Path(out).write_text(text)
+
+
+def add_cli_flags(ap) -> None:
+    """--profile / --profile-out for argparse-based entry points."""
+    ap.add_argument("--profile", nargs="?", const="json", choices=["json", "prom"],
+                    help="Collect stage timings and counters; print them as JSON (default) or Prometheus text")
+    ap.add_argument("--profile-out", type=Path, help="Write the --profile output here instead of stderr")
@@ -1,10 +1,23 @@
 ## `src/nfl_model/schemas.py`
 
 from __future__ import annotations
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import AfterValidator, BaseModel, Field
+from typing import Annotated, ClassVar, Optional
+
+# Row schemas. validation.py derives whole-DataFrame checks from these (types,
+# nullability, Field bounds, AmericanOdds, unique_keys), so constraints live here once.
+
+def _american(v: int) -> int:
+    if -100 < v < 100:
+        raise ValueError("American odds must be <= -100 or >= 100")
+    return v
+
+AmericanOdds = Annotated[int, AfterValidator(_american)]
+Probability = Annotated[float, Field(ge=0.0, le=1.0)]
 
 class TeamRating(BaseModel):
+    unique_keys: ClassVar[tuple[str, ...]] = ("team",)
+
     team: str
     power: float
     off: float | None = None
@@ -12,23 +25,24 @@ class TeamRating(BaseModel):
     qb_points: float | None = None
 
 class Game(BaseModel):
-    week: int
+    week: int = Field(ge=0, le=30)
     date: str
     away: str
     home: str
-    neutral: int = 0
+    neutral: int = Field(default=0, ge=0, le=1)
+    site: str | None = None  # venue or team stadium for neutral games (nfl_model.travel)
 
 class LineOutput(BaseModel):
-    week: int
+    week: int = Field(ge=0, le=30)
     date: str
     away: str
     home: str
-    neutral: int
+    neutral: int = Field(ge=0, le=1)
     model_spread_home: float
-    model_total: float
+    model_total: float = Field(ge=0.0)
     home_team_total: float
     away_team_total: float
-    home_win_prob: float
-    away_win_prob: float
-    ml_home: int
-    ml_away: int
+    home_win_prob: Probability
+    away_win_prob: Probability
+    ml_home: AmericanOdds
+    ml_away: AmericanOdds
@@ -0,0 +1,183 @@
+## `src/nfl_model/season.py`
+
+from __future__ import annotations
+
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import repeat
+from pathlib import Path
+from typing import Iterable, Optional, Protocol
+
+import pandas as pd
+
+from . import profiling
+from .config import Params, PipelineConfig
+from .engine import Engine, merge_ratings
+from .features import FeatureStore
+from .io.loaders import load_cached_schedule, load_ratings
+from .pricing.greeks import GREEK_COLUMNS
+from .pricing.margins import MarginTable
+from .schemas import LineOutput
+from .travel import ScheduleContext
+
+# Season mode: price many weeks of one season in one run.
+#
+# Each week's games come from the parquet cache and are priced against the ratings
+# valid as of that week, supplied by a RatingsSource:
+#
+#   StaticRatings("ratings.csv")       one file for every week
+#   RatingsDir("ratings/")             '{season}_wk{week}.csv' or 'wk{week}.csv'; a week
+#                                      uses the latest file at or before (season, week)
+#   io.ratings_store.RatingsStore      the latest version tagged at or before the week
+#
+# Weeks are independent, so they are priced on a process pool and concatenated in
+# week order.
+
+OUTPUT_COLUMNS = list(LineOutput.model_fields)
+RATINGS_FILE_RE = re.compile(r"^(?:(?P<season>\d{4})_)?wk0*(?P<week>\d+)\.csv$", re.IGNORECASE)
+
+
+class RatingsSource(Protocol):
+    def asof(self, season: int, week: int) -> tuple[str, pd.DataFrame]:
+        """(label, load_ratings frame) valid for games of (season, week)."""
+        ...
+
+
+class StaticRatings:
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._ratings: Optional[pd.DataFrame] = None
+
+    def asof(self, season: int, week: int) -> tuple[str, pd.DataFrame]:
+        if self._ratings is None:
+            self._ratings = load_ratings(self.path)
+        return self.path.name, self._ratings
+
+
+class RatingsDir:
+    def __init__(self, root: Path | str):
+        self.root = Path(root)
+        self._files: list[tuple[Optional[int], int, Path]] = []
+        for p in sorted(self.root.glob("*.csv")):
+            m = RATINGS_FILE_RE.match(p.name)
+            if m:
+                season = int(m.group("season")) if m.group("season") else None
+                self._files.append((season, int(m.group("week")), p))
+        if not self._files:
+            raise FileNotFoundError(f"No ratings files ('{{season}}_wk{{week}}.csv' or 'wk{{week}}.csv') in {self.root}")
+        self._loaded: dict[Path, pd.DataFrame] = {}
+
+    def path_asof(self, season: int, week: int) -> Path:
+        # season-less files apply to any season; at equal (season, week) a season file wins
+        best = None
+        for s, w, p in self._files:
+            key = (season if s is None else s, w, s is not None)
+            if key[:2] <= (season, week) and (best is None or key > best[0]):
+                best = (key, p)
+        if best is None:
+            raise FileNotFoundError(f"No ratings in {self.root} at or before {season} week {week}")
+        return best[1]
+
+    def asof(self, season: int, week: int) -> tuple[str, pd.DataFrame]:
+        p = self.path_asof(season, week)
+        if p not in self._loaded:
+            self._loaded[p] = load_ratings(p)
+        return p.name, self._loaded[p]
+
+
+def parse_weeks(spec: str) -> list[int]:
+    """'1-18', '3', '1,4,9-12' -> sorted distinct weeks."""
+    weeks: set[int] = set()
+    for part in str(spec).split(","):
+        part = part.strip()
+        if not part:
+            continue
+        lo, _, hi = part.partition("-")
+        lo_i, hi_i = int(lo), int(hi or lo)
+        if hi_i < lo_i:
+            raise ValueError(f"Bad week range: {part!r}")
+        weeks.update(range(lo_i, hi_i + 1))
+    return sorted(weeks)
+
+
+@dataclass(frozen=True)
+class WeekJob:
+    season: int
+    week: int
+    games: pd.DataFrame
+    ratings_label: str
+    ratings: pd.DataFrame
+
+
+def price_week(
+    job: WeekJob,
+    params: Params,
+    pipe: PipelineConfig,
+    features_cache: Optional[Path] = None,
+    margins: Optional[MarginTable] = None,
+    schedule: Optional[ScheduleContext] = None,
+    greeks: bool = False,
+) -> pd.DataFrame:
+    """One week's lines (OUTPUT_COLUMNS plus 'season', 'ratings' and GREEK_COLUMNS if asked); runs in worker processes."""
+    features = FeatureStore(features_cache) if features_cache else None
+    eng = Engine(params, pipe, features, margins, schedule)
+    out = eng.price(merge_ratings(job.games, job.ratings), greeks=greeks)
+    out = out[["season"] + OUTPUT_COLUMNS + (GREEK_COLUMNS if greeks else [])].copy()
+    out["ratings"] = job.ratings_label
+    return out
+
+
+def _price_week_profiled(job: WeekJob, *args) -> tuple[pd.DataFrame, dict]:
+    """price_week in a worker with profiling on; the snapshot goes back to the parent."""
+    profiling.enable()
+    profiling.reset()
+    out = price_week(job, *args)
+    return out, profiling.snapshot()
+
+
+@profiling.timed("season.price")
+def price_season(
+    cache_dir: Path | str,
+    season: int,
+    weeks: Optional[Iterable[int]],
+    ratings: RatingsSource,
+    params: Params,
+    pipe: PipelineConfig,
+    *,
+    features_cache: Optional[Path] = None,
+    margins: Optional[MarginTable] = None,
+    workers: Optional[int] = None,
+    greeks: bool = False,
+) -> pd.DataFrame:
+    """
+    Lines for every cached week of `season` in `weeks` (all when None), each priced
+    with `ratings.asof(season, week)`, on up to `workers` processes (default: CPUs).
+    """
+    schedule = load_cached_schedule(cache_dir, season, weeks)
+    jobs = []
+    for week, games in schedule.groupby("week", sort=True):
+        label, frame = ratings.asof(int(season), int(week))
+        jobs.append(WeekJob(int(season), int(week), games.reset_index(drop=True), label, frame))
+    if features_cache:
+        FeatureStore(features_cache).state()  # build/persist once, before workers read it
+    context = None
+    if Engine(params, pipe, margins=margins).uses_schedule:
+        # rest days need every game of the season (and last season's finale), not just the priced weeks
+        context = ScheduleContext.from_cache(cache_dir, [int(season) - 1, int(season)])
+
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    if workers == 1:
+        parts = [price_week(job, params, pipe, features_cache, margins, context, greeks) for job in jobs]
+    else:
+        fn = _price_week_profiled if profiling.ENABLED else price_week
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = list(pool.map(fn, jobs, repeat(params), repeat(pipe), repeat(features_cache), repeat(margins),
+                                  repeat(context), repeat(greeks)))
+        if profiling.ENABLED:
+            for _, snap in parts:
+                profiling.merge(snap)
+            parts = [out for out, _ in parts]
+    profiling.count("season.weeks", len(jobs))
+    return pd.concat(parts, ignore_index=True)
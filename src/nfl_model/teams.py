@@ -0,0 +1,122 @@
+## `src/nfl_model/teams.py`
+
+from __future__ import annotations
+import sys
+from typing import Iterable
+
+import numpy as np
+import pandas as pd
+
+# Fixed franchise dictionary. A team's integer code is its position here, so the
+# order is part of the on-disk/in-memory format: only ever append.
+TEAMS: dict[str, str] = {
+    "ARI": "Arizona Cardinals",
+    "ATL": "Atlanta Falcons",
+    "BAL": "Baltimore Ravens",
+    "BUF": "Buffalo Bills",
+    "CAR": "Carolina Panthers",
+    "CHI": "Chicago Bears",
+    "CIN": "Cincinnati Bengals",
+    "CLE": "Cleveland Browns",
+    "DAL": "Dallas Cowboys",
+    "DEN": "Denver Broncos",
+    "DET": "Detroit Lions",
+    "GB": "Green Bay Packers",
+    "HOU": "Houston Texans",
+    "IND": "Indianapolis Colts",
+    "JAX": "Jacksonville Jaguars",
+    "KC": "Kansas City Chiefs",
+    "LAC": "Los Angeles Chargers",
+    "LAR": "Los Angeles Rams",
+    "LV": "Las Vegas Raiders",
+    "MIA": "Miami Dolphins",
+    "MIN": "Minnesota Vikings",
+    "NE": "New England Patriots",
+    "NO": "New Orleans Saints",
+    "NYG": "New York Giants",
+    "NYJ": "New York Jets",
+    "PHI": "Philadelphia Eagles",
+    "PIT": "Pittsburgh Steelers",
+    "SEA": "Seattle Seahawks",
+    "SF": "San Francisco 49ers",
+    "TB": "Tampa Bay Buccaneers",
+    "TEN": "Tennessee Titans",
+    "WAS": "Washington Commanders",
+}
+
+# Older full names the API returns for earlier seasons, mapped to today's franchise.
+HISTORICAL_NAMES: dict[str, str] = {
+    "Oakland Raiders": "LV",
+    "San Diego Chargers": "LAC",
+    "St. Louis Rams": "LAR",
+    "Washington Redskins": "WAS",
+    "Washington Football Team": "WAS",
+}
+
+# Other spellings seen in ratings sheets, odds feeds and older data: alternate and
+# relocated-franchise abbreviations, plus nicknames beyond the last word of the full
+# name (which is added automatically: "Chiefs", "49ers", ...).
+ALIASES: dict[str, str] = {
+    "ARZ": "ARI", "BLT": "BAL", "CLV": "CLE", "HST": "HOU", "JAC": "JAX",
+    "KAN": "KC", "KCC": "KC", "GNB": "GB", "NWE": "NE", "NOR": "NO",
+    "SFO": "SF", "TAM": "TB", "WSH": "WAS", "LVR": "LV", "LA": "LAR",
+    "OAK": "LV", "SD": "LAC", "SDG": "LAC", "STL": "LAR",
+    "LA Rams": "LAR", "LA Chargers": "LAC", "Niners": "SF",
+    "Redskins": "WAS", "Football Team": "WAS",
+}
+
+TEAM_CODES: tuple[str, ...] = tuple(TEAMS)
+TEAM_DTYPE = pd.CategoricalDtype(list(TEAM_CODES))
+
+
+def clean_names(values: pd.Series) -> pd.Series:
+    """Lookup form of team names: punctuation/whitespace dropped, upper-cased ('St. Louis Rams' -> 'STLOUISRAMS')."""
+    return values.astype(str).str.replace(r"[^\w]+", "", regex=True).str.upper()
+
+
+def _compile() -> dict[str, int]:
+    spellings: dict[str, str] = {}
+    for abbr, name in TEAMS.items():
+        spellings[abbr] = abbr
+        spellings[name] = abbr
+        spellings[name.rsplit(" ", 1)[-1]] = abbr
+    spellings.update(HISTORICAL_NAMES)
+    spellings.update(ALIASES)
+    keys = clean_names(pd.Series(list(spellings), dtype=object))
+    return {sys.intern(k): TEAM_CODES.index(spellings[raw]) for k, raw in zip(keys, spellings)}
+
+
+# cleaned spelling -> team code, built once at import
+_LOOKUP: dict[str, int] = _compile()
+
+
+def resolve_teams(values: Iterable) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (codes, keys) for any team spellings in one pass over the distinct values:
+    int8 codes into TEAM_CODES (-1 when unknown) and join keys (the abbreviation,
+    or the stripped upper-cased input for unknown names).
+    """
+    if not isinstance(values, (pd.Series, pd.Index, np.ndarray)):
+        values = pd.Series(list(values), dtype=object)
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    names = pd.Series(np.asarray(uniques, dtype=object), dtype=object)
+    mapped = np.fromiter((_LOOKUP.get(k, -1) for k in clean_names(names)), dtype=np.int8, count=len(names))
+    abbr = np.asarray(TEAM_CODES + ("",), dtype=object)[mapped]
+    keys = np.where(mapped >= 0, abbr, names.map(str).str.strip().str.upper().to_numpy(dtype=object))
+    return mapped[codes], keys[codes]
+
+
+def team_codes(values: Iterable) -> np.ndarray:
+    """
+    Map abbreviations, full names, nicknames or historical names to int8 team codes
+    (index into TEAM_CODES). Raises ValueError on unknown names.
+    """
+    codes, keys = resolve_teams(values)
+    if (codes < 0).any():
+        raise ValueError(f"Unknown team name(s): {sorted(set(keys[codes < 0]))}")
+    return codes
+
+
+def team_categorical(values: Iterable) -> pd.Categorical:
+    """Team names/abbreviations as a categorical over the fixed TEAM_CODES dictionary."""
+    return pd.Categorical.from_codes(team_codes(values), dtype=TEAM_DTYPE)
@@ -0,0 +1,183 @@
+## `src/nfl_model/travel.py`
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from .io.loaders import load_cached_schedule
+from .teams import TEAM_CODES, clean_names, resolve_teams
+
+# Rest and travel inputs for the rest_days / travel / timezone_shift factors.
+#
+# Sites are the 32 home stadiums (site code == team code) followed by neutral and
+# international venues. Great-circle distances between every pair of sites and each
+# site's UTC offset are computed once at import:
+#
+#   SITE_MILES[i, j]   miles between sites i and j
+#   SITE_UTC[i]        hours from UTC (standard time; Arizona listed with Mountain,
+#                      which matches Pacific during the DST part of the season)
+#
+# A ScheduleContext holds every (team, game day) of a schedule as one sorted int64
+# key array; a team's rest before a game is a single searchsorted for the previous
+# key. schedule_features() turns a slate into per-game columns the factors read:
+#
+#   home_rest_days, away_rest_days    days since the team's previous game (NaN: none known)
+#   home_travel_mi, away_travel_mi    home stadium -> game site
+#   home_tz_shift, away_tz_shift      site UTC offset - home stadium UTC offset (hours)
+#
+# Games are at the home team's stadium unless the schedule has a 'site' column naming
+# a venue below or a team (neutral games at another team's stadium). A neutral game
+# with no named site is somewhere unknown: its travel and tz columns are NaN.
+
+# site: (latitude, longitude, UTC offset)
+STADIUMS: dict[str, tuple[float, float, float]] = {
+    "ARI": (33.5276, -112.2626, -7), "ATL": (33.7554, -84.4008, -5), "BAL": (39.2780, -76.6227, -5),
+    "BUF": (42.7738, -78.7870, -5), "CAR": (35.2258, -80.8528, -5), "CHI": (41.8623, -87.6167, -6),
+    "CIN": (39.0954, -84.5160, -5), "CLE": (41.5061, -81.6995, -5), "DAL": (32.7473, -97.0945, -6),
+    "DEN": (39.7439, -105.0201, -7), "DET": (42.3400, -83.0456, -5), "GB": (44.5013, -88.0622, -6),
+    "HOU": (29.6847, -95.4107, -6), "IND": (39.7601, -86.1639, -5), "JAX": (30.3239, -81.6373, -5),
+    "KC": (39.0489, -94.4839, -6), "LAC": (33.9535, -118.3392, -8), "LAR": (33.9535, -118.3392, -8),
+    "LV": (36.0909, -115.1833, -8), "MIA": (25.9580, -80.2389, -5), "MIN": (44.9736, -93.2575, -6),
+    "NE": (42.0909, -71.2643, -5), "NO": (29.9511, -90.0812, -6), "NYG": (40.8135, -74.0745, -5),
+    "NYJ": (40.8135, -74.0745, -5), "PHI": (39.9008, -75.1675, -5), "PIT": (40.4468, -80.0158, -5),
+    "SEA": (47.5952, -122.3316, -8), "SF": (37.4030, -121.9700, -8), "TB": (27.9759, -82.5033, -5),
+    "TEN": (36.1665, -86.7713, -6), "WAS": (38.9076, -76.8645, -5),
+}
+VENUES: dict[str, tuple[float, float, float]] = {
+    "London": (51.6043, -0.0664, 0),          # Tottenham Hotspur Stadium
+    "Wembley": (51.5560, -0.2796, 0),
+    "Dublin": (53.3607, -6.2511, 0),
+    "Munich": (48.2188, 11.6247, 1),
+    "Frankfurt": (50.0686, 8.6455, 1),
+    "Berlin": (52.5147, 13.2395, 1),
+    "Madrid": (40.4531, -3.6883, 1),
+    "Mexico City": (19.3029, -99.1505, -6),
+    "Sao Paulo": (-23.5453, -46.4742, -3),
+    "Toronto": (43.6414, -79.3894, -5),
+}
+assert tuple(STADIUMS) == TEAM_CODES
+
+SITE_NAMES: tuple[str, ...] = TEAM_CODES + tuple(VENUES)
+_COORDS = np.array(list(STADIUMS.values()) + list(VENUES.values()), dtype=float)
+SITE_UTC: np.ndarray = _COORDS[:, 2].copy()
+EARTH_MILES = 3958.8
+
+
+def _great_circle(lat: np.ndarray, lon: np.ndarray) -> np.ndarray:
+    lat, lon = np.radians(lat), np.radians(lon)
+    dlat = lat[:, None] - lat[None, :]
+    dlon = lon[:, None] - lon[None, :]
+    h = np.sin(dlat / 2) ** 2 + np.cos(lat)[:, None] * np.cos(lat)[None, :] * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_MILES * np.arcsin(np.sqrt(np.clip(h, 0.0, 1.0)))
+
+
+SITE_MILES: np.ndarray = _great_circle(_COORDS[:, 0], _COORDS[:, 1])
+_VENUE_LOOKUP = {k: len(TEAM_CODES) + i for i, k in enumerate(clean_names(pd.Series(list(VENUES), dtype=object)))}
+
+_DAY_KEY = 1_000_000  # (team, day) key = team_code * _DAY_KEY + days since epoch
+_NAT = np.iinfo(np.int64).min
+
+
+def site_codes(values: Iterable) -> np.ndarray:
+    """Site codes (index into SITE_NAMES) for venue names or team names/aliases; ValueError on unknown."""
+    codes, keys = resolve_teams(values)
+    codes = codes.astype(np.int16)
+    unknown = codes < 0
+    if unknown.any():
+        venue = clean_names(pd.Series(keys[unknown], dtype=object)).map(_VENUE_LOOKUP)
+        if venue.isna().any():
+            raise ValueError(f"Unknown game site(s): {sorted(set(keys[unknown][venue.isna().to_numpy()]))}")
+        codes[unknown] = venue.to_numpy(dtype=np.int16)
+    return codes
+
+
+def _days(dates) -> np.ndarray:
+    return pd.to_datetime(pd.Series(dates), errors="coerce").to_numpy("datetime64[D]").astype(np.int64)
+
+
+def _team_pair(games: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    if {"home_code", "away_code"} <= set(games.columns):
+        return games["home_code"].to_numpy(dtype=np.int64), games["away_code"].to_numpy(dtype=np.int64)
+    n = len(games)
+    codes, _ = resolve_teams(pd.concat([games["home"], games["away"]], ignore_index=True))
+    return codes[:n].astype(np.int64), codes[n:].astype(np.int64)
+
+
+def _game_keys(home: np.ndarray, away: np.ndarray, day: np.ndarray) -> np.ndarray:
+    ok = (home >= 0) & (away >= 0) & (day != _NAT)
+    return np.concatenate([home[ok] * _DAY_KEY + day[ok], away[ok] * _DAY_KEY + day[ok]])
+
+
+@dataclass(frozen=True)
+class ScheduleContext:
+    keys: np.ndarray    # sorted distinct team_code * _DAY_KEY + game day
+
+    @classmethod
+    def build(cls, *schedules: pd.DataFrame) -> "ScheduleContext":
+        """From any schedule-like frames with date and home/away (or home_code/away_code)."""
+        parts = [_game_keys(*_team_pair(g), _days(g["date"])) for g in schedules if g is not None and not g.empty]
+        return cls._from_keys(parts)
+
+    @classmethod
+    def _from_keys(cls, parts: list[np.ndarray]) -> "ScheduleContext":
+        keys = np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.int64)
+        return cls(keys[np.r_[True, keys[1:] != keys[:-1]]] if len(keys) else keys)
+
+    @classmethod
+    def from_cache(cls, cache_dir: Path | str, seasons: Iterable[int], *extra: pd.DataFrame) -> "ScheduleContext":
+        """build() over the cached schedules of `seasons` (missing seasons skipped) plus `extra` frames."""
+        frames = []
+        for season in sorted({int(s) for s in seasons}):
+            try:
+                frames.append(load_cached_schedule(cache_dir, season))
+            except FileNotFoundError:
+                continue
+        return cls.build(*frames, *extra)
+
+    def rest_days(self, team: np.ndarray, day: np.ndarray) -> np.ndarray:
+        """Days since each team's latest game strictly before `day` (NaN when none)."""
+        team, day = np.asarray(team, dtype=np.int64), np.asarray(day, dtype=np.int64)
+        ok = (team >= 0) & (day != _NAT)
+        q = np.where(ok, team * _DAY_KEY + day, 0)
+        order = np.argsort(q, kind="stable")       # sorted probes: searchsorted walks the keys in order
+        i = np.empty(len(q), dtype=np.int64)
+        i[order] = np.searchsorted(self.keys, q[order], side="left") - 1
+        prev = self.keys[np.maximum(i, 0)] if len(self.keys) else np.zeros_like(q)
+        same_team = ok & (i >= 0) & (prev // _DAY_KEY == team)
+        return np.where(same_team, (q - prev).astype(float), np.nan)
+
+
+SCHEDULE_COLUMNS = ["home_rest_days", "away_rest_days", "home_travel_mi", "away_travel_mi",
+                    "home_tz_shift", "away_tz_shift"]
+
+
+def schedule_features(games: pd.DataFrame, context: Optional[ScheduleContext] = None) -> pd.DataFrame:
+    """Per-game SCHEDULE_COLUMNS for `games` (rest from `context`, default: the games themselves)."""
+    home, away = _team_pair(games)
+    day = _days(games["date"])
+    if context is None:
+        context = ScheduleContext._from_keys([_game_keys(home, away, day)])
+    site = home.copy()
+    named = np.zeros(len(games), dtype=bool)
+    if "site" in games.columns:
+        named = games["site"].notna().to_numpy() & (games["site"].astype(str).str.strip() != "").to_numpy()
+        if named.any():
+            site[named] = site_codes(games.loc[named, "site"])
+    neutral = (pd.to_numeric(games["neutral"], errors="coerce").fillna(0).to_numpy() != 0
+               if "neutral" in games.columns else np.zeros(len(games), dtype=bool))
+    known = (home >= 0) & (away >= 0) & (named | ~neutral)
+    h, a, s = (np.where(known, x, 0) for x in (home, away, site))
+    out = pd.DataFrame({
+        "home_rest_days": context.rest_days(home, day),
+        "away_rest_days": context.rest_days(away, day),
+        "home_travel_mi": np.where(known, SITE_MILES[h, s], np.nan),
+        "away_travel_mi": np.where(known, SITE_MILES[a, s], np.nan),
+        "home_tz_shift": np.where(known, SITE_UTC[s] - SITE_UTC[h], np.nan),
+        "away_tz_shift": np.where(known, SITE_UTC[s] - SITE_UTC[a], np.nan),
+    }, index=games.index)
+    return out
@@ -0,0 +1,216 @@
+## `src/nfl_model/validation.py`
+
+from __future__ import annotations
+
+import types
+import typing
+from dataclasses import dataclass
+from typing import Optional, Type
+
+import annotated_types as at
+import numpy as np
+import pandas as pd
+from pydantic import BaseModel
+
+from . import profiling
+from .features import season_of
+from .schemas import _american
+from .teams import resolve_teams
+
+# Whole-DataFrame checks derived from the pydantic row schemas in schemas.py.
+#
+# Instantiating a model per row costs ~microseconds each; these run column-at-a-time:
+#
+#   missing    required field has no column
+#   type       value does not coerce to the field's type (int: integral numbers only)
+#   null       null in a non-Optional field
+#   range      outside the Field's ge/gt/le/lt bounds
+#   odds       American odds strictly between -100 and 100
+#   duplicate  repeated schema.unique_keys (teams compared as resolved aliases)
+#   same_team  home == away                      (schemas with home and away)
+#   team_week  a team in two games of one week   (schemas with home, away, week, date)
+#
+# Reports are DataFrames of (row, column, check, value); `row` is the frame's index
+# label, None for column-level problems.
+
+REPORT_COLUMNS = ["row", "column", "check", "value"]
+
+
+class SchemaError(ValueError):
+    def __init__(self, what: str, report: pd.DataFrame, show: int = 10):
+        self.report = report
+        head = report.head(show).to_string(index=False)
+        more = f"\n... {len(report) - show} more" if len(report) > show else ""
+        super().__init__(f"{what}: {len(report)} validation error(s)\n{head}{more}")
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    column: str
+    kind: type              # int | float | str
+    required: bool          # no default: the column must exist
+    nullable: bool
+    bounds: tuple = ()      # annotated_types Ge/Gt/Le/Lt
+    american: bool = False
+
+
+def _base_type(annotation) -> tuple[type, bool]:
+    """(int|float|str, nullable) from a field annotation such as `float | None`."""
+    args = typing.get_args(annotation)
+    if typing.get_origin(annotation) in (typing.Union, types.UnionType):
+        kinds = [a for a in args if a is not type(None)]
+        return kinds[0], len(kinds) < len(args)
+    return annotation, False
+
+
+def column_specs(schema: Type[BaseModel]) -> list[ColumnSpec]:
+    """One ColumnSpec per schema field; a trailing '_' (def_) is dropped from the column name."""
+    specs = []
+    for name, field in schema.model_fields.items():
+        kind, nullable = _base_type(field.annotation)
+        bounds = tuple(m for m in field.metadata if isinstance(m, (at.Ge, at.Gt, at.Le, at.Lt)))
+        american = any(getattr(m, "func", None) is _american for m in field.metadata)
+        specs.append(ColumnSpec(name.rstrip("_"), kind, field.is_required(), nullable, bounds, american))
+    return specs
+
+
+def _errors(df: pd.DataFrame, mask: np.ndarray, column: str, check: str, values) -> pd.DataFrame:
+    """Report rows for `mask`; `values` (Series or array) is only read at the failing rows."""
+    idx = np.flatnonzero(mask)
+    picked = values.iloc[idx] if isinstance(values, pd.Series) else np.asarray(values, dtype=object)[idx]
+    return pd.DataFrame({
+        "row": df.index.to_numpy()[idx],
+        "column": column,
+        "check": check,
+        "value": np.asarray(picked, dtype=object),
+    })
+
+
+def _check_column(df: pd.DataFrame, spec: ColumnSpec) -> list[pd.DataFrame]:
+    col = df[spec.column]
+    null = col.isna().to_numpy()
+    out = []
+    if not spec.nullable and null.any():
+        out.append(_errors(df, null, spec.column, "null", col))
+
+    if spec.kind is str:
+        if isinstance(col.dtype, pd.StringDtype) or pd.api.types.infer_dtype(col, skipna=True) in ("string", "empty"):
+            bad = np.zeros(len(df), dtype=bool)
+        elif col.dtype == object:
+            bad = ~null & ~col.map(lambda v: isinstance(v, str), na_action="ignore").fillna(True).to_numpy(dtype=bool)
+        else:
+            bad = ~null
+        if bad.any():
+            out.append(_errors(df, bad, spec.column, "type", col))
+        return out
+
+    num = pd.to_numeric(col, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    bad = ~null & np.isnan(num)
+    if spec.kind is int:
+        bad |= ~null & ~np.isnan(num) & (num != np.round(num))
+    if bad.any():
+        out.append(_errors(df, bad, spec.column, "type", col))
+
+    ok = ~np.isnan(num) & ~bad
+    if spec.bounds:
+        outside = np.zeros(len(df), dtype=bool)
+        for b in spec.bounds:
+            if isinstance(b, at.Ge):
+                outside |= num < b.ge
+            elif isinstance(b, at.Gt):
+                outside |= num <= b.gt
+            elif isinstance(b, at.Le):
+                outside |= num > b.le
+            else:
+                outside |= num >= b.lt
+        outside &= ok
+        if outside.any():
+            out.append(_errors(df, outside, spec.column, "range", col))
+    if spec.american:
+        invalid = ok & (np.abs(num) < 100)
+        if invalid.any():
+            out.append(_errors(df, invalid, spec.column, "odds", col))
+    return out
+
+
+def _team_codes(*columns: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Integer codes for team columns compared by resolved team (teams.resolve_teams: any
+    alias of one franchise is the same team; unknown names case/space-insensitively),
+    plus the join-key labels; only the distinct raw values are resolved.
+    """
+    codes, uniques = pd.factorize(pd.concat(columns, ignore_index=True), use_na_sentinel=False)
+    _, keys = resolve_teams(pd.Series(uniques, dtype=object))
+    canon, labels = pd.factorize(keys)
+    return canon[codes], np.asarray(labels, dtype=object)
+
+
+def _check_rows(df: pd.DataFrame, schema: Type[BaseModel]) -> list[pd.DataFrame]:
+    out = []
+    n = len(df)
+    fields = {s.column for s in column_specs(schema)}
+    keys = [k for k in getattr(schema, "unique_keys", ()) if k in df.columns]
+    if keys:
+        key_frame = pd.DataFrame({
+            k: df[k].to_numpy() if pd.api.types.is_numeric_dtype(df[k]) else _team_codes(df[k])[0] for k in keys
+        })
+        dup = key_frame.duplicated(keep=False).to_numpy()
+        if dup.any():
+            label = df[keys[0]] if len(keys) == 1 else df[keys].astype(str).agg("|".join, axis=1)
+            out.append(_errors(df, dup, ",".join(keys), "duplicate", label))
+
+    if {"home", "away"} <= fields and {"home", "away"} <= set(df.columns):
+        codes, names = _team_codes(df["home"], df["away"])
+        home, away = codes[:n], codes[n:]
+        same = home == away
+        if same.any():
+            out.append(_errors(df, same, "home,away", "same_team", df["home"]))
+        if {"week", "date"} <= fields and {"week", "date"} <= set(df.columns):
+            # one game per team per (season, week), as a single int64 slot key
+            dates, uniq = pd.factorize(df["date"], use_na_sentinel=False)
+            season = season_of(pd.Series(uniq, dtype=object))[dates]
+            week = pd.to_numeric(df["week"], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+            t = season * 100 + week
+            valid = np.isfinite(t)
+            dup_home = np.zeros(n, dtype=bool)
+            dup_away = np.zeros(n, dtype=bool)
+            if valid.any():
+                tv = t[valid]
+                slot = (tv - tv.min()).astype(np.int64) * len(names)
+                keys = np.concatenate([slot + home[valid], slot + away[valid]])
+                if keys.max() < 64 * len(keys) + (1 << 20):
+                    dup = np.bincount(keys)[keys] > 1
+                else:
+                    dup = pd.Series(keys).duplicated(keep=False).to_numpy()
+                m = int(valid.sum())
+                dup_home[valid], dup_away[valid] = dup[:m], dup[m:]
+            if (dup_home | dup_away).any():
+                out.append(_errors(df, dup_home | dup_away, "week,home,away", "team_week",
+                                   np.where(dup_home, names[home], names[away])))
+    return out
+
+
+@profiling.timed("validate")
+def validate_frame(df: pd.DataFrame, schema: Type[BaseModel]) -> pd.DataFrame:
+    """Row-level error report for `df` against `schema` (empty when valid)."""
+    parts = []
+    for spec in column_specs(schema):
+        if spec.column not in df.columns:
+            if spec.required:
+                parts.append(pd.DataFrame({"row": [None], "column": [spec.column], "check": ["missing"], "value": [None]}))
+            continue
+        parts += _check_column(df, spec)
+    parts += _check_rows(df, schema)
+    profiling.count("rows.validated", len(df))
+    parts = [p for p in parts if len(p)]
+    if not parts:
+        return pd.DataFrame(columns=REPORT_COLUMNS)
+    return pd.concat(parts, ignore_index=True)[REPORT_COLUMNS]
+
+
+def check_frame(df: pd.DataFrame, schema: Type[BaseModel], what: Optional[str] = None) -> pd.DataFrame:
+    """validate_frame, raising SchemaError (a ValueError) on any error; returns `df` unchanged."""
+    report = validate_frame(df, schema)
+    if len(report):
+        raise SchemaError(what or schema.__name__, report)
+    return df